@@ -0,0 +1,116 @@
+# Copyright (c) 2021-2025, Francis Clairicia-Rose-Claire-Josephine
+#
+#
+"""
+Surface caching utilities module
+"""
+
+from __future__ import annotations
+
+__all__ = ["SurfaceCache", "surface_nbytes"]
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, final
+
+from ..system.object import Object
+
+if TYPE_CHECKING:
+    from pygame.surface import Surface
+
+
+def surface_nbytes(surface: Surface) -> int:
+    w, h = surface.get_size()
+    return w * h * surface.get_bytesize()
+
+
+@final
+class SurfaceCache[_K: Hashable](Object):
+    """
+    LRU mapping of surfaces whose evictions are driven by a byte budget rather than an entry count.
+
+    Stored surfaces are shared between all the users of the cache and must be considered as read-only.
+    """
+
+    __slots__ = ("__entries", "__nbytes", "__max_bytes", "__hits", "__misses", "__on_evict")
+
+    def __init__(self, max_bytes: int, *, on_evict: Callable[[_K], None] | None = None) -> None:
+        super().__init__()
+        self.__entries: OrderedDict[_K, tuple[Surface, int]] = OrderedDict()
+        self.__nbytes: int = 0
+        self.__max_bytes: int = max(int(max_bytes), 0)
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__on_evict: Callable[[_K], None] | None = on_evict
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, key: _K) -> bool:
+        return key in self.__entries
+
+    def get(self, key: _K) -> Surface | None:
+        entries = self.__entries
+        try:
+            surface, _ = entries[key]
+        except KeyError:
+            self.__misses += 1
+            return None
+        entries.move_to_end(key)
+        self.__hits += 1
+        return surface
+
+    def put(self, key: _K, surface: Surface) -> Surface:
+        self.discard(key)
+        nbytes = surface_nbytes(surface)
+        max_bytes = self.__max_bytes
+        if nbytes > max_bytes:
+            return surface
+        self.__evict(max_bytes - nbytes)
+        self.__entries[key] = (surface, nbytes)
+        self.__nbytes += nbytes
+        return surface
+
+    def discard(self, key: _K) -> None:
+        try:
+            _, nbytes = self.__entries.pop(key)
+        except KeyError:
+            return
+        self.__nbytes -= nbytes
+
+    def clear(self) -> None:
+        self.__entries.clear()
+        self.__nbytes = 0
+
+    def __evict(self, max_bytes: int) -> None:
+        entries = self.__entries
+        on_evict = self.__on_evict
+        while entries and self.__nbytes > max_bytes:
+            key, (_, evicted_nbytes) = entries.popitem(last=False)
+            self.__nbytes -= evicted_nbytes
+            if on_evict is not None:
+                on_evict(key)
+
+    def reset_stats(self) -> None:
+        self.__hits = self.__misses = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self.__nbytes
+
+    @property
+    def max_bytes(self) -> int:
+        return self.__max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        self.__max_bytes = max_bytes = max(int(value), 0)
+        self.__evict(max_bytes)
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
@@ -581,3 +581,216 @@ def genericFxyGradient(surf, clip, color1, color2, func, intx, yint, zint=None):
                         max(min(a[3]*val+f[3],255),0) )
             surff.set_at( (j,i), color )
     surf.blit(surff, clip)
+
+
+#------------------------------------------------------------------------------
+# NumPy implementations
+#
+# The functions above are kept as the fallback when NumPy is not installed.
+# The ones below compute a "level" (ring or square index) for every pixel at once
+# and use it to index a color lookup table, so the user functions are still evaluated
+# once per level, but there is no more set_at() or draw call per level.
+
+try:
+    import numpy
+    import pygame.surfarray
+except ImportError:
+    numpy = None
+
+
+# pygame.draw.circle() covers a pixel slightly more tightly than ceil(distance).
+_RADIAL_LEVEL_BIAS = 0.2
+
+
+def _fill_color(color):
+    color = tuple(color)
+    if len(color) != 4:
+        color = (*color, 255)
+    return color
+
+
+def _numpy_linear_lut(length, startcolor, endcolor):
+    start = numpy.array(_fill_color(startcolor), dtype=numpy.float64)
+    end = numpy.array(_fill_color(endcolor), dtype=numpy.float64)
+    steps = numpy.arange(length, dtype=numpy.float64)[:, None]
+    return (start + ((end - start) * (1.0 / length)) * steps).astype(numpy.uint8)
+
+
+def _numpy_func_lut(levels, color):
+    return numpy.array([color.eval(x) for x in levels], dtype=numpy.uint8).reshape(-1, 4)
+
+
+def _numpy_linear_levels(length):
+    return numpy.arange(length, dtype=numpy.intp)
+
+
+def _numpy_rgba_surface(size, lut, levels):
+    # 'lut' is an array of RGBA colors, indexed by 'levels' which must be broadcastable to (width, height)
+    surface = pygame.Surface(size).convert_alpha()
+    lut = lut.astype(numpy.uint32)
+    mapped_lut = numpy.zeros(lut.shape[0], dtype=numpy.uint32)
+    for channel, shift, loss in zip(range(4), surface.get_shifts(), surface.get_losses()):
+        mapped_lut |= (lut[:, channel] >> loss) << shift
+    pixels = pygame.surfarray.pixels2d(surface)
+    pixels[...] = mapped_lut[levels]
+    del pixels
+    return surface
+
+
+def _numpy_radial_levels(size, center, max_level):
+    # Index of the smallest circle drawn by pygame.draw.circle() which covers each pixel, 0 if there is none.
+    cx, cy = center
+    dx = numpy.arange(size, dtype=numpy.float32) + numpy.float32(0.5 - cx)
+    dy = numpy.arange(size, dtype=numpy.float32) + numpy.float32(0.5 - cy)
+    distance = numpy.sqrt(dx[:, None] ** 2 + dy[None, :] ** 2)
+    distance += _RADIAL_LEVEL_BIAS
+    levels = numpy.ceil(distance, out=distance).astype(numpy.intp)
+    numpy.clip(levels, 1, max_level, out=levels)
+    # The outline must match exactly: it is where the alpha channel changes.
+    outline = pygame.Surface((size, size), 0, 8)
+    pygame.draw.circle(outline, 1, center, max_level)
+    levels[pygame.surfarray.pixels2d(outline) == 0] = 0
+    return levels
+
+
+def _numpy_squared_levels(size, max_level, rect_at):
+    # Index of the smallest rectangle drawn by pygame.draw.rect() which covers each pixel, 0 if there is none.
+    # The coverage is separable, so the rectangles only need to be computed on each axis.
+    xlevels = numpy.zeros(size, dtype=numpy.intp)
+    ylevels = numpy.zeros(size, dtype=numpy.intp)
+    for level in range(max_level, 0, -1):
+        rect = rect_at(level)
+        xlevels[max(rect.left, 0):max(rect.right, 0)] = level
+        ylevels[max(rect.top, 0):max(rect.bottom, 0)] = level
+    xlevels = xlevels[:, None]
+    ylevels = ylevels[None, :]
+    return numpy.where((xlevels > 0) & (ylevels > 0), numpy.maximum(xlevels, ylevels), 0)
+
+
+def _numpy_vertical(size, startcolor, endcolor):
+    height = size[1]
+    lut = _numpy_linear_lut(height, startcolor, endcolor)
+    return pygame.transform.scale(_numpy_rgba_surface((1, height), lut, _numpy_linear_levels(height)[None, :]), size)
+
+
+def _numpy_horizontal(size, startcolor, endcolor):
+    width = size[0]
+    lut = _numpy_linear_lut(width, startcolor, endcolor)
+    return pygame.transform.scale(_numpy_rgba_surface((width, 1), lut, _numpy_linear_levels(width)[:, None]), size)
+
+
+def _numpy_radial(radius, startcolor, endcolor):
+    start = numpy.array(_fill_color(startcolor), dtype=numpy.float64)
+    end = numpy.array(_fill_color(endcolor), dtype=numpy.float64)
+    rm = (start - end) * (-1.0 / radius)
+    lut = start + numpy.trunc(rm * numpy.arange(radius + 1, dtype=numpy.float64)[:, None])
+    lut[0] = 0
+    levels = _numpy_radial_levels(2 * radius, (radius, radius), radius)
+    return _numpy_rgba_surface((2 * radius, 2 * radius), lut, levels)
+
+
+def _numpy_squared(width, startcolor, endcolor):
+    start = numpy.array(_fill_color(startcolor), dtype=numpy.float64)
+    end = numpy.array(_fill_color(endcolor), dtype=numpy.float64)
+    max_level = round(width / 2)
+    rm = (start - end) * (-1.0 / (width / 2))
+    lut = start + numpy.trunc(rm * numpy.arange(max_level + 1, dtype=numpy.float64)[:, None])
+    lut[0] = 0
+
+    def rect_at(level):
+        pos = (width / 2) - level
+        return pygame.Rect(pos, pos, 2 * level, 2 * level)
+
+    levels = _numpy_squared_levels(width, max_level, rect_at)
+    return _numpy_rgba_surface((width, width), lut, levels)
+
+
+def _numpy_vertical_func(size, startcolor, endcolor, Rfunc = (lambda x:x), Gfunc = (lambda x:x), Bfunc = (lambda x:x), Afunc = (lambda x:1)):
+    height = size[1]
+    color = ColorInterpolator(height, startcolor, endcolor, Rfunc, Gfunc, Bfunc, Afunc)
+    lut = _numpy_func_lut([y + 0.1 for y in range(height)], color)
+    return pygame.transform.scale(_numpy_rgba_surface((1, height), lut, _numpy_linear_levels(height)[None, :]), size)
+
+
+def _numpy_horizontal_func(size, startcolor, endcolor, Rfunc = (lambda x:x), Gfunc = (lambda x:x), Bfunc = (lambda x:x), Afunc = (lambda x:1)):
+    width = size[0]
+    color = ColorInterpolator(width, startcolor, endcolor, Rfunc, Gfunc, Bfunc, Afunc)
+    lut = _numpy_func_lut([x + 0.1 for x in range(width)], color)
+    return pygame.transform.scale(_numpy_rgba_surface((width, 1), lut, _numpy_linear_levels(width)[:, None]), size)
+
+
+def _numpy_radial_func(radius, startcolor, endcolor, Rfunc = (lambda x:x), Gfunc = (lambda x:x), Bfunc = (lambda x:x), Afunc = (lambda x:1), colorkey=(0,0,0,0)):
+    if len(colorkey)==3:
+        colorkey += (0,)
+    color = ColorInterpolator(radius, startcolor, endcolor, Rfunc, Gfunc, Bfunc, Afunc)
+    lut = _numpy_func_lut(range(radius + 1), color)
+    lut[0] = colorkey
+    levels = _numpy_radial_levels(2 * radius, (radius, radius), radius)
+    return _numpy_rgba_surface((2 * radius, 2 * radius), lut, levels)
+
+
+def _numpy_radial_func_offset(radius, startcolor, endcolor, Rfunc = (lambda x:x), Gfunc = (lambda x:x), Bfunc = (lambda x:x), Afunc = (lambda x:1), colorkey=(0,0,0,0), offset=(0,0)):
+    bigSurf = pygame.Surface((2*radius, 2*radius))
+
+    mask = pygame.Surface((2*radius, 2*radius), pygame.SRCALPHA)
+    mask.fill(colorkey)
+    mask.set_colorkey((255,0,255))
+    pygame.draw.circle(mask, (255,0,255), (radius, radius), radius)
+
+    if len(colorkey)==3:
+        colorkey += (0,)
+
+    color = ColorInterpolator(radius, startcolor, endcolor, Rfunc, Gfunc, Bfunc, Afunc)
+    radi = radius + int(math.hypot(offset[0], offset[1])+1)
+    lut = _numpy_func_lut(range(radi + 1), color)
+    lut[0] = colorkey
+    levels = _numpy_radial_levels(2 * radius, (radius+offset[0], radius+offset[1]), radi)
+    pygame.surfarray.blit_array(bigSurf, lut[levels][..., :3])
+
+    bigSurf.blit(mask, (0,0))
+    bigSurf.set_colorkey(colorkey)
+    return bigSurf
+
+
+def _numpy_squared_func(width, startcolor, endcolor, Rfunc = (lambda x:x), Gfunc = (lambda x:x), Bfunc = (lambda x:x), Afunc = (lambda x:1), offset=(0,0)):
+    color = ColorInterpolator(width/2, startcolor, endcolor, Rfunc, Gfunc, Bfunc, Afunc)
+    widthh = width+2*int(max(abs(offset[0]),abs(offset[1])))
+    max_level = round(widthh/2)
+    lut = _numpy_func_lut(range(max_level + 1), color)
+    lut[0] = 0
+    center = (width/2+offset[0], width/2+offset[1])
+
+    def rect_at(level):
+        rect = pygame.Rect(0, 0, 2*level, 2*level)
+        rect.center = center
+        return rect
+
+    levels = _numpy_squared_levels(width, max_level, rect_at)
+    return _numpy_rgba_surface((width, width), lut, levels)
+
+
+_python_implementations = {
+    func.__name__: func
+    for func in (
+        vertical,
+        horizontal,
+        radial,
+        squared,
+        vertical_func,
+        horizontal_func,
+        radial_func,
+        radial_func_offset,
+        squared_func,
+    )
+}
+
+if numpy is not None:
+    vertical = _numpy_vertical
+    horizontal = _numpy_horizontal
+    radial = _numpy_radial
+    squared = _numpy_squared
+    vertical_func = _numpy_vertical_func
+    horizontal_func = _numpy_horizontal_func
+    radial_func = _numpy_radial_func
+    radial_func_offset = _numpy_radial_func_offset
+    squared_func = _numpy_squared_func
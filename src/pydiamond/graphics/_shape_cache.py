@@ -0,0 +1,109 @@
+# Copyright (c) 2021-2025, Francis Clairicia-Rose-Claire-Josephine
+#
+#
+"""
+Shared shape surfaces caching module
+"""
+
+from __future__ import annotations
+
+__all__ = ["ShapeCache", "shape_cache"]
+
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Final, final
+
+from ..system.object import Object
+from ._cache import SurfaceCache
+
+if TYPE_CHECKING:
+    from pygame.surface import Surface
+
+
+@final
+class ShapeCache(Object):
+    """
+    Process-wide flyweight store of rendered shape surfaces, shared by all the equal shapes.
+
+    Entries are keyed on the full shape parameters (see AbstractShape._get_cache_key()) and are reference-counted:
+    a surface stays alive as long as one shape uses it, then goes into a LRU pool bounded by max_bytes.
+    The returned surfaces are shared and must not be modified in place.
+    """
+
+    __slots__ = ("__used", "__unused", "__hits", "__misses")
+
+    DEFAULT_MAX_BYTES: Final[int] = 16 * 1024 * 1024
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        super().__init__()
+        self.__used: dict[Hashable, tuple[Surface, int]] = {}
+        self.__unused: SurfaceCache[Hashable] = SurfaceCache(max_bytes)
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self.__used) + len(self.__unused)
+
+    def acquire(self, key: Hashable, render: Callable[[], Surface]) -> Surface:
+        used = self.__used
+        try:
+            surface, refcount = used[key]
+        except KeyError:
+            surface = self.__unused.get(key)
+            if surface is None:
+                self.__misses += 1
+                surface = render()
+            else:
+                self.__hits += 1
+                self.__unused.discard(key)
+            refcount = 0
+        else:
+            self.__hits += 1
+        used[key] = (surface, refcount + 1)
+        return surface
+
+    def release(self, key: Hashable) -> None:
+        used = self.__used
+        try:
+            surface, refcount = used[key]
+        except KeyError:
+            return
+        if refcount > 1:
+            used[key] = (surface, refcount - 1)
+            return
+        del used[key]
+        self.__unused.put(key, surface)
+
+    def get_refcount(self, key: Hashable) -> int:
+        try:
+            return self.__used[key][1]
+        except KeyError:
+            return 0
+
+    def clear(self) -> None:
+        self.__unused.clear()
+
+    def reset_stats(self) -> None:
+        self.__hits = self.__misses = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self.__unused.max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        self.__unused.max_bytes = value
+
+    @property
+    def nbytes(self) -> int:
+        return self.__unused.nbytes
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+
+shape_cache: Final[ShapeCache] = ShapeCache()
@@ -0,0 +1,105 @@
+# Copyright (c) 2021-2025, Francis Clairicia-Rose-Claire-Josephine
+#
+#
+"""
+Rendered text caching module
+"""
+
+from __future__ import annotations
+
+__all__ = ["TextCache", "text_cache"]
+
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Final, final
+
+from ..system.object import Object
+from ._cache import SurfaceCache
+from .color import Color
+from .font import STYLE_DEFAULT
+
+if TYPE_CHECKING:
+    from pygame._common import ColorValue
+    from pygame.surface import Surface
+
+    from .font import Font
+
+
+@final
+class TextCache(Object):
+    """
+    Process-wide cache of rendered text surfaces, shared by Text, TextImage and the renderers' draw_text().
+
+    Entries are keyed on the font state (see Font.get_cache_key()), the colors and the text itself.
+    The returned surfaces are shared and must not be modified in place.
+    """
+
+    __slots__ = ("__cache",)
+
+    DEFAULT_MAX_BYTES: Final[int] = 16 * 1024 * 1024
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        super().__init__()
+        self.__cache: SurfaceCache[Hashable] = SurfaceCache(max_bytes)
+
+    def render(
+        self,
+        font: Font,
+        text: str,
+        fgcolor: ColorValue,
+        bgcolor: ColorValue | None = None,
+        style: int = STYLE_DEFAULT,
+        rotation: int = 0,
+        size: float = 0,
+    ) -> Surface:
+        key = (
+            "render",
+            font.get_cache_key(),
+            text,
+            tuple(Color(fgcolor)),
+            tuple(Color(bgcolor)) if bgcolor is not None else None,
+            style,
+            rotation % 360,
+            size,
+        )
+        return self.get_or_render(
+            key,
+            lambda: font.render(text, fgcolor, bgcolor=bgcolor, style=style, rotation=rotation, size=size)[0],
+        )
+
+    def get_or_render(self, key: Hashable, render: Callable[[], Surface]) -> Surface:
+        cache = self.__cache
+        if cache.max_bytes <= 0:
+            return render()
+        surface = cache.get(key)
+        if surface is None:
+            surface = cache.put(key, render())
+        return surface
+
+    def clear(self) -> None:
+        self.__cache.clear()
+
+    def reset_stats(self) -> None:
+        self.__cache.reset_stats()
+
+    @property
+    def max_bytes(self) -> int:
+        return self.__cache.max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        self.__cache.max_bytes = value
+
+    @property
+    def nbytes(self) -> int:
+        return self.__cache.nbytes
+
+    @property
+    def hits(self) -> int:
+        return self.__cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self.__cache.misses
+
+
+text_cache: Final[TextCache] = TextCache()
@@ -7,27 +7,222 @@ Low-level image transformation functions module
 
 from __future__ import annotations
 
-__all__ = ["rotozoom2", "scale_by"]
+__all__ = ["TransformCache", "rotozoom", "rotozoom2", "scale_by", "transform_cache"]
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final, final
+from weakref import ref as weakref
 
 from pygame.transform import rotozoom as _rotozoom, scale_by as _scale, smoothscale_by as _smoothscale
 
+from ..system.object import Object
+from ._cache import SurfaceCache
+
 if TYPE_CHECKING:
     from pygame.surface import Surface
 
 
+type _TransformKey = tuple[int, float, float, float, bool]
+type _CopyKey = tuple[int, tuple[int, int], tuple[int, int], bool]
+
+
+@final
+class TransformCache(Object):
+    """
+    Process-wide cache of rotated and scaled surfaces, shared by all the Transformable objects.
+
+    Entries are keyed on the source surface identity and on the quantised angle and scale.
+    The source surfaces must not be modified in place, unless invalidate() is called right after.
+
+    shared_copy() gives the same private copy of a source to all the objects built from it (e.g. Sprite frames),
+    so that their transformations are computed once.
+    """
+
+    __slots__ = ("__cache", "__sources", "__copies", "__angle_step", "__scale_step")
+
+    DEFAULT_MAX_BYTES: Final[int] = 64 * 1024 * 1024
+    DEFAULT_ANGLE_STEP: Final[float] = 0.1
+    DEFAULT_SCALE_STEP: Final[float] = 0.001
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        *,
+        angle_step: float = DEFAULT_ANGLE_STEP,
+        scale_step: float = DEFAULT_SCALE_STEP,
+    ) -> None:
+        super().__init__()
+        self.__cache: SurfaceCache[_TransformKey] = SurfaceCache(max_bytes, on_evict=self.__on_evict)
+        self.__sources: dict[int, tuple[weakref[Surface], set[_TransformKey]]] = {}
+        self.__copies: dict[_CopyKey, tuple[weakref[Surface], weakref[Surface]]] = {}
+        self.__angle_step: float = max(float(angle_step), 0)
+        self.__scale_step: float = max(float(scale_step), 0)
+
+    def rotozoom(self, surface: Surface, angle: float, scale: tuple[float, float], *, smooth: bool = False) -> Surface:
+        angle = _quantize(angle % 360, self.__angle_step) % 360
+        scale_step = self.__scale_step
+        scale_x, scale_y = _quantize(scale[0], scale_step), _quantize(scale[1], scale_step)
+        if self.__cache.max_bytes <= 0:
+            return _rotozoom2_impl(surface, angle, scale_x, scale_y, smooth)
+        key: _TransformKey = (id(surface), angle, scale_x, scale_y, smooth)
+        transformed_surface = self.__cache.get(key)
+        if transformed_surface is not None and self.__sources[key[0]][0]() is surface:
+            return transformed_surface
+        transformed_surface = _rotozoom2_impl(surface, angle, scale_x, scale_y, smooth)
+        self.__put(key, surface, transformed_surface)
+        return transformed_surface
+
+    def shared_copy(self, surface: Surface, *, convert_alpha: bool = False) -> Surface:
+        # Subsurfaces are identified by their root surface and their area, so that
+        # each call to Surface.subsurface() on a spritesheet gives back the same copy.
+        root: Surface = surface.get_abs_parent()
+        key: _CopyKey = (id(root), surface.get_abs_offset(), surface.get_size(), convert_alpha)
+        copies = self.__copies
+        try:
+            root_ref, copy_ref = copies[key]
+        except KeyError:
+            pass
+        else:
+            if root_ref() is root and (copy := copy_ref()) is not None:
+                return copy
+        copy = surface.convert_alpha() if convert_alpha else surface.copy()
+
+        def unregister(ref: weakref[Surface]) -> None:
+            entry = copies.get(key)
+            if entry is not None and ref in entry:
+                del copies[key]
+
+        copies[key] = (weakref(root, unregister), weakref(copy, unregister))
+        return copy
+
+    def invalidate(self, surface: Surface) -> None:
+        root_id = id(surface.get_abs_parent())
+        copies = self.__copies
+        for key in [key for key in copies if key[0] == root_id]:
+            del copies[key]
+        try:
+            _, keys = self.__sources.pop(id(surface))
+        except KeyError:
+            return
+        discard = self.__cache.discard
+        for key in keys:
+            discard(key)
+
+    def clear(self) -> None:
+        self.__cache.clear()
+        self.__sources.clear()
+        self.__copies.clear()
+
+    def reset_stats(self) -> None:
+        self.__cache.reset_stats()
+
+    def __put(self, key: _TransformKey, surface: Surface, transformed_surface: Surface) -> None:
+        cache = self.__cache
+        cache.put(key, transformed_surface)
+        if key not in cache:  # Too big
+            return
+        source_id = key[0]
+        sources = self.__sources
+        source_ref: weakref[Surface] | None
+        keys: set[_TransformKey]
+        try:
+            source_ref, keys = sources[source_id]
+        except KeyError:
+            source_ref = None
+        if source_ref is None or source_ref() is not surface:
+
+            def unregister(ref: weakref[Surface]) -> None:
+                try:
+                    registered_ref, keys = sources[source_id]
+                except KeyError:
+                    return
+                if registered_ref is not ref:
+                    return
+                del sources[source_id]
+                for key in keys:
+                    cache.discard(key)
+
+            sources[source_id] = (weakref(surface, unregister), (keys := set()))
+        keys.add(key)
+
+    def __on_evict(self, key: _TransformKey) -> None:
+        source_id = key[0]
+        try:
+            _, keys = self.__sources[source_id]
+        except KeyError:
+            return
+        keys.discard(key)
+        if not keys:
+            del self.__sources[source_id]
+
+    @property
+    def max_bytes(self) -> int:
+        return self.__cache.max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        self.__cache.max_bytes = value
+
+    @property
+    def angle_step(self) -> float:
+        return self.__angle_step
+
+    @angle_step.setter
+    def angle_step(self, value: float) -> None:
+        self.__angle_step = max(float(value), 0)
+        self.clear()
+
+    @property
+    def scale_step(self) -> float:
+        return self.__scale_step
+
+    @scale_step.setter
+    def scale_step(self, value: float) -> None:
+        self.__scale_step = max(float(value), 0)
+        self.clear()
+
+    @property
+    def nbytes(self) -> int:
+        return self.__cache.nbytes
+
+    @property
+    def hits(self) -> int:
+        return self.__cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self.__cache.misses
+
+
+transform_cache: Final[TransformCache] = TransformCache()
+
+
+def _quantize(value: float, step: float) -> float:
+    if step <= 0:
+        return value
+    return round(value / step) * step
+
+
+def _rotozoom2_impl(surface: Surface, angle: float, scale_x: float, scale_y: float, smooth: bool) -> Surface:
+    if scale_x == scale_y:
+        return _rotozoom(surface, angle, scale_x)
+    scale_func = _scale if not smooth else _smoothscale
+    surface = scale_func(surface, (scale_x, scale_y))
+    if angle == 0:
+        return surface
+    return _rotozoom(surface, angle, 1)
+
+
 def scale_by(
     surface: Surface,
     factor: tuple[float, float],
     *,
     smooth: bool = False,
 ) -> Surface:
-    factor_x, factor_y = factor
-    if factor_x == factor_y:
-        return _rotozoom(surface, 0, factor_x)
-    scale = _scale if not smooth else _smoothscale
-    return scale(surface, (factor_x, factor_y))
+    return transform_cache.rotozoom(surface, 0, factor, smooth=smooth)
+
+
+def rotozoom(surface: Surface, angle: float, scale: float) -> Surface:
+    return transform_cache.rotozoom(surface, angle, (scale, scale))
 
 
 def rotozoom2(
@@ -37,9 +232,4 @@ def rotozoom2(
     *,
     smooth: bool = False,
 ) -> Surface:
-    scale_x, scale_y = scale
-    if scale_x == scale_y:
-        return _rotozoom(surface, angle, scale_x)
-    scale_func = _scale if not smooth else _smoothscale
-    surface = scale_func(surface, (scale_x, scale_y))
-    return _rotozoom(surface, angle, 1)
+    return transform_cache.rotozoom(surface, angle, scale, smooth=smooth)
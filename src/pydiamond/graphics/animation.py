@@ -5,7 +5,14 @@
 
 from __future__ import annotations
 
-__all__ = ["AnimationInterpolator", "AnimationInterpolatorPool", "BaseAnimation", "MoveAnimation", "TransformAnimation"]
+__all__ = [
+    "AnimationInterpolator",
+    "AnimationInterpolatorPool",
+    "BaseAnimation",
+    "BatchMoveAnimation",
+    "MoveAnimation",
+    "TransformAnimation",
+]
 
 from abc import ABCMeta, abstractmethod
 from collections.abc import Callable, Iterator
@@ -21,6 +28,11 @@ from ..system.utils.weakref import weakref_unwrap
 from .movable import Movable
 from .transformable import Transformable
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from ..scene import Scene, SceneWindow
 
@@ -33,6 +45,7 @@ class AnimationInterpolator(Object):
         "__previous_state",
         "__state_update",
         "__state_factory",
+        "__transform_epsilon",
         "__weakref__",
     )
 
@@ -52,6 +65,7 @@ class AnimationInterpolator(Object):
         self.__actual_state: _ObjectStateProtocol | None = None
         self.__previous_state: _ObjectStateProtocol | None = None
         self.__state_update: bool = False
+        self.__transform_epsilon: tuple[float, float] = (0, 0)
 
     @contextmanager
     def fixed_update(self) -> Iterator[None]:
@@ -82,11 +96,21 @@ class AnimationInterpolator(Object):
             return
         interpolation = min(max(interpolation, 0), 1)
         obj: Movable | Transformable = weakref_unwrap(self.__obj)
-        previous.interpolate(actual, interpolation, obj)
+        previous.interpolate(actual, interpolation, obj, self.__transform_epsilon)
 
     def reset(self) -> None:
         self.__actual_state = self.__previous_state = None
 
+    def get_transform_epsilon(self) -> tuple[float, float]:
+        return self.__transform_epsilon
+
+    def set_transform_epsilon(self, angle: float = 0, scale: float = 0) -> None:
+        angle = float(angle)
+        scale = float(scale)
+        if angle < 0 or scale < 0:
+            raise ValueError("Negative epsilon")
+        self.__transform_epsilon = (angle, scale)
+
     @property
     def object(self) -> Movable:
         return weakref_unwrap(self.__obj)
@@ -94,11 +118,12 @@ class AnimationInterpolator(Object):
 
 @final
 class AnimationInterpolatorPool(Object):
-    __slots__ = ("__interpolators",)
+    __slots__ = ("__interpolators", "__transform_epsilon")
 
     def __init__(self, *objects: Movable | Transformable) -> None:
         super().__init__()
         self.__interpolators: WeakKeyDictionary[Movable | Transformable, AnimationInterpolator] = WeakKeyDictionary()
+        self.__transform_epsilon: tuple[float, float] | None = None
         self.add(*objects)
 
     @contextmanager
@@ -116,10 +141,31 @@ class AnimationInterpolatorPool(Object):
         for interpolator in self.__interpolators.values():
             interpolator.reset()
 
+    def get_transform_epsilon(self) -> tuple[float, float] | None:
+        return self.__transform_epsilon
+
+    def set_transform_epsilon(self, angle: float = 0, scale: float = 0) -> None:
+        """
+        Set the transform epsilon of the objects in the pool, and of the ones added afterwards.
+
+        There is only one AnimationInterpolator per object, so this also applies to the other pools
+        (and the animations) which interpolate the same objects.
+        """
+        angle = float(angle)
+        scale = float(scale)
+        if angle < 0 or scale < 0:
+            raise ValueError("Negative epsilon")
+        self.__transform_epsilon = (angle, scale)
+        for interpolator in self.__interpolators.values():
+            interpolator.set_transform_epsilon(angle, scale)
+
     def add(self, *objects: Movable | Transformable) -> None:
         if not objects:
             return
-        interpolators = (AnimationInterpolator(obj) for obj in objects)
+        interpolators = [AnimationInterpolator(obj) for obj in objects]
+        if (epsilon := self.__transform_epsilon) is not None:
+            for interpolator in interpolators:
+                interpolator.set_transform_epsilon(*epsilon)
         self.__interpolators.update({interpolator.object: interpolator for interpolator in interpolators})
 
     def remove(self, obj: Movable | Transformable) -> None:
@@ -127,6 +173,279 @@ class AnimationInterpolatorPool(Object):
         del self.__interpolators[obj]
 
 
+@final
+class BatchMoveAnimation(Object):
+    """
+    Moves a large number of objects towards their targets in a single pass.
+
+    Each tween is a row in a struct of arrays (previous position, actual position, target and speed),
+    stepped at once (vectorized with NumPy if available) and written back to the objects in bulk.
+    The interpolation between fixed updates is handled by the batch itself.
+    """
+
+    __slots__ = (
+        "__objects",
+        "__index",
+        "__data",
+        "__pending",
+        "__interpolated",
+        "__on_stop",
+        "__wait",
+    )
+
+    # Fields (rows) of the struct of arrays
+    __PREVIOUS_X: Final[int] = 0
+    __PREVIOUS_Y: Final[int] = 1
+    __X: Final[int] = 2
+    __Y: Final[int] = 3
+    __TARGET_X: Final[int] = 4
+    __TARGET_Y: Final[int] = 5
+    __SPEED: Final[int] = 6
+    __DONE: Final[int] = 7
+    __NB_FIELDS: Final[int] = 8
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__objects: list[Movable] = []
+        self.__index: dict[Movable, int] = {}
+        self.__data: Any = self.__new_data([])
+        self.__pending: dict[Movable, tuple[float, float, float]] = {}
+        self.__interpolated: bool = False
+        self.__on_stop: Callable[[], None] | None = None
+        self.__wait: bool = True
+
+    @overload
+    def smooth_set_position(
+        self,
+        movable: Movable,
+        speed: float = 100,
+        *,
+        x: float = ...,
+        y: float = ...,
+        left: float = ...,
+        right: float = ...,
+        top: float = ...,
+        bottom: float = ...,
+        centerx: float = ...,
+        centery: float = ...,
+    ) -> Self: ...
+
+    @overload
+    def smooth_set_position(
+        self,
+        movable: Movable,
+        speed: float = 100,
+        *,
+        center: tuple[float, float] = ...,
+        topleft: tuple[float, float] = ...,
+        topright: tuple[float, float] = ...,
+        bottomleft: tuple[float, float] = ...,
+        bottomright: tuple[float, float] = ...,
+        midleft: tuple[float, float] = ...,
+        midright: tuple[float, float] = ...,
+        midtop: tuple[float, float] = ...,
+        midbottom: tuple[float, float] = ...,
+    ) -> Self: ...
+
+    def smooth_set_position(self, movable: Movable, speed: float = 100, **position: float | tuple[float, float]) -> Self:
+        assert isinstance(movable, Movable), "Expected a Movable object"
+        assert len(position) > 0, "Please give position parameter"
+        target_x, target_y = movable.get_rect(**position).center
+        self.__pending[movable] = (target_x, target_y, speed)
+        return self
+
+    def smooth_translation(self, movable: Movable, translation: Vector2 | tuple[float, float], speed: float = 100) -> Self:
+        assert isinstance(movable, Movable), "Expected a Movable object"
+        if movable in self.__pending:
+            x, y, _ = self.__pending[movable]
+        elif (index := self.__index.get(movable)) is not None and not self.__data[self.__DONE][index]:
+            x, y = self.__data[self.__TARGET_X][index], self.__data[self.__TARGET_Y][index]
+        else:
+            x, y = movable.center
+        self.__pending[movable] = (x + translation[0], y + translation[1], speed)
+        return self
+
+    def remove(self, movable: Movable) -> None:
+        self.__pending.pop(movable, None)
+        if movable in self.__index:
+            self.__compact([obj is not movable for obj in self.__objects])
+
+    def has_animation_started(self) -> bool:
+        if self.__pending:
+            return True
+        if numpy is not None:
+            return not self.__data[self.__DONE].all()
+        return not all(self.__data[self.__DONE])
+
+    def started(self) -> bool:
+        return not self.__wait and self.has_animation_started()
+
+    def on_stop(self, callback: Callable[[], None] | None) -> None:
+        if not (callback is None or callable(callback)):
+            raise TypeError("Invalid arguments")
+        self.__on_stop = callback
+
+    def start(self) -> None:
+        self.__wait = False
+
+    def pause(self) -> None:
+        self.__wait = True
+
+    def clear(self, *, pause: bool = False) -> None:
+        self.__wait = bool(pause)
+        self.__pending.clear()
+        self.__objects.clear()
+        self.__index.clear()
+        self.__data = self.__new_data([])
+        self.__interpolated = False
+
+    def fixed_update(self) -> None:
+        if not self.started():
+            return
+        if self.__interpolated:
+            # Put back the objects at their actual position before the next step
+            self.__write_back(self.__X, self.__Y)
+            self.__interpolated = False
+        self.__flush()
+        if not self.__objects:
+            return
+        if numpy is not None:
+            self.__step_vectorized(Time.fixed_delta())
+        else:
+            self.__step(Time.fixed_delta())
+        self.__write_back(self.__X, self.__Y)
+        if not self.has_animation_started():
+            self.__compact([False] * len(self.__objects))
+            self.__wait = True
+            if on_stop := self.__on_stop:
+                on_stop()
+                self.__on_stop = None
+
+    def update(self, interpolation: float) -> None:
+        if not self.__objects or not self.started():
+            return
+        interpolation = min(max(interpolation, 0), 1)
+        data = self.__data
+        previous_xs, previous_ys = data[self.__PREVIOUS_X], data[self.__PREVIOUS_Y]
+        actual_xs, actual_ys = data[self.__X], data[self.__Y]
+        xs: list[float]
+        ys: list[float]
+        if numpy is not None:
+            xs = (previous_xs + (actual_xs - previous_xs) * interpolation).tolist()
+            ys = (previous_ys + (actual_ys - previous_ys) * interpolation).tolist()
+        else:
+            xs = [linear_interpolation(x0, x1, interpolation) for x0, x1 in zip(previous_xs, actual_xs)]
+            ys = [linear_interpolation(y0, y1, interpolation) for y0, y1 in zip(previous_ys, actual_ys)]
+        for obj, x, y in zip(self.__objects, xs, ys):
+            obj.center = (x, y)
+        self.__interpolated = True
+
+    def __step_vectorized(self, delta: float) -> None:
+        data = self.__data
+        X, Y, TARGET_X, TARGET_Y = self.__X, self.__Y, self.__TARGET_X, self.__TARGET_Y
+        data[[self.__PREVIOUS_X, self.__PREVIOUS_Y]] = data[[X, Y]]
+        dx = data[TARGET_X] - data[X]
+        dy = data[TARGET_Y] - data[Y]
+        distance = numpy.hypot(dx, dy)
+        travel = data[self.__SPEED] * delta
+        arrived = distance <= travel
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            ratio = numpy.where(arrived, 1.0, travel / distance)
+        data[X] += dx * ratio
+        data[Y] += dy * ratio
+        # Land exactly on the target
+        data[X][arrived] = data[TARGET_X][arrived]
+        data[Y][arrived] = data[TARGET_Y][arrived]
+        data[self.__DONE][arrived] = 1
+
+    def __step(self, delta: float) -> None:
+        data = self.__data
+        data[self.__PREVIOUS_X][:] = data[self.__X]
+        data[self.__PREVIOUS_Y][:] = data[self.__Y]
+        xs: list[float] = data[self.__X]
+        ys: list[float] = data[self.__Y]
+        target_xs: list[float] = data[self.__TARGET_X]
+        target_ys: list[float] = data[self.__TARGET_Y]
+        speeds: list[float] = data[self.__SPEED]
+        done: list[float] = data[self.__DONE]
+        for i in range(len(xs)):
+            if done[i]:
+                continue
+            dx = target_xs[i] - xs[i]
+            dy = target_ys[i] - ys[i]
+            distance = (dx * dx + dy * dy) ** 0.5
+            travel = speeds[i] * delta
+            if distance <= travel:
+                xs[i] = target_xs[i]
+                ys[i] = target_ys[i]
+                done[i] = 1
+            else:
+                ratio = travel / distance
+                xs[i] += dx * ratio
+                ys[i] += dy * ratio
+
+    def __write_back(self, field_x: int, field_y: int) -> None:
+        data = self.__data
+        xs: list[float]
+        ys: list[float]
+        if numpy is not None:
+            xs, ys = data[field_x].tolist(), data[field_y].tolist()
+        else:
+            xs, ys = data[field_x], data[field_y]
+        for obj, x, y in zip(self.__objects, xs, ys):
+            obj.center = (x, y)
+
+    def __flush(self) -> None:
+        done = self.__data[self.__DONE]
+        if numpy is not None:
+            finished = bool(done.any())
+        else:
+            finished = any(done)
+        if finished:
+            self.__compact([not d for d in done])
+        pending = self.__pending
+        if not pending:
+            return
+        self.__pending = {}
+        data = self.__data
+        index = self.__index
+        rows: list[list[float]] = []
+        for obj, (target_x, target_y, speed) in pending.items():
+            if (i := index.get(obj)) is not None:
+                data[self.__TARGET_X][i] = target_x
+                data[self.__TARGET_Y][i] = target_y
+                data[self.__SPEED][i] = speed
+                continue
+            x, y = obj.center
+            index[obj] = len(self.__objects)
+            self.__objects.append(obj)
+            rows.append([x, y, x, y, target_x, target_y, speed, 0])
+        if not rows:
+            return
+        new_data = self.__new_data(rows)
+        if numpy is not None:
+            self.__data = numpy.concatenate((data, new_data), axis=1)
+        else:
+            for column, new_column in zip(data, new_data):
+                column.extend(new_column)
+
+    def __compact(self, keep: list[bool]) -> None:
+        self.__objects = [obj for obj, k in zip(self.__objects, keep) if k]
+        self.__index = {obj: i for i, obj in enumerate(self.__objects)}
+        if numpy is not None:
+            self.__data = self.__data[:, numpy.array(keep, dtype=bool)]
+        else:
+            self.__data = [[v for v, k in zip(column, keep) if k] for column in self.__data]
+
+    @classmethod
+    def __new_data(cls, rows: list[list[float]]) -> Any:
+        if numpy is not None:
+            return numpy.array(rows, dtype=numpy.float64).reshape(len(rows), cls.__NB_FIELDS).T.copy()
+        if not rows:
+            return [[] for _ in range(cls.__NB_FIELDS)]
+        return [list(column) for column in zip(*rows)]
+
+
 class BaseAnimation(Object):
     __slots__ = (
         "__object",
@@ -496,7 +815,7 @@ class _ObjectStateProtocol(Protocol):
         raise NotImplementedError
 
     @abstractmethod
-    def interpolate(self, other: _ObjectStateProtocol, alpha: float, __obj: Any, /) -> None:
+    def interpolate(self, other: _ObjectStateProtocol, alpha: float, __obj: Any, __epsilon: tuple[float, float], /) -> None:
         raise NotImplementedError
 
     @abstractmethod
@@ -512,7 +831,7 @@ class _MoveState(NamedTuple):
     def from_object(m: Movable) -> _MoveState:
         return _MoveState(Vector2(m.center))
 
-    def interpolate(self, other: _MoveState, alpha: float, m: Movable) -> None:
+    def interpolate(self, other: _MoveState, alpha: float, m: Movable, epsilon: tuple[float, float]) -> None:
         center = self.center.lerp(other.center, alpha)
         m.center = (center.x, center.y)
 
@@ -536,14 +855,22 @@ class _TransformState(NamedTuple):
             data = MappingProxyType(state)
         return _TransformState(t.angle, t.scale, Vector2(t.center), data)
 
-    def interpolate(self, other: _TransformState, alpha: float, t: Transformable) -> None:
+    def interpolate(self, other: _TransformState, alpha: float, t: Transformable, epsilon: tuple[float, float]) -> None:
         angle = angle_interpolation(self.angle, other.angle, alpha)
         scale = (
             linear_interpolation(self.scale[0], other.scale[0], alpha),
             linear_interpolation(self.scale[1], other.scale[1], alpha),
         )
         center = self.center.lerp(other.center, alpha)
-        t.set_rotation_and_scale(angle, scale)
+        # Position is always interpolated, but re-rasterising is only worth it past the thresholds
+        angle_epsilon, scale_epsilon = epsilon
+        actual_scale = t.scale
+        if (
+            abs((angle - t.angle + 180) % 360 - 180) > angle_epsilon
+            or abs(scale[0] - actual_scale[0]) > scale_epsilon
+            or abs(scale[1] - actual_scale[1]) > scale_epsilon
+        ):
+            t.set_rotation_and_scale(angle, scale)
         t.center = (center.x, center.y)
 
     def apply_on(self, t: Transformable) -> None:
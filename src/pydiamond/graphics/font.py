@@ -14,7 +14,7 @@ __all__ = [
 
 
 import os
-from collections.abc import Iterable
+from collections.abc import Hashable, Iterable
 from enum import IntFlag, auto, unique
 from typing import TYPE_CHECKING, Any, ClassVar, Final, NamedTuple, final, overload
 
@@ -128,7 +128,7 @@ class FontSizeInfo(NamedTuple):
 
 @final
 class Font(Object):
-    __slots__ = ("__ft", "__weakref__")
+    __slots__ = ("__ft", "__face", "__weakref__")
 
     __default_font = encode_file_path(get_default_font())
 
@@ -194,6 +194,8 @@ class Font(Object):
         self.__ft.antialiased = True
         self.__ft.rotation = 0
         self.__ft.vertical = False
+        # Fonts loaded from a stream cannot be identified by their path, so they never share rendered surfaces.
+        self.__face: Hashable = self.__ft.path if file is None or isinstance(file, (str, bytes, os.PathLike)) else object()
 
         super().__init__()
 
@@ -221,6 +223,21 @@ class Font(Object):
     def scalable(self) -> bool:
         return self.__ft.scalable
 
+    def get_cache_key(self) -> Hashable:
+        font: _pg_freetype.Font = self.__ft
+        return (
+            self.__face,
+            font.resolution,
+            font.size,
+            font.style,
+            font.strength,
+            font.underline_adjustment,
+            font.use_bitmap_strikes,
+            font.antialiased,
+            font.kerning,
+            font.ucs4,
+        )
+
     def get_scale_size(self) -> tuple[float, float]:
         size = self.__ft.size
         if not isinstance(size, tuple):
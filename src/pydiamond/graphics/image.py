@@ -10,10 +10,13 @@ __all__ = ["Image"]
 from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any, assert_never, overload
 
-from pygame.transform import rotozoom as _surface_rotozoom
-
 from ..math.rect import Rect
-from ._transform import rotozoom2 as _surface_rotozoom2, scale_by as _surface_scale_by
+from ._transform import (
+    rotozoom as _surface_rotozoom,
+    rotozoom2 as _surface_rotozoom2,
+    scale_by as _surface_scale_by,
+    transform_cache as _transform_cache,
+)
 from .color import Color
 from .drawable import Drawable
 from .surface import Surface, create_surface, save_image
@@ -37,13 +40,13 @@ class Image(Drawable, Transformable):
 
         self.__default_image: Surface
         self.__image: Surface
+        self.__shared: bool = False
 
         match image:
             case None:
                 image = create_surface((0, 0))
             case Surface():
-                if copy:
-                    image = image.copy()
+                image = self.__get_default_image(image, copy)
             case _:
                 assert_never(image)
 
@@ -77,15 +80,31 @@ class Image(Drawable, Transformable):
         center: tuple[float, float] = self.center
         if image is None:
             self.__default_image = create_surface((0, 0))
+            self.__shared = False
         else:
-            self.__default_image = image.copy() if copy else image
+            self.__default_image = self.__get_default_image(image, copy)
         self.update_transform()
         self.center = center
 
+    def __get_default_image(self, image: Surface, copy: bool) -> Surface:
+        if copy:
+            # Images built from the same source share their copy (and therefore their transformations)
+            # until one of them is modified (see fill())
+            self.__shared = True
+            return _transform_cache.shared_copy(image)
+        # The caller keeps a reference to this surface and may have modified it in place since the last time
+        _transform_cache.invalidate(image)
+        self.__shared = False
+        return image
+
     def fill(self, color: Color, rect: Rect | None = None) -> None:
+        if self.__shared:
+            self.__default_image = self.__default_image.copy()
+            self.__shared = False
         mask = create_surface(self.__default_image.get_size() if rect is None else rect.size)
         mask.fill(color)
         self.__default_image.blit(mask, rect or (0, 0))
+        _transform_cache.invalidate(self.__default_image)
         self.update_transform()
 
     def save(self, filepath: str) -> None:
@@ -11,13 +11,11 @@ from dataclasses import dataclass
 from enum import auto, unique
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, assert_never
 
-from pygame.transform import rotozoom as _surface_rotozoom
-
 from ..math.rect import Rect
 from ..system.configuration import Configuration, ConfigurationTemplate, OptionAttribute, initializer
 from ..system.utils.enum import AutoLowerNameEnum
 from ..system.validation import valid_float, valid_integer, valid_sequence
-from ._transform import rotozoom2 as _surface_rotozoom2, scale_by as _surface_scale_by
+from ._transform import rotozoom as _surface_rotozoom, rotozoom2 as _surface_rotozoom2, scale_by as _surface_scale_by
 from .color import BLACK, GRAY, TRANSPARENT, WHITE, Color
 from .drawable import Drawable
 from .shape import RectangleShape
@@ -16,14 +16,17 @@ __all__ = [
     "PlusCrossShape",
     "PolygonShape",
     "RectangleShape",
+    "ShapeCache",
     "SingleColorShape",
+    "shape_cache",
 ]
 
 from abc import abstractmethod
-from collections.abc import Mapping, Sequence
+from collections.abc import Hashable, Mapping, Sequence
 from math import radians, sin, tan
 from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, ClassVar, final
+from weakref import finalize
 
 from pygame.transform import rotozoom as _surface_rotozoom, smoothscale as _surface_scale
 
@@ -32,6 +35,7 @@ from ..system.configuration import ConfigurationTemplate, OptionAttribute, Unreg
 from ..system.object import Object
 from ..system.utils.abc import concreteclass
 from ..system.validation import valid_float, valid_integer, valid_sequence
+from ._shape_cache import ShapeCache, shape_cache
 from .color import BLACK, Color
 from .drawable import Drawable
 from .renderer import AbstractRenderer
@@ -48,7 +52,9 @@ class AbstractShape(Drawable, Transformable):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.__image: Surface
+        self.__image_key: list[Hashable | None] = [None]
         self.__local_size: tuple[float, float] = (0, 0)
+        finalize(self, _release_shape_image, self.__image_key)
 
     def draw_onto(self, target: AbstractRenderer) -> None:
         target.draw_surface(self.__image, self.topleft)
@@ -61,37 +67,72 @@ class AbstractShape(Drawable, Transformable):
 
     def _apply_both_rotation_and_scale(self) -> None:
         self.__compute_shape_size()
-        self.__image = self._make(apply_rotation=True, apply_scale=True)
+        self.__update_image(apply_rotation=True, apply_scale=True)
 
     def _apply_only_rotation(self) -> None:
         self.__compute_shape_size()
-        self.__image = self._make(apply_rotation=True, apply_scale=False)
+        self.__update_image(apply_rotation=True, apply_scale=False)
 
     def _apply_only_scale(self) -> None:
         self.__compute_shape_size()
-        self.__image = self._make(apply_rotation=False, apply_scale=True)
+        self.__update_image(apply_rotation=False, apply_scale=True)
 
     def _freeze_state(self) -> dict[str, Any] | None:
         state = super()._freeze_state()
         if state is None:
             state = {}
         state["image"] = self.__image
+        state["image_key"] = self.__image_key[0]
         return state
 
     def _set_frozen_state(self, angle: float, scale: tuple[float, float], state: Mapping[str, Any] | None) -> bool:
         res = super()._set_frozen_state(angle, scale, state)
         if state is None:
             return res
-        self.__image = state["image"]
+        image: Surface = state["image"]
+        key: Hashable | None = state.get("image_key")
+        if key is not None:
+            image = shape_cache.acquire(key, lambda: image)
+        self.__set_image(image, key)
         return True
 
     def __compute_shape_size(self) -> None:
         self.__local_size = compute_size_from_vertices(self.get_local_vertices())
 
+    def __update_image(self, *, apply_rotation: bool, apply_scale: bool) -> None:
+        key: Hashable | None = self._get_cache_key()
+        image: Surface
+        if key is None:
+            image = self._make(apply_rotation=apply_rotation, apply_scale=apply_scale)
+        else:
+            key = (
+                type(self),
+                key,
+                self.angle if apply_rotation else 0,
+                self.scale if apply_scale else (1, 1),
+            )
+            image = shape_cache.acquire(key, lambda: self._make(apply_rotation=apply_rotation, apply_scale=apply_scale))
+        self.__set_image(image, key)
+
+    def __set_image(self, image: Surface, key: Hashable | None) -> None:
+        image_key = self.__image_key
+        if (former_key := image_key[0]) is not None:
+            shape_cache.release(former_key)
+        image_key[0] = key
+        self.__image = image
+
     @abstractmethod
     def _make(self, *, apply_rotation: bool, apply_scale: bool) -> Surface:
         raise NotImplementedError
 
+    def _get_cache_key(self) -> Hashable | None:
+        """
+        Return the parameters _make() depends on (apart from rotation and scale), or None to disable the shared cache.
+
+        Two shapes of the same class with equal keys share the same read-only surface.
+        """
+        return None
+
     @abstractmethod
     def get_local_vertices(self) -> Sequence[_FPoint]:
         raise NotImplementedError
@@ -233,6 +274,9 @@ class PolygonShape(OutlinedShape, SingleColorShape):
 
         return _surface_scale(image.get_target().subsurface(rect), (w, h))
 
+    def _get_cache_key(self) -> Hashable | None:
+        return (self.local_vertices, tuple(self.color), self.outline, tuple(self.outline_color))
+
     @final
     def get_local_vertices(self) -> Sequence[_FPoint]:
         vertices: Sequence[_FPoint] = self.config.get("local_vertices")
@@ -472,6 +516,15 @@ class RectangleShape(AbstractRectangleShape, OutlinedShape, SingleColorShape, Ab
             surface = _surface_rotozoom(surface, angle, 1)
         return surface
 
+    def _get_cache_key(self) -> Hashable | None:
+        return (
+            self.local_size,
+            tuple(self.color),
+            self.outline,
+            tuple(self.outline_color),
+            tuple(self.border_params.items()),
+        )
+
 
 class AbstractCircleShape(AbstractShape):
     config: ClassVar[ConfigurationTemplate] = ConfigurationTemplate("radius", parent=AbstractShape.config)
@@ -560,6 +613,15 @@ class CircleShape(AbstractCircleShape, OutlinedShape, SingleColorShape):
             surface = _surface_rotozoom(surface, angle, 1)
         return surface
 
+    def _get_cache_key(self) -> Hashable | None:
+        return (
+            self.radius,
+            tuple(self.color),
+            self.outline,
+            tuple(self.outline_color),
+            tuple(self.__draw_params.items()),
+        )
+
     def get_local_vertices(self) -> Sequence[_FPoint]:
         return self.__points
 
@@ -674,6 +736,9 @@ class _AbstractCrossShape(OutlinedShape, SingleColorShape):
 
         return _surface_scale(image.get_target().subsurface(rect), (w, h))
 
+    def _get_cache_key(self) -> Hashable | None:
+        return (self.local_size, self.line_width_percent, tuple(self.color), self.outline, tuple(self.outline_color))
+
     def get_local_size(self) -> tuple[float, float]:
         return self.local_size
 
@@ -782,3 +847,9 @@ class PlusCrossShape(_AbstractCrossShape):
             Vector2(rect.left, rect.centery - line_width),
             Vector2(rect.centerx - line_width, rect.centery - line_width),
         )
+
+
+def _release_shape_image(image_key: list[Hashable | None]) -> None:
+    if (key := image_key[0]) is not None:
+        image_key[0] = None
+        shape_cache.release(key)
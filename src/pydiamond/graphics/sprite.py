@@ -5,22 +5,27 @@
 
 from __future__ import annotations
 
-__all__ = ["LayeredSpriteGroup", "Mask", "Sprite", "SpriteGroup"]
+__all__ = ["LayeredSpriteGroup", "Mask", "MaskCache", "Sprite", "SpriteGroup", "mask_cache"]
 
 from collections import deque
-from collections.abc import Iterable, Iterator, Mapping
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from functools import cached_property
 from itertools import combinations
-from typing import TYPE_CHECKING, Any, Final, Self, final, overload
+from typing import TYPE_CHECKING, Any, Final, Self, SupportsIndex, final, overload
+from weakref import WeakKeyDictionary
 
 from pygame.mask import Mask, from_surface as _pg_mask_from_surface
-from pygame.transform import rotozoom as _surface_rotozoom
 
 from ..math.rect import Rect
 from ..system.clock import Clock
 from ..system.object import Object
 from ..system.utils.itertools import prepend
-from ._transform import rotozoom2 as _surface_rotozoom2, scale_by as _surface_scale_by
+from ._transform import (
+    rotozoom as _surface_rotozoom,
+    rotozoom2 as _surface_rotozoom2,
+    scale_by as _surface_scale_by,
+    transform_cache as _transform_cache,
+)
 from .animation import TransformAnimation
 from .drawable import Drawable, DrawableGroup, LayeredDrawableGroup
 from .renderer import AbstractRenderer, BlendMode
@@ -28,6 +33,69 @@ from .surface import Surface
 from .transformable import Transformable
 
 
+@final
+class MaskCache(Object):
+    """
+    Process-wide cache of the sprites' collision masks.
+
+    Entries are keyed on the image surface identity and on the threshold, so sprites displaying the same
+    transformed frame (see TransformCache) share the same mask. The returned masks must not be modified in place.
+    """
+
+    __slots__ = ("__cache", "__enabled", "__hits", "__misses")
+
+    def __init__(self, *, enabled: bool = True) -> None:
+        super().__init__()
+        self.__cache: WeakKeyDictionary[Surface, dict[int, Mask]] = WeakKeyDictionary()
+        self.__enabled: bool = bool(enabled)
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    def get(self, surface: Surface, threshold: int) -> Mask:
+        if not self.__enabled:
+            return _pg_mask_from_surface(surface, threshold)
+        masks: dict[int, Mask] | None = self.__cache.get(surface)
+        if masks is None:
+            self.__cache[surface] = masks = {}
+        mask: Mask | None = masks.get(threshold)
+        if mask is None:
+            self.__misses += 1
+            masks[threshold] = mask = _pg_mask_from_surface(surface, threshold)
+        else:
+            self.__hits += 1
+        return mask
+
+    def invalidate(self, surface: Surface) -> None:
+        self.__cache.pop(surface, None)
+
+    def clear(self) -> None:
+        self.__cache.clear()
+
+    def reset_stats(self) -> None:
+        self.__hits = self.__misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.__enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self.__enabled = bool(value)
+        if not self.__enabled:
+            self.clear()
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+
+mask_cache: Final[MaskCache] = MaskCache()
+
+
 @final
 class _SpriteTransformAnimation(cached_property[TransformAnimation], Object):
     def __init__(self) -> None:
@@ -65,6 +133,7 @@ class Sprite(Drawable, Transformable):
         "__mask",
         "__smooth_scale",
         "__blend_mode",
+        "__spatial_indexes",
     )
 
     transform_animation: Final[_SpriteTransformAnimation] = final(_SpriteTransformAnimation())
@@ -79,7 +148,8 @@ class Sprite(Drawable, Transformable):
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
-        self.__list: list[Surface] = [i.convert_alpha() for i in prepend(image, images)]
+        # Sprites built from the same sources share their frames, thus their transformations and masks
+        self.__list: list[Surface] = [_transform_cache.shared_copy(i, convert_alpha=True) for i in prepend(image, images)]
         self.__sprite_idx: int = 0
         self.__clock = Clock()
         self.__wait_time: float = 10
@@ -87,8 +157,9 @@ class Sprite(Drawable, Transformable):
         self.__loop: bool = False
         self.__image: Surface = self.__list[0].copy()
         self.__mask_threshold: int
-        self.__mask: Mask
+        self.__mask: Mask | None = None
         self.__blend_mode: BlendMode = BlendMode.NONE
+        self.__spatial_indexes: set[_SpriteSpatialHash[Any]] = set()
         self.set_mask_threshold(mask_threshold)
 
         if width is not None and height is not None:
@@ -180,15 +251,32 @@ class Sprite(Drawable, Transformable):
 
     def _apply_both_rotation_and_scale(self) -> None:
         self.__image = _surface_rotozoom2(self.__list[self.__sprite_idx], self.angle, self.scale)
-        self.update_mask()
+        self.__mask = None
+        self.__invalidate_spatial_indexes()
 
     def _apply_only_rotation(self) -> None:
         self.__image = _surface_rotozoom(self.__list[self.__sprite_idx], self.angle, 1)
-        self.update_mask()
+        self.__mask = None
+        self.__invalidate_spatial_indexes()
 
     def _apply_only_scale(self) -> None:
         self.__image = _surface_scale_by(self.__list[self.__sprite_idx], self.scale)
-        self.update_mask()
+        self.__mask = None
+        self.__invalidate_spatial_indexes()
+
+    def _on_move(self) -> None:
+        super()._on_move()
+        self.__invalidate_spatial_indexes()
+
+    def _register_spatial_index(self, index: _SpriteSpatialHash[Any]) -> None:
+        self.__spatial_indexes.add(index)
+
+    def _unregister_spatial_index(self, index: _SpriteSpatialHash[Any]) -> None:
+        self.__spatial_indexes.discard(index)
+
+    def __invalidate_spatial_indexes(self) -> None:
+        for index in self.__spatial_indexes:
+            index.invalidate(self)
 
     def _freeze_state(self) -> dict[str, Any] | None:
         state = super()._freeze_state()
@@ -204,10 +292,18 @@ class Sprite(Drawable, Transformable):
             return res
         self.__image = state["image"]
         self.__mask = state["mask"]
+        self.__invalidate_spatial_indexes()
         return True
 
     def update_mask(self) -> None:
-        self.__mask = _pg_mask_from_surface(self.__image, self.__mask_threshold)
+        mask_cache.invalidate(self.__image)
+        self.__mask = mask_cache.get(self.__image, self.__mask_threshold)
+
+    def __get_mask(self) -> Mask:
+        mask = self.__mask
+        if mask is None:
+            self.__mask = mask = mask_cache.get(self.__image, self.__mask_threshold)
+        return mask
 
     def get_size(self) -> tuple[float, float]:
         return self.__image.get_size()
@@ -217,7 +313,7 @@ class Sprite(Drawable, Transformable):
 
     def set_mask_threshold(self, threshold: int) -> None:
         self.__mask_threshold = min(max(int(threshold), 0), 255)
-        self.update_mask()
+        self.__mask = None
 
     def is_colliding(self, other: Sprite) -> bool:
         return self is other or self.is_mask_colliding(other, relative=True) is not None
@@ -230,7 +326,7 @@ class Sprite(Drawable, Transformable):
         other_rect: Rect = other.get_rect()
         xoffset: int = other_rect.x - this_rect.x
         yoffset: int = other_rect.y - this_rect.y
-        intersection: tuple[int, int] | None = self.__mask.overlap(other.__mask, (xoffset, yoffset))
+        intersection: tuple[int, int] | None = self.__get_mask().overlap(other.__get_mask(), (xoffset, yoffset))
         if not relative and intersection is not None:
             intersection = (intersection[0] + this_rect.x, intersection[1] + this_rect.y)
         return intersection
@@ -242,7 +338,8 @@ class Sprite(Drawable, Transformable):
     @property
     @final
     def mask(self) -> Mask:
-        return self.__mask
+        # The cached mask is shared with other sprites: give a copy that can be modified safely
+        return self.__get_mask().copy()
 
     @property
     def blend(self) -> BlendMode:
@@ -265,6 +362,11 @@ class Sprite(Drawable, Transformable):
 class SpriteGroup[_S: Sprite](DrawableGroup[_S]):
     __slots__ = ()
 
+    def __init__(self, *objects: _S, cell_size: int | None = None, **kwargs: Any) -> None:
+        if cell_size is not None:
+            _SPATIAL_INDEXES[self] = _SpriteSpatialHash(cell_size)
+        super().__init__(*objects, **kwargs)
+
     def draw_onto(self, target: AbstractRenderer) -> None:
         target.draw_many_surfaces(((s.image, s.topleft, None, s.blend) for s in self), doreturn=False)
 
@@ -280,15 +382,90 @@ class SpriteGroup[_S: Sprite](DrawableGroup[_S]):
         for s in self:
             s.update(**kwargs)
 
+    def add(self, *objects: _S) -> None:
+        try:
+            super().add(*objects)
+        finally:
+            if (spatial_index := _SPATIAL_INDEXES.get(self)) is not None:
+                for s in objects:
+                    if s in self.data:
+                        spatial_index.add(s)
+
+    def remove(self, *objects: _S) -> None:
+        try:
+            super().remove(*objects)
+        finally:
+            if (spatial_index := _SPATIAL_INDEXES.get(self)) is not None:
+                for s in objects:
+                    if s not in self.data:
+                        spatial_index.discard(s)
+
+    def pop(self, index: SupportsIndex = -1) -> _S:
+        s: _S = super().pop(index)
+        if (spatial_index := _SPATIAL_INDEXES.get(self)) is not None and s not in self.data:
+            spatial_index.discard(s)
+        return s
+
+    def clear(self) -> None:
+        try:
+            super().clear()
+        finally:
+            if (spatial_index := _SPATIAL_INDEXES.get(self)) is not None:
+                for s in spatial_index.sprites():
+                    if s not in self.data:
+                        spatial_index.discard(s)
+
+    def get_cell_size(self) -> int | None:
+        spatial_index = _SPATIAL_INDEXES.get(self)
+        return spatial_index.cell_size if spatial_index is not None else None
+
+    def set_cell_size(self, cell_size: int | None) -> None:
+        former_spatial_index = _SPATIAL_INDEXES.pop(self, None)
+        if former_spatial_index is not None:
+            former_spatial_index.clear()
+        if cell_size is not None:
+            _SPATIAL_INDEXES[self] = spatial_index = _SpriteSpatialHash[_S](cell_size)
+            for s in self.data:
+                spatial_index.add(s)
+
+    def _iter_collision_candidates(self, sprite: _S, sprites: Iterable[_S]) -> Iterable[_S]:
+        """
+        Broad phase: Filter out the sprites which cannot collide with 'sprite' without changing the order of 'sprites'
+        """
+        spatial_index = _SPATIAL_INDEXES.get(self)
+        if spatial_index is None:
+            return sprites
+        candidates = spatial_index.query(sprite)
+        if not candidates:
+            return ()
+        if not isinstance(sprites, Sequence):
+            sprites = tuple(sprites)
+        if len(candidates) * 8 >= len(sprites):
+            return (s for s in sprites if s in candidates)
+        # Few candidates: sort them according to their position in the sequence
+        positions: dict[_S, int] = {s: i for i, s in enumerate(sprites)}
+        return sorted((s for s in candidates if s in positions), key=positions.__getitem__)
+
+    def _iter_collision_candidate_pairs(self, sprites: Sequence[_S]) -> Iterable[tuple[_S, _S]]:
+        """
+        Broad phase: Same as combinations(sprites, r=2), but filter out the pairs which cannot collide
+        """
+        spatial_index = _SPATIAL_INDEXES.get(self)
+        if spatial_index is None:
+            return combinations(sprites, r=2)
+        positions: dict[_S, int] = {s: i for i, s in enumerate(sprites)}
+        pairs = spatial_index.candidate_pairs(positions)
+        return [(sprites[i], sprites[j]) for i, j in sorted(pairs)]
+
     def lazy_sprite_collide(self, sprite: _S, dokill: bool) -> Iterator[_S]:
         collide_sprite = sprite.is_colliding
         if dokill:
-            for s in (s for s in tuple(self) if collide_sprite(s)):
+            for s in (s for s in self._iter_collision_candidates(sprite, tuple(self)) if collide_sprite(s)):
                 s.kill()
                 yield s
             return
 
-        return (yield from (s for s in self if collide_sprite(s)))
+        return (yield from (s for s in self._iter_collision_candidates(sprite, self.data) if collide_sprite(s)))
 
     def sprite_collide(self, sprite: _S, dokill: bool) -> list[_S]:
         return list(self.lazy_sprite_collide(sprite, dokill))
@@ -316,12 +493,14 @@ class SpriteGroup[_S: Sprite](DrawableGroup[_S]):
 
     def sprite_collide_any(self, sprite: _S) -> _S | None:
         collide_sprite = sprite.is_colliding
-        return next((s for s in self if collide_sprite(s)), None)
+        return next((s for s in self._iter_collision_candidates(sprite, self.data) if collide_sprite(s)), None)
 
     def flush_colliding(self) -> list[_S]:
         crashed: deque[_S] = deque()
 
-        for s1, s2 in ((s1, s2) for s1, s2 in combinations(tuple(self), r=2) if s1.is_alive() and s2.is_alive()):
+        for s1, s2 in (
+            (s1, s2) for s1, s2 in self._iter_collision_candidate_pairs(tuple(self)) if s1.is_alive() and s2.is_alive()
+        ):
             if s1.is_colliding(s2):
                 s1.kill()
                 s2.kill()
@@ -333,8 +512,8 @@ class SpriteGroup[_S: Sprite](DrawableGroup[_S]):
 class LayeredSpriteGroup[_S: Sprite](LayeredDrawableGroup[_S], SpriteGroup[_S]):
     __slots__ = ()
 
-    def __init__(self, *objects: _S, default_layer: int = 0, **kwargs: Any) -> None:
-        super().__init__(*objects, default_layer=default_layer, **kwargs)
+    def __init__(self, *objects: _S, default_layer: int = 0, cell_size: int | None = None, **kwargs: Any) -> None:
+        super().__init__(*objects, default_layer=default_layer, cell_size=cell_size, **kwargs)
 
     def lazy_sprite_collide(self, sprite: _S, dokill: bool, *, layer: int | None = None) -> Iterator[_S]:
         sprites: Iterable[_S]
@@ -342,13 +521,13 @@ class LayeredSpriteGroup[_S: Sprite](LayeredDrawableGroup[_S], SpriteGroup[_S]):
         collide_sprite = sprite.is_colliding
         if dokill:
             sprites = tuple(self) if layer is None else self.get_from_layer(layer)
-            for s in (s for s in sprites if collide_sprite(s)):
+            for s in (s for s in self._iter_collision_candidates(sprite, sprites) if collide_sprite(s)):
                 s.kill()
                 yield s
             return
 
-        sprites = iter(self) if layer is None else self.iter_in_layer(layer)
-        return (yield from (s for s in sprites if collide_sprite(s)))
+        sprites = self.data if layer is None else self.iter_in_layer(layer)
+        return (yield from (s for s in self._iter_collision_candidates(sprite, sprites) if collide_sprite(s)))
 
     def group_collide(
         self,
@@ -383,18 +562,138 @@ class LayeredSpriteGroup[_S: Sprite](LayeredDrawableGroup[_S], SpriteGroup[_S]):
         }
 
     def sprite_collide_any(self, sprite: _S, *, layer: int | None = None) -> _S | None:
-        sprites: Iterable[_S] = iter(self) if layer is None else self.iter_in_layer(layer)
+        sprites: Iterable[_S] = self.data if layer is None else self.iter_in_layer(layer)
         collide_sprite = sprite.is_colliding
-        return next((s for s in sprites if collide_sprite(s)), None)
+        return next((s for s in self._iter_collision_candidates(sprite, sprites) if collide_sprite(s)), None)
 
     def flush_colliding(self, *, layer: int | None = None) -> list[_S]:
         crashed: deque[_S] = deque()
-        sprites: Iterable[_S] = tuple(self) if layer is None else self.get_from_layer(layer)
+        sprites: Sequence[_S] = tuple(self) if layer is None else self.get_from_layer(layer)
 
-        for s1, s2 in ((s1, s2) for s1, s2 in combinations(sprites, r=2) if s1.is_alive() and s2.is_alive()):
+        for s1, s2 in (
+            (s1, s2) for s1, s2 in self._iter_collision_candidate_pairs(sprites) if s1.is_alive() and s2.is_alive()
+        ):
             if s1.is_colliding(s2):
                 s1.kill()
                 s2.kill()
                 crashed.extend((s1, s2))
 
         return list(crashed)
+
+
+# Stored outside SpriteGroup's slots because of LayeredSpriteGroup's multiple inheritance
+_SPATIAL_INDEXES: WeakKeyDictionary[SpriteGroup[Any], _SpriteSpatialHash[Any]] = WeakKeyDictionary()
+
+
+class _SpriteSpatialHash[_S: Sprite]:
+    """
+    Uniform grid indexing the sprites' rects, used as a broad phase by the SpriteGroup collision helpers.
+
+    Sprites notify the index when they move or when they are transformed; cells are recomputed lazily at next query.
+    """
+
+    __slots__ = ("__cell_size", "__cells", "__sprite_cells", "__dirty", "__weakref__")
+
+    def __init__(self, cell_size: int) -> None:
+        cell_size = int(cell_size)
+        if cell_size <= 0:
+            raise ValueError("cell_size must be a strictly positive integer")
+        self.__cell_size: int = cell_size
+        self.__cells: dict[tuple[int, int], list[_S]] = {}
+        self.__sprite_cells: dict[_S, tuple[tuple[int, int], ...]] = {}
+        self.__dirty: set[_S] = set()
+
+    def add(self, sprite: _S) -> None:
+        if sprite in self.__sprite_cells:
+            return
+        self.__sprite_cells[sprite] = ()
+        self.__dirty.add(sprite)
+        sprite._register_spatial_index(self)
+
+    def discard(self, sprite: _S) -> None:
+        try:
+            cells = self.__sprite_cells.pop(sprite)
+        except KeyError:
+            return
+        self.__dirty.discard(sprite)
+        self.__remove_from_cells(sprite, cells)
+        sprite._unregister_spatial_index(self)
+
+    def clear(self) -> None:
+        for sprite in self.__sprite_cells:
+            sprite._unregister_spatial_index(self)
+        self.__cells.clear()
+        self.__sprite_cells.clear()
+        self.__dirty.clear()
+
+    def invalidate(self, sprite: _S) -> None:
+        self.__dirty.add(sprite)
+
+    def sprites(self) -> list[_S]:
+        return list(self.__sprite_cells)
+
+    def query(self, sprite: _S) -> set[_S]:
+        self.__refresh()
+        cells = self.__cells
+        candidates: set[_S] = set()
+        for cell in self.__get_rect_cells(sprite.get_rect()):
+            try:
+                candidates.update(cells[cell])
+            except KeyError:
+                continue
+        if sprite in self.__sprite_cells:
+            candidates.add(sprite)  # Always colliding with itself, even with an empty rect
+        return candidates
+
+    def candidate_pairs(self, positions: Mapping[_S, int]) -> set[tuple[int, int]]:
+        self.__refresh()
+        pairs: set[tuple[int, int]] = set()
+        for cell_sprites in self.__cells.values():
+            if len(cell_sprites) < 2:
+                continue
+            indexes = sorted(positions[s] for s in cell_sprites if s in positions)
+            pairs.update(combinations(indexes, r=2))
+        return pairs
+
+    def __refresh(self) -> None:
+        dirty = self.__dirty
+        if not dirty:
+            return
+        sprite_cells = self.__sprite_cells
+        cells = self.__cells
+        get_rect_cells = self.__get_rect_cells
+        for sprite in dirty:
+            try:
+                former_cells = sprite_cells[sprite]
+            except KeyError:
+                continue
+            new_cells = get_rect_cells(sprite.get_rect())
+            if new_cells == former_cells:
+                continue
+            self.__remove_from_cells(sprite, former_cells)
+            for cell in new_cells:
+                cells.setdefault(cell, []).append(sprite)
+            sprite_cells[sprite] = new_cells
+        dirty.clear()
+
+    def __remove_from_cells(self, sprite: _S, sprite_cells: tuple[tuple[int, int], ...]) -> None:
+        cells = self.__cells
+        for cell in sprite_cells:
+            cell_sprites = cells[cell]
+            cell_sprites.remove(sprite)
+            if not cell_sprites:
+                del cells[cell]
+
+    def __get_rect_cells(self, rect: Rect) -> tuple[tuple[int, int], ...]:
+        if rect.w <= 0 or rect.h <= 0:
+            return ()
+        cell_size = self.__cell_size
+        left: int = rect.left // cell_size
+        right: int = (rect.right - 1) // cell_size
+        top: int = rect.top // cell_size
+        bottom: int = (rect.bottom - 1) // cell_size
+        return tuple((x, y) for x in range(left, right + 1) for y in range(top, bottom + 1))
+
+    @property
+    def cell_size(self) -> int:
+        return self.__cell_size
@@ -35,6 +35,7 @@ from ._draw import (
     draw_polygon as _draw_polygon,
     draw_rect as _draw_rect,
 )
+from ._text_cache import text_cache as _text_cache
 from .color import TRANSPARENT
 from .font import STYLE_DEFAULT, Font, FontFactory
 from .renderer import AbstractRenderer, BlendMode, RendererAnchor
@@ -76,6 +77,14 @@ def save_image(image: Surface, file: str) -> None:
     return _pg_image.save(image, encode_file_path(file))
 
 
+def _get_dest_topleft(dest: Any) -> tuple[int, int]:
+    try:
+        x, y = dest
+        return (int(x), int(y))
+    except (TypeError, ValueError):
+        return Rect(dest).topleft
+
+
 class AbstractSurfaceRenderer(AbstractRenderer):
     __slots__ = ()
 
@@ -200,7 +209,10 @@ class AbstractSurfaceRenderer(AbstractRenderer):
             font = FontFactory.create_font(font)
         if anchor != "topleft":
             dest = font.get_rect(text, style=style, rotation=rotation, size=size, **{str(anchor): dest})
-        return font.render_to(self.get_target(), dest, text, fgcolor, bgcolor=bgcolor, style=style, rotation=rotation, size=size)
+        surface = _text_cache.render(font, text, fgcolor, bgcolor=bgcolor, style=style, rotation=rotation, size=size)
+        topleft = _get_dest_topleft(dest)
+        self.get_target().blit(surface, topleft)
+        return Rect(topleft, surface.get_size())
 
     def draw_rect(
         self,
@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-__all__ = ["Text", "TextImage"]
+__all__ = ["Text", "TextCache", "TextImage", "text_cache"]
 
 from collections import deque
 from collections.abc import Mapping
@@ -14,15 +14,14 @@ from textwrap import wrap as textwrap
 from typing import TYPE_CHECKING, Any, ClassVar, Final, assert_never, overload
 from weakref import proxy as weakproxy
 
-from pygame.transform import rotozoom as _surface_rotozoom
-
 from ..math.rect import Rect
 from ..system.configuration import Configuration, ConfigurationTemplate, OptionAttribute, initializer
 from ..system.theme import ThemedObjectMeta, ThemeType
 from ..system.utils.enum import AutoLowerNameEnum
 from ..system.utils.typing import reflect_method_signature
 from ..system.validation import valid_float, valid_integer
-from ._transform import rotozoom2 as _surface_rotozoom2, scale_by as _surface_scale_by
+from ._text_cache import TextCache, text_cache
+from ._transform import rotozoom as _surface_rotozoom, rotozoom2 as _surface_rotozoom2, scale_by as _surface_scale_by
 from .color import BLACK, Color
 from .drawable import Drawable
 from .font import Font, FontFactory
@@ -193,6 +192,37 @@ class Text(Drawable, Transformable, metaclass=ThemedObjectMeta):
         fgcolor: Color = self.__color
         shadow_x: int = int(self.__shadow_x)
         shadow_y: int = int(self.__shadow_y)
+        shadow_color: Color = self.__shadow_color
+        cache_key = (
+            "text",
+            text,
+            tuple(custom_font.get(index, default_font).get_cache_key() for index in range(len(text.splitlines()))),
+            line_spacing,
+            justify_pos,
+            tuple(fgcolor),
+            shadow_x,
+            shadow_y,
+            tuple(shadow_color) if shadow_x or shadow_y else None,
+        )
+        return text_cache.get_or_render(
+            cache_key,
+            lambda: Text.__render_text(
+                text, default_font, custom_font, line_spacing, justify_pos, fgcolor, shadow_x, shadow_y, shadow_color
+            ),
+        )
+
+    @staticmethod
+    def __render_text(
+        text: str,
+        default_font: Font,
+        custom_font: dict[int, Font],
+        line_spacing: int,
+        justify_pos: str,
+        fgcolor: Color,
+        shadow_x: int,
+        shadow_y: int,
+        shadow_color: Color,
+    ) -> Surface:
         shadow_width_offset: int = abs(shadow_x)
         shadow_height_offset: int = abs(shadow_y)
         text_x: float = 0
@@ -240,7 +270,6 @@ class Text(Drawable, Transformable, metaclass=ThemedObjectMeta):
 
         # 4-a Render shadow if set
         if shadow_width_offset or shadow_height_offset:
-            shadow_color: Color = self.__shadow_color
             for line, font, line_rect in render_queue:
                 line_rect.move_ip(shadow_x, shadow_y)
                 font.render_to(final_render_surface, line_rect, line, shadow_color)
@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-__all__ = ["Transformable"]
+__all__ = ["TransformCache", "Transformable", "transform_cache"]
 
 from abc import abstractmethod
 from collections.abc import Mapping
@@ -13,6 +13,7 @@ from typing import Any, Literal, assert_never, final, overload
 
 from ..math import Rect, Vector2, compute_rect_from_vertices, compute_size_from_vertices, normalize_points, rotate_points
 from ..math.rect import modify_rect_in_place, move_rect_in_place
+from ._transform import TransformCache, transform_cache
 from .movable import Movable
 
 
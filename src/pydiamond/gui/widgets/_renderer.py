@@ -5,16 +5,18 @@
 
 from __future__ import annotations
 
-__all__ = ["WidgetRendererView"]
+__all__ = ["WidgetCacheRenderer", "WidgetRendererView"]
 
+from collections.abc import Iterable, Sequence
 from contextlib import AbstractContextManager as ContextManager
-from typing import TYPE_CHECKING, final
+from typing import TYPE_CHECKING, Any, final
 
 from ...graphics.renderer import AbstractRenderer, RendererView
+from ...graphics.surface import Surface, SurfaceRenderer
 from ...math.rect import Rect
 
 if TYPE_CHECKING:
-    from pygame._common import _CanBeRect
+    from pygame._common import Coordinate, RectValue, _CanBeRect
 
     from .abc import AbstractWidget
 
@@ -37,3 +39,103 @@ class WidgetRendererView(RendererView):
 
     def using_clip(self, rect: _CanBeRect | None) -> ContextManager[None]:
         return super().using_clip(self.__clip_rect(rect))
+
+
+@final
+class WidgetCacheRenderer(SurfaceRenderer):
+    """
+    Renderer drawing onto a widget's cached surface
+
+    Widgets draw using window coordinates, so every position is translated
+    by the origin of the cached surface, and every returned rect is translated back.
+    get_rect() returns the area covered by the cached surface in window coordinates.
+    get_size(), get_width() and get_height() return the size of the cached surface (i.e. the widget's one),
+    not the window's one.
+    """
+
+    __slots__ = ("__x", "__y")
+
+    def __init__(self, target: Surface, origin: tuple[int, int]) -> None:
+        super().__init__(target)
+        self.__x: int
+        self.__y: int
+        self.__x, self.__y = origin
+
+    def __point(self, point: Coordinate) -> tuple[float, float]:
+        x, y = point
+        return (x - self.__x, y - self.__y)
+
+    def __points(self, points: Sequence[Coordinate]) -> list[tuple[float, float]]:
+        return [self.__point(point) for point in points]
+
+    def __rect(self, rect: _CanBeRect) -> Rect:
+        if not isinstance(rect, Rect):
+            rect = Rect(rect)
+        return rect.move(-self.__x, -self.__y)
+
+    def __dest(self, dest: Coordinate | _CanBeRect) -> tuple[float, float] | Rect:
+        try:
+            return self.__point(dest)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return self.__rect(dest)  # type: ignore[arg-type]
+
+    def __result(self, rect: Rect) -> Rect:
+        return rect.move(self.__x, self.__y)
+
+    def get_rect(self, **kwargs: Any) -> Rect:
+        rect = self.__result(super().get_rect())
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def get_clip(self) -> Rect:
+        return self.__result(super().get_clip())
+
+    def using_clip(self, rect: _CanBeRect | None) -> ContextManager[None]:
+        return super().using_clip(None if rect is None else self.__rect(rect))
+
+    def to_surface(self, surface: Surface | None = None, area: _CanBeRect | None = None) -> Surface:
+        return super().to_surface(surface, None if area is None else self.__rect(area))
+
+    def fill(self, color: Any, rect: _CanBeRect | None = None) -> Rect:
+        return self.__result(super().fill(color, None if rect is None else self.__rect(rect)))
+
+    def draw_surface(self, surface: Surface, dest: Coordinate | _CanBeRect, *args: Any, **kwargs: Any) -> Rect:
+        return self.__result(super().draw_surface(surface, self.__dest(dest), *args, **kwargs))
+
+    def draw_many_surfaces(self, sequence: Iterable[tuple[Any, ...]], doreturn: bool = True) -> list[Rect] | None:  # type: ignore[override]
+        sequence = [(surface, self.__dest(dest), *args) for surface, dest, *args in sequence]
+        rects = super().draw_many_surfaces(sequence, doreturn)  # type: ignore[arg-type]
+        if rects is None:
+            return None
+        return [self.__result(rect) for rect in rects]
+
+    def draw_text(self, text: str, font: Any, dest: Coordinate | _CanBeRect, *args: Any, **kwargs: Any) -> Rect:
+        return self.__result(super().draw_text(text, font, self.__dest(dest), *args, **kwargs))
+
+    def draw_rect(self, color: Any, rect: RectValue, *args: Any, **kwargs: Any) -> Rect:
+        return self.__result(super().draw_rect(color, self.__rect(rect), *args, **kwargs))
+
+    def draw_polygon(self, color: Any, points: Sequence[Coordinate], *args: Any, **kwargs: Any) -> Rect:
+        return self.__result(super().draw_polygon(color, self.__points(points), *args, **kwargs))
+
+    def draw_circle(self, color: Any, center: Coordinate, *args: Any, **kwargs: Any) -> Rect:
+        return self.__result(super().draw_circle(color, self.__point(center), *args, **kwargs))
+
+    def draw_ellipse(self, color: Any, rect: RectValue, *args: Any, **kwargs: Any) -> Rect:
+        return self.__result(super().draw_ellipse(color, self.__rect(rect), *args, **kwargs))
+
+    def draw_arc(self, color: Any, rect: RectValue, *args: Any, **kwargs: Any) -> Rect:
+        return self.__result(super().draw_arc(color, self.__rect(rect), *args, **kwargs))
+
+    def draw_line(self, color: Any, start_pos: Coordinate, end_pos: Coordinate, *args: Any, **kwargs: Any) -> Rect:
+        return self.__result(super().draw_line(color, self.__point(start_pos), self.__point(end_pos), *args, **kwargs))
+
+    def draw_lines(self, color: Any, closed: bool, points: Sequence[Coordinate], *args: Any, **kwargs: Any) -> Rect:
+        return self.__result(super().draw_lines(color, closed, self.__points(points), *args, **kwargs))
+
+    def draw_aaline(self, color: Any, start_pos: Coordinate, end_pos: Coordinate, *args: Any, **kwargs: Any) -> Rect:
+        return self.__result(super().draw_aaline(color, self.__point(start_pos), self.__point(end_pos), *args, **kwargs))
+
+    def draw_aalines(self, color: Any, closed: bool, points: Sequence[Coordinate], *args: Any, **kwargs: Any) -> Rect:
+        return self.__result(super().draw_aalines(color, closed, self.__points(points), *args, **kwargs))
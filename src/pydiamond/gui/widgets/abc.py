@@ -23,6 +23,7 @@ from ...audio.sound import Sound
 from ...graphics.drawable import Drawable
 from ...graphics.movable import Movable
 from ...graphics.renderer import AbstractRenderer
+from ...graphics.surface import Surface, create_surface
 from ...math.rect import Rect
 from ...scene.abc import Scene
 from ...scene.window import SceneWindow
@@ -105,6 +106,8 @@ class AbstractWidget(Drawable, Movable, prepare_namespace=__prepare_abstract_wid
             elif not weakref_unwrap(self.__manager)._draw_requested:
                 raise TypeError(f"{self!r}: drawing asked outside manager")
             if self.is_shown():
+                if self.__retained_rendering:
+                    return self.__draw_retained(func, target)
                 target = WidgetRendererView(self, target)
                 self.__drawing = True
                 try:
@@ -120,11 +123,36 @@ class AbstractWidget(Drawable, Movable, prepare_namespace=__prepare_abstract_wid
         setattr(wrapper, "__draw_onto_decorator__", True)
         return wrapper
 
+    def __draw_retained(self, func: Callable[[Self, AbstractRenderer], None], target: AbstractRenderer) -> None:
+        from ._renderer import WidgetCacheRenderer, WidgetRendererView
+
+        rect = Rect(self.topleft, self.get_size())
+        visible_area = self.get_visible_rect().move(-rect.x, -rect.y)
+        cache = self.__render_cache
+        if cache is None or cache[0] != visible_area or cache[1].get_size() != rect.size:
+            surface = create_surface(rect.size)
+            cache_target = WidgetRendererView(self, WidgetCacheRenderer(surface, rect.topleft))
+            self.__drawing = True
+            try:
+                with cache_target.using_clip(None):
+                    self._before_widget_render(cache_target)
+                    func(self, cache_target)
+                    self._after_widget_render(cache_target)
+            finally:
+                self.__drawing = False
+            # The visible area is part of the key: what was clipped out is not in the surface
+            self.__render_cache = cache = (visible_area, surface)
+        target = WidgetRendererView(self, target)
+        with target.using_clip(None):
+            target.draw_surface(cache[1], rect.topleft)
+
     def __init__(self, master: AbstractWidget | WidgetsManager, **kwargs: Any) -> None:
         self.__event: _WidgetEventManager
         self.__event = event = _WidgetEventManager(self, priority_callbacks=True)
         self.__drawing: bool = False
         self.__shown: bool = True
+        self.__retained_rendering: bool = False
+        self.__render_cache: tuple[Rect, Surface] | None = None
 
         parent: AbstractWidget | None
         manager: WidgetsManager
@@ -147,15 +175,22 @@ class AbstractWidget(Drawable, Movable, prepare_namespace=__prepare_abstract_wid
 
         self.__manager: weakref[WidgetsManager] = weakref(manager)
         self.__children: OrderedSet[AbstractWidget] = OrderedSet()
+        # Children which lay things out in _on_move(), and so must know when the children offset changes
+        self.__children_laid_out_on_move: OrderedSet[AbstractWidget] = OrderedSet()
+        self.__children_offset: tuple[float, float] = (0, 0)
 
         super().__init__(**kwargs)
 
         if parent is not None:
             parent.__children.add(self)
+            if type(self)._on_move is not Movable._on_move:
+                parent.__children_laid_out_on_move.add(self)
+            parent.invalidate_rendering()
             try:
                 parent._child_added(self)
             except BaseException:
                 parent.__children.discard(self)
+                parent.__children_laid_out_on_move.discard(self)
                 try:
                     parent._child_removed(self)
                 finally:
@@ -174,6 +209,12 @@ class AbstractWidget(Drawable, Movable, prepare_namespace=__prepare_abstract_wid
         if child in self.__children:
             raise ValueError("child was not removed ?")
 
+    def _child_moved(self, child: AbstractWidget) -> None:
+        pass
+
+    def _child_rendering_invalidated(self, child: AbstractWidget) -> None:
+        pass
+
     def _before_widget_render(self, target: AbstractRenderer) -> None:
         pass
 
@@ -196,6 +237,49 @@ class AbstractWidget(Drawable, Movable, prepare_namespace=__prepare_abstract_wid
     def iter_children(self) -> Iterator[AbstractWidget]:
         return iter(self.__children)
 
+    @final
+    def _get_children_offset(self) -> tuple[float, float]:
+        return self.__children_offset
+
+    @final
+    def _move_children(self, dx: float, dy: float) -> None:
+        # Children positions are relative to the parent's one, so this moves all of them at once.
+        # _on_move() is only called for the children which override it (e.g. grids).
+        if dx == 0 and dy == 0:
+            return
+        offset_x, offset_y = self.__children_offset
+        self.__children_offset = (offset_x + dx, offset_y + dy)
+        self.invalidate_rendering()
+        for child in list(self.__children_laid_out_on_move):
+            child._on_move()
+
+    @final
+    def is_retained_rendering(self) -> bool:
+        return self.__retained_rendering
+
+    @final
+    def set_retained_rendering(self, status: bool) -> None:
+        """
+        Enable or disable the render cache of this widget and its children.
+
+        When enabled, the widget is rendered once into a surface which is then blitted
+        each frame, until a configuration update, a state change (hover, active, focus),
+        a child change or a call to invalidate_rendering().
+        """
+        self.__retained_rendering = bool(status)
+        self.invalidate_rendering()
+
+    @final
+    def invalidate_rendering(self) -> None:
+        widget: AbstractWidget = self
+        while True:
+            widget.__render_cache = None
+            parent: AbstractWidget | None = widget.__parent()
+            if parent is None:
+                break
+            parent._child_rendering_invalidated(widget)
+            widget = parent
+
     @final
     def unlink(self) -> None:
         if (parent := self.__parent()) is None:
@@ -205,6 +289,8 @@ class AbstractWidget(Drawable, Movable, prepare_namespace=__prepare_abstract_wid
                 pass
             return
         parent.__children.discard(self)
+        parent.__children_laid_out_on_move.discard(self)
+        parent.invalidate_rendering()
         try:
             parent._child_removed(self)
         finally:
@@ -329,15 +415,18 @@ class AbstractWidget(Drawable, Movable, prepare_namespace=__prepare_abstract_wid
 
     @final
     def show(self) -> None:
-        self.__shown = True
+        self.set_visibility(True)
 
     @final
     def hide(self) -> None:
-        self.__shown = False
+        self.set_visibility(False)
 
     @final
     def set_visibility(self, status: bool) -> None:
-        self.__shown = bool(status)
+        status = bool(status)
+        if status != self.__shown:
+            self.__shown = status
+            self.invalidate_rendering()
 
     def kill(self) -> None:
         super().kill()
@@ -400,15 +489,19 @@ class AbstractWidget(Drawable, Movable, prepare_namespace=__prepare_abstract_wid
         parent: AbstractWidget | None = self.__parent()
         if parent is None:
             return self.__rel_x
-        return self.__rel_x + parent.__x
+        return self.__rel_x + parent.__x + parent.__children_offset[0]
 
     @__x.setter
     def __x(self, x: float) -> None:
         parent: AbstractWidget | None = self.__parent()
         if parent is None:
             self.__rel_x = x
+            if (manager := self.__manager()) is not None:
+                manager._invalidate_hit_test()
             return
-        self.__rel_x = x - parent.__x
+        self.__rel_x = x - parent.__x - parent.__children_offset[0]
+        parent.invalidate_rendering()
+        parent._child_moved(self)
 
     @property
     def __y(self) -> float:
@@ -416,15 +509,19 @@ class AbstractWidget(Drawable, Movable, prepare_namespace=__prepare_abstract_wid
         parent: AbstractWidget | None = self.__parent()
         if parent is None:
             return self.__rel_y
-        return self.__rel_y + parent.__y
+        return self.__rel_y + parent.__y + parent.__children_offset[1]
 
     @__y.setter
     def __y(self, y: float) -> None:
         parent: AbstractWidget | None = self.__parent()
         if parent is None:
             self.__rel_y = y
+            if (manager := self.__manager()) is not None:
+                manager._invalidate_hit_test()
             return
-        self.__rel_y = y - parent.__y
+        self.__rel_y = y - parent.__y - parent.__children_offset[1]
+        parent.invalidate_rendering()
+        parent._child_moved(self)
 
 
 del __prepare_abstract_widget
@@ -777,10 +874,10 @@ class Widget(AbstractWidget, children=False):
         pass
 
     def _on_focus_set(self) -> None:
-        pass
+        self.invalidate_rendering()
 
     def _on_focus_leave(self) -> None:
-        pass
+        self.invalidate_rendering()
 
     @property
     def focus(self) -> BoundFocus:
@@ -796,6 +893,7 @@ class Widget(AbstractWidget, children=False):
         if status == self.__hover:
             return
         self.__hover = status
+        self.invalidate_rendering()
         if status is True:
             if (hover_sound := self.__hover_sound) is not None:
                 hover_sound.play()
@@ -817,11 +915,18 @@ class Widget(AbstractWidget, children=False):
         if status == self.__active:
             return
         self.__active = status
+        self.invalidate_rendering()
         if self.active:
             self._on_active_set()
 
     config.add_enum_converter("state", WidgetState, return_value_on_get=True)
 
+    @config.add_main_update(use_override=False)
+    def __invalidate_rendering_on_update(self) -> None:
+        self.invalidate_rendering()
+
+    del __invalidate_rendering_on_update
+
     @config.on_update("state", use_override=False)
     def __update_state(self) -> None:
         if self.hover:
@@ -867,7 +972,7 @@ class Widget(AbstractWidget, children=False):
 
 
 class WidgetsManager(Object):
-    __slots__ = ("__scene", "__window", "__event", "__widgets", "__drawing", "__weakref__")
+    __slots__ = ("__scene", "__window", "__event", "__widgets", "__drawing", "__hit_test", "__weakref__")
 
     def __init__(self, master: WidgetsManager | Scene | SceneWindow) -> None:
         super().__init__()
@@ -877,9 +982,11 @@ class WidgetsManager(Object):
         self.__event: _WidgetEventManager = _WidgetEventManager(self, priority_callbacks=True)
         self.__widgets: OrderedSet[AbstractWidget] = OrderedSet()
         self.__drawing: bool = False
+        # Topmost widget under the last tested point, computed at most once per pointer event
+        self.__hit_test: tuple[tuple[float, float], AbstractWidget | None] | None = None
 
-        event_callback: WeakMethod[Callable[..., Any]] = WeakMethod(self.__event._process_event)  # TODO: Fix type hinting
-        mouse_callback: WeakMethod[Callable[..., Any]] = WeakMethod(self.__event._handle_mouse_position)  # TODO: Fix type hinting
+        event_callback: WeakMethod[Callable[..., Any]] = WeakMethod(self.__process_event)  # TODO: Fix type hinting
+        mouse_callback: WeakMethod[Callable[..., Any]] = WeakMethod(self.__handle_mouse_position)  # TODO: Fix type hinting
 
         match master:
             case WidgetsManager():
@@ -922,6 +1029,7 @@ class WidgetsManager(Object):
             raise ValueError("widget parent is not None")
         widget_event_manager = cast(_WidgetEventManager, widget.event)
         self.__widgets.add(widget)
+        self.__hit_test = None
         self.__event._bind_event_manager(widget_event_manager)
 
     def _unregister(self, widget: AbstractWidget) -> None:
@@ -930,10 +1038,39 @@ class WidgetsManager(Object):
             raise ValueError("widget.manager is not self")
         widget_event_manager = cast(_WidgetEventManager, widget.event)
         self.__widgets.remove(widget)
+        self.__hit_test = None
         self.__event._unbind_event_manager(widget_event_manager)
 
+    def __process_event(self, event: Event) -> bool:
+        self.__hit_test = None
+        return self.__event._process_event(event)
+
+    def __handle_mouse_position(self, mouse_pos: tuple[float, float]) -> None:
+        self.__hit_test = None
+        return self.__event._handle_mouse_position(mouse_pos)
+
+    @final
+    def _invalidate_hit_test(self) -> None:
+        self.__hit_test = None
+
+    @final
+    def _get_widget_at(self, mouse_pos: tuple[float, float]) -> AbstractWidget | None:
+        hit_test = self.__hit_test
+        if hit_test is None or hit_test[0] != mouse_pos:
+            topmost: AbstractWidget | None = next(
+                (widget for widget in reversed(self.__widgets) if widget.get_visible_rect().collidepoint(mouse_pos)),
+                None,
+            )
+            self.__hit_test = hit_test = (mouse_pos, topmost)
+        return hit_test[1]
+
     @final
     def _is_mouse_hovering_widget(self, widget: AbstractWidget, mouse_pos: tuple[float, float]) -> bool:
+        topmost = self._get_widget_at(mouse_pos)
+        if topmost is None or topmost is widget:
+            return True
+        if widget.get_visible_rect().collidepoint(mouse_pos):  # Covered by topmost
+            return False
         return not any(
             child.get_visible_rect().collidepoint(mouse_pos)
             for child in takewhile(lambda child: child is not widget, reversed(self.__widgets))
@@ -9,7 +9,7 @@ __all__ = ["Button", "ImageButton"]
 
 from collections.abc import Callable, Sequence
 from enum import auto, unique
-from typing import TYPE_CHECKING, Any, ClassVar, Final, Literal, TypedDict, overload
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Literal, NamedTuple, TypedDict, overload
 
 from ...graphics.color import BLACK, BLUE, GRAY, GRAY_DARK, GRAY_LIGHT, TRANSPARENT, WHITE, Color
 from ...graphics.image import Image
@@ -17,7 +17,7 @@ from ...graphics.shape import RectangleShape
 from ...graphics.surface import Surface
 from ...graphics.text import TextImage
 from ...graphics.transformable import Transformable
-from ...math import is_inside_polygon
+from ...math import Vector2, is_inside_polygon
 from ...system.configuration import Configuration, ConfigurationTemplate, OptionAttribute, initializer
 from ...system.theme import NoTheme, ThemedObjectMeta, ThemeType
 from ...system.utils.enum import AutoLowerNameEnum
@@ -289,6 +289,7 @@ class Button(Widget, Transformable, metaclass=ThemedObjectMeta):
         self.outline = outline
         self.outline_color = outline_color
         self.__show_bg: bool = bool(show_bg)
+        self.__hitbox: _ButtonHitbox | None = None
         self.__bg_dict: dict[WidgetState, _ButtonColor] = {
             WidgetState.NORMAL: {
                 "normal": Color(bg),
@@ -477,6 +478,7 @@ class Button(Widget, Transformable, metaclass=ThemedObjectMeta):
         if status is None:
             return self.__show_bg
         self.__show_bg = bool(status)
+        self.invalidate_rendering()
         return None
 
     def _apply_both_rotation_and_scale(self) -> None:
@@ -493,7 +495,27 @@ class Button(Widget, Transformable, metaclass=ThemedObjectMeta):
         self.__update_shape_size()
 
     def _point_in_hitbox(self, point: tuple[float, float]) -> bool:
-        return is_inside_polygon(self.get_area_vertices(apply_rotation=True, apply_scale=True), point)
+        hitbox = self.__get_hitbox()
+        if (bounds := hitbox.bounds) is not None:
+            x, y = point
+            left, top, right, bottom = bounds
+            return left <= x <= right and top <= y <= bottom
+        return is_inside_polygon(hitbox.vertices, point)
+
+    def __get_hitbox(self) -> _ButtonHitbox:
+        # The vertices are relative to the topleft, so only a transformation or a resize changes them
+        key = (self.get_local_size(), self.angle, self.scale)
+        hitbox = self.__hitbox
+        if hitbox is None or hitbox.key != key:
+            vertices = self.get_area_vertices(apply_rotation=True, apply_scale=True)
+            bounds: tuple[float, float, float, float] | None = None
+            # Fast path for axis-aligned rectangles (i.e. unrotated, or rotated by a multiple of 90 degrees)
+            if vertices and all(p[0] == q[0] or p[1] == q[1] for p, q in zip(vertices, (*vertices[1:], vertices[0]))):
+                xs = [v[0] for v in vertices]
+                ys = [v[1] for v in vertices]
+                bounds = (min(xs), min(ys), max(xs), max(ys))
+            self.__hitbox = hitbox = _ButtonHitbox(key, tuple(vertices), bounds)
+        return hitbox
 
     def _on_hover(self) -> None:
         self.__set_state("hover")
@@ -1160,6 +1182,12 @@ class ImageButton(Widget, Transformable, metaclass=ThemedObjectMeta):
             self.__callback = None
 
 
+class _ButtonHitbox(NamedTuple):
+    key: tuple[tuple[float, float], float, tuple[float, float]]
+    vertices: tuple[Vector2, ...]
+    bounds: tuple[float, float, float, float] | None
+
+
 class _ButtonColor(TypedDict):
     normal: Color
     hover: Color | None
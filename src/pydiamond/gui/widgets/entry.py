@@ -227,15 +227,23 @@ class Entry(Widget, metaclass=ThemedObjectMeta):
 
     def clear(self) -> None:
         self.__text = ""
+        self.invalidate_rendering()
 
     def start_edit(self) -> None:
         Keyboard.IME.start_text_input()
         self.__start_edit = True
         self.__show_cursor = True
+        self.invalidate_rendering()
 
     def stop_edit(self) -> None:
         Keyboard.IME.stop_text_input()
         self.__start_edit = False
+        self.invalidate_rendering()
+
+    def _update_widget(self) -> None:
+        super()._update_widget()
+        if self.__start_edit:  # Text and cursor animation
+            self.invalidate_rendering()
 
     def invoke(self) -> None:
         if self.focus.get_mode() in {FocusMode.MOUSE, FocusMode.NONE}:
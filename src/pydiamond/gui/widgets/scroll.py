@@ -9,7 +9,6 @@ __all__ = ["AbstractScrollableWidget", "ScrollBar", "ScrollingContainer"]
 
 from collections.abc import Callable, Sequence
 from enum import auto, unique
-from functools import reduce
 from itertools import takewhile
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Protocol
 from weakref import WeakMethod
@@ -280,6 +279,7 @@ class ScrollBar(Widget, Transformable, metaclass=ThemedObjectMeta):
             end = 1
             self.__start = 1 - offset
         self.__end = end
+        self.invalidate_rendering()
         command = self.__command
         if command is not None:
             command("moveto", self.fraction)
@@ -301,6 +301,7 @@ class ScrollBar(Widget, Transformable, metaclass=ThemedObjectMeta):
         self.__start = start
         self.__end = end
         self.__update_all_shapes()
+        self.invalidate_rendering()
 
     @property
     def fraction(self) -> float:
@@ -459,6 +460,58 @@ class ScrollingContainer(AbstractScrollableWidget):
         )
 
         self.__size: tuple[int, int] = int(width), int(height)
+        # Children, their rects relative to the content origin (i.e. the topleft plus the scroll offset) and their index
+        self.__content: tuple[list[AbstractWidget], list[Rect], dict[AbstractWidget, int]] | None = None
+        self.__content_bounds: Rect | None = None
+
+    def _child_added(self, child: AbstractWidget) -> None:
+        super()._child_added(child)
+        # The child is not fully initialized yet: it will be measured by __get_content()
+        self.invalidate_content_bounds()
+
+    def _child_removed(self, child: AbstractWidget) -> None:
+        super()._child_removed(child)
+        self.invalidate_content_bounds()
+
+    def _child_moved(self, child: AbstractWidget) -> None:
+        super()._child_moved(child)
+        self.invalidate_content_bounds()
+
+    def _child_rendering_invalidated(self, child: AbstractWidget) -> None:
+        super()._child_rendering_invalidated(child)
+        if (content := self.__content) is None:
+            return
+        _, rects, indexes = content
+        try:
+            rect = rects[indexes[child]]
+        except KeyError:  # Not measured yet
+            return
+        if rect.size != child.get_rect().size:
+            self.invalidate_content_bounds()
+
+    def invalidate_content_bounds(self) -> None:
+        """
+        Must be called when a child is resized without invalidating its rendering.
+        """
+        self.__content = None
+        self.__content_bounds = None
+
+    def __get_content_origin_offset(self) -> tuple[int, int]:
+        x, y = self.topleft
+        offset_x, offset_y = self._get_children_offset()
+        return -round(x + offset_x), -round(y + offset_y)
+
+    def __get_content(self) -> tuple[list[AbstractWidget], list[Rect], dict[AbstractWidget, int]]:
+        content = self.__content
+        if content is None:
+            origin_offset = self.__get_content_origin_offset()
+            children = list(self.iter_children())
+            self.__content = content = (
+                children,
+                [child.get_rect().move(origin_offset) for child in children],
+                {child: index for index, child in enumerate(children)},
+            )
+        return content
 
     def _is_mouse_hovering_child(self, widget: AbstractWidget, mouse_pos: tuple[float, float]) -> bool:
         return not any(
@@ -470,10 +523,14 @@ class ScrollingContainer(AbstractScrollableWidget):
         return Rect(self.topleft, self.__size)
 
     def get_whole_rect(self) -> Rect:
-        children_rects = [child.get_rect() for child in self.iter_children()]
-        if not children_rects:
-            return Rect(self.topleft, (0, 0))
-        return reduce(Rect.union, children_rects)
+        bounds = self.__content_bounds
+        if bounds is None:
+            _, rects, _ = self.__get_content()
+            if not rects:
+                return Rect(self.topleft, (0, 0))
+            self.__content_bounds = bounds = rects[0].unionall(rects[1:])
+        dx, dy = self.__get_content_origin_offset()
+        return bounds.move(-dx, -dy)
 
     def get_size(self) -> tuple[int, int]:
         return self.__size
@@ -484,9 +541,12 @@ class ScrollingContainer(AbstractScrollableWidget):
         self.update_view(force=True)
 
     def draw_onto(self, target: AbstractRenderer) -> None:
-        for child in self.iter_children():
-            child.draw_onto(target)
+        children, rects, _ = self.__get_content()
+        if not children:
+            return
+        view_rect = self.get_view_rect().move(self.__get_content_origin_offset())
+        for index in view_rect.collidelistall(rects):
+            children[index].draw_onto(target)
 
     def _move_view(self, dx: int, dy: int) -> None:
-        for child in self.iter_children():
-            child.move(dx, dy)
+        self._move_children(dx, dy)
@@ -16,6 +16,7 @@ __all__ = [
     "do_intersect",
     "get_vertices_center",
     "is_inside_polygon",
+    "is_inside_polygon_batch",
     "linear_interpolation",
     "normalize_points",
     "on_segment",
@@ -10,14 +10,18 @@ Source from:
 
 from __future__ import annotations
 
-__all__ = ["do_intersect", "is_inside_polygon", "on_segment", "orientation"]
+__all__ = ["do_intersect", "is_inside_polygon", "is_inside_polygon_batch", "on_segment", "orientation"]
 
-import sys
 from collections.abc import Sequence
 from typing import Literal
 
 from .vector2 import Vector2
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore[assignment]
+
 type _FPoint = tuple[float, float]
 
 
@@ -89,6 +93,8 @@ def is_inside_polygon(points: Sequence[_FPoint] | Sequence[Vector2], p: _FPoint
     """
     Returns true if the point p lies
     inside the polygon[] with n vertices
+
+    Points on an edge are considered inside.
     """
 
     n = len(points)
@@ -98,43 +104,69 @@ def is_inside_polygon(points: Sequence[_FPoint] | Sequence[Vector2], p: _FPoint
     if n < 3:
         return False
 
-    # Create a point for line segment
-    # from p to infinite
-    extreme: _FPoint = (sys.maxsize - 1, p[1])
+    px, py = p[0], p[1]
 
-    # To count number of points in polygon
-    # whose y-coordinate is equal to
-    # y-coordinate of the point
-    decrease: int = 0
+    # To count number of edges crossed by the
+    # ray going from 'p' to the right
     count: int = 0
-    i: int = 0
-
-    while True:
-        next: int = (i + 1) % n
 
-        if points[i][1] == p[1]:
-            decrease += 1
+    for i in range(n):
+        x1, y1 = points[i][0], points[i][1]
+        x2, y2 = points[(i + 1) % n][0], points[(i + 1) % n][1]
 
-        # Check if the line segment from 'p' to
-        # 'extreme' intersects with the line
-        # segment from 'polygon[i]' to 'polygon[next]'
-        if do_intersect(points[i], points[next], p, extreme):
-            # If the point 'p' is collinear with line
-            # segment 'i-next', then check if it lies
-            # on segment. If it lies, return true, otherwise false
-            if orientation(points[i], p, points[next]) == 0:
-                return on_segment(points[i], p, points[next])
+        # If the point 'p' is collinear with line
+        # segment 'i-next', then check if it lies
+        # on segment. If it lies, return true
+        if orientation((x1, y1), p, (x2, y2)) == 0 and on_segment((x1, y1), p, (x2, y2)):
+            return True
 
+        # Half-open test on y, so a vertex shared by
+        # two edges is never counted twice
+        if (y1 > py) != (y2 > py) and px < x1 + (py - y1) * (x2 - x1) / (y2 - y1):
             count += 1
 
-        i = next
+    # Return true if count is odd, false otherwise
+    return count % 2 == 1
 
-        if i == 0:
-            break
 
-    # Reduce the count by decrease amount
-    # as these points would have been added twice
-    count -= decrease
+def is_inside_polygon_batch(points: Sequence[_FPoint] | Sequence[Vector2], ps: Sequence[_FPoint] | Sequence[Vector2]) -> list[bool]:
+    """
+    Returns, for each point of ps, true if it lies
+    inside the polygon[] with n vertices
 
-    # Return true if count is odd, false otherwise
-    return count % 2 == 1
+    Points on an edge are considered inside, as with is_inside_polygon().
+    Uses NumPy when it is installed.
+    """
+
+    n = len(points)
+
+    if n < 3 or not ps:
+        return [False] * len(ps)
+
+    if numpy is None:
+        return [is_inside_polygon(points, p) for p in ps]
+
+    vertices = numpy.array([(v[0], v[1]) for v in points], dtype=numpy.float64)
+    px, py = numpy.array([(p[0], p[1]) for p in ps], dtype=numpy.float64).T[:, :, None]
+
+    # Edges 'i-next' as (1, n) rows, broadcast against the (len(ps), 1) columns
+    x1, y1 = vertices[:, 0][None, :], vertices[:, 1][None, :]
+    x2, y2 = numpy.roll(vertices[:, 0], -1)[None, :], numpy.roll(vertices[:, 1], -1)[None, :]
+
+    # Collinear with an edge and within its bounds
+    cross = (x2 - x1) * (py - y1) - (y2 - y1) * (px - x1)
+    on_edge = (
+        (cross == 0)
+        & (px >= numpy.minimum(x1, x2))
+        & (px <= numpy.maximum(x1, x2))
+        & (py >= numpy.minimum(y1, y2))
+        & (py <= numpy.maximum(y1, y2))
+    ).any(axis=1)
+
+    # Even-odd rule with a half-open test on y, so a vertex is never counted twice
+    straddle = (y1 > py) != (y2 > py)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        x_cross = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+        crossings = (straddle & (px < x_cross)).sum(axis=1)
+
+    return (on_edge | (crossings % 2 == 1)).tolist()
@@ -8,6 +8,7 @@ from __future__ import annotations
 __all__ = ["AbstractResourceLoader", "FontLoader", "ImageLoader", "MusicLoader", "SoundLoader"]
 
 from abc import abstractmethod
+from collections.abc import Callable
 
 from ..audio.music import Music
 from ..audio.sound import Sound
@@ -31,6 +32,14 @@ class AbstractResourceLoader[_T](Object):
     def load(self) -> _T:
         raise NotImplementedError
 
+    def preload(self) -> Callable[[], _T]:
+        """
+        Called by a worker thread of the background loading.
+        The returned callable is called from the main thread to complete the loading.
+        """
+        resource = self.load()
+        return lambda: resource
+
     @property
     def resource(self) -> Resource:
         return self.__resource
@@ -42,6 +51,10 @@ class ImageLoader(AbstractResourceLoader[Surface]):
     def load(self) -> Surface:
         return load_image_resource(self.resource, convert=True)
 
+    def preload(self) -> Callable[[], Surface]:
+        image = load_image_resource(self.resource, convert=False)
+        return image.convert_alpha
+
 
 class SoundLoader(AbstractResourceLoader[Sound]):
     __slots__ = ()
@@ -5,17 +5,19 @@
 
 from __future__ import annotations
 
-__all__ = ["ResourceManager", "ResourceManagerMeta"]
+__all__ = ["ResourceLoadingTask", "ResourceManager", "ResourceManagerMeta"]
 
 from collections import ChainMap
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import suppress
 from os import PathLike, fspath
+from queue import Empty, SimpleQueue
 from types import MappingProxyType
 from typing import AbstractSet, Any, NoReturn, final
 
 from ..system.namespace import ClassNamespace, ClassNamespaceMeta
-from ..system.object import mro
+from ..system.object import Object, mro
 from .abc import Resource, ResourcesLocation
 from .file import ResourcesDirectory
 from .loader import AbstractResourceLoader
@@ -85,6 +87,43 @@ class _ResourceDescriptor:
         with suppress(AttributeError):
             del self.__resource
 
+    def is_loaded(self) -> bool:
+        try:
+            self.__resource
+        except AttributeError:
+            return False
+        return True
+
+    def get_resource_loaders(self) -> list[AbstractResourceLoader[Any]]:
+        def iter_resource_loaders(resource_loader: _ResourceLoader) -> Iterator[AbstractResourceLoader[Any]]:
+            if isinstance(resource_loader, AbstractResourceLoader):
+                yield resource_loader
+            elif isinstance(resource_loader, tuple):
+                for loader in resource_loader:
+                    yield from iter_resource_loaders(loader)
+            else:
+                for loader in resource_loader.values():
+                    yield from iter_resource_loaders(loader)
+
+        return list(iter_resource_loaders(self.__loader))
+
+    def set_loaded_resources(self, resources: Sequence[Any]) -> None:
+        # 'resources' is in the get_resource_loaders() order
+        if len(resources) != self.__nb_resources:
+            raise ValueError("Resources count mismatch")
+        if self.is_loaded():
+            return
+        resources_it = iter(resources)
+
+        def build(resource_loader: _ResourceLoader) -> Any:
+            if isinstance(resource_loader, AbstractResourceLoader):
+                return next(resources_it)
+            if isinstance(resource_loader, tuple):
+                return tuple(build(loader) for loader in resource_loader)
+            return MappingProxyType({key: build(value) for key, value in resource_loader.items()})
+
+        self.__resource = build(self.__loader)
+
     @property
     def nb_resources(self) -> int:
         return self.__nb_resources
@@ -108,6 +147,130 @@ class _LazyAutoLoadResourceDescriptor(_ResourceDescriptor):
             return get_resource(obj, objtype)
 
 
+@final
+class ResourceLoadingTask(Object):
+    """
+    Background loading of resources, returned by ResourceManager.load_async() and ResourceManager.load_all_resources_async().
+
+    The resource files are read and decoded by a pool of worker threads. The loading is completed
+    (e.g. Surface.convert_alpha()) by poll() or wait(), which must be called from the main thread.
+    """
+
+    __slots__ = (
+        "__executor",
+        "__ready",
+        "__pending",
+        "__loaded",
+        "__total",
+        "__on_progress",
+        "__cancelled",
+    )
+
+    def __init__(
+        self,
+        resources: Sequence[_ResourceDescriptor],
+        *,
+        max_workers: int | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> None:
+        super().__init__()
+        self.__ready: SimpleQueue[tuple[_ResourceDescriptor, int, Future[Callable[[], Any]]]] = SimpleQueue()
+        self.__pending: dict[_ResourceDescriptor, list[Any]] = {}
+        self.__loaded: int = 0
+        self.__total: int = 0
+        self.__on_progress: Callable[[int, int], None] | None = on_progress
+        self.__cancelled: bool = False
+        self.__executor: ThreadPoolExecutor | None = None
+
+        resources = [resource for resource in dict.fromkeys(resources) if not resource.is_loaded()]
+        if not resources:
+            return
+        executor = self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ResourceLoader")
+        ready = self.__ready
+        for resource in resources:
+            resource_loaders = resource.get_resource_loaders()
+            self.__pending[resource] = [_NOT_LOADED] * len(resource_loaders)
+            self.__total += len(resource_loaders)
+            for index, resource_loader in enumerate(resource_loaders):
+                future = executor.submit(resource_loader.preload)
+                future.add_done_callback(lambda future, resource=resource, index=index: ready.put((resource, index, future)))  # type: ignore[misc]
+
+    def poll(self, timeout: float | None = 0) -> bool:
+        """
+        Completes the loading of the resources decoded meanwhile, then returns True if all the resources are loaded.
+
+        'timeout' is the maximum time to wait for the first decoded resource (None means forever).
+        """
+        if self.done():
+            return True
+        ready = self.__ready
+        pending = self.__pending
+        loaded: int = self.__loaded
+        try:
+            block: bool = timeout is None or timeout > 0
+            while True:
+                try:
+                    resource, index, future = ready.get(block=block, timeout=timeout)
+                except Empty:
+                    break
+                block = False
+                try:
+                    values = pending[resource]
+                    values[index] = future.result()()
+                except BaseException:
+                    self.cancel()
+                    raise
+                self.__loaded += 1
+                if all(value is not _NOT_LOADED for value in values):
+                    del pending[resource]
+                    resource.set_loaded_resources(values)
+        finally:
+            if self.__loaded != loaded and (on_progress := self.__on_progress) is not None:
+                on_progress(self.__loaded, self.__total)
+            if not pending:
+                self.__shutdown()
+        return self.done()
+
+    def wait(self) -> None:
+        while not self.poll(timeout=None):
+            continue
+
+    def cancel(self) -> None:
+        if self.done():
+            return
+        self.__cancelled = True
+        self.__pending.clear()
+        self.__shutdown()
+
+    def done(self) -> bool:
+        return not self.__pending
+
+    def cancelled(self) -> bool:
+        return self.__cancelled
+
+    def __shutdown(self) -> None:
+        executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def loaded(self) -> int:
+        return self.__loaded
+
+    @property
+    def total(self) -> int:
+        return self.__total
+
+    @property
+    def progress(self) -> float:
+        if self.__total == 0:
+            return 1.0
+        return self.__loaded / self.__total
+
+
+_NOT_LOADED: Any = object()
+
+
 class ResourceManagerMeta(ClassNamespaceMeta):
     def __new__[Self: ResourceManagerMeta](
         mcs: type[Self],
@@ -213,6 +376,29 @@ class ResourceManagerMeta(ClassNamespaceMeta):
         for resource in cls.__resources.values():
             resource.load()
 
+    def load_async(
+        cls,
+        *resources: str,
+        max_workers: int | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> ResourceLoadingTask:
+        resources_dict: dict[str, _ResourceDescriptor] = cls.__resources
+        if len(resources) != len(set(resources)):
+            raise ValueError("Resource name duplicate")
+        return ResourceLoadingTask(
+            [resources_dict[name] for name in resources],
+            max_workers=max_workers,
+            on_progress=on_progress,
+        )
+
+    def load_all_resources_async(
+        cls,
+        *,
+        max_workers: int | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> ResourceLoadingTask:
+        return ResourceLoadingTask(list(cls.__resources.values()), max_workers=max_workers, on_progress=on_progress)
+
     def unload(cls, *resources: str) -> None:
         resources_dict: dict[str, _ResourceDescriptor] = cls.__resources
         if len(resources) != len(set(resources)):
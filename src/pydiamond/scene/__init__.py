@@ -6,6 +6,9 @@
 from __future__ import annotations
 
 __all__ = [
+    "FramePhase",
+    "FrameProfiler",
+    "FrameStats",
     "MainScene",
     "ReturningSceneTransition",
     "ReturningSceneTransitionProtocol",
@@ -18,4 +21,5 @@ __all__ = [
 ]
 
 from .abc import *
+from .profiler import *
 from .window import *
@@ -259,6 +259,7 @@ class Scene(Object, metaclass=SceneMeta, no_slots=True):
     def on_start_loop(self) -> None:
         pass
 
+    @no_theme_decorator
     def fixed_update(self) -> None:
         pass
 
@@ -266,6 +267,7 @@ class Scene(Object, metaclass=SceneMeta, no_slots=True):
     def interpolation_update(self, interpolation: float) -> None:
         pass
 
+    @no_theme_decorator
     def update(self) -> None:
         pass
 
@@ -283,6 +285,10 @@ class Scene(Object, metaclass=SceneMeta, no_slots=True):
     def draw_scene(self, scene: type[Scene]) -> None:
         self.__manager.render(scene)
 
+    @final
+    def invalidate_snapshot(self) -> None:
+        self.__manager.invalidate_snapshot(self)
+
     def handle_event(self, event: Event) -> bool:
         return self.__event._process_event(event)
 
@@ -11,7 +11,7 @@ __all__ = [
 ]
 
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, final
+from typing import TYPE_CHECKING, Any, ClassVar, final
 
 from ..graphics.color import BLACK, TRANSPARENT, WHITE, Color
 from ..graphics.shape import RectangleShape
@@ -23,6 +23,18 @@ if TYPE_CHECKING:
 
 
 class Dialog(Scene):
+    __freeze_master: ClassVar[bool] = False
+
+    def __init_subclass__(cls, *, freeze_master: bool | None = None, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if freeze_master is not None:
+            cls.__freeze_master = bool(freeze_master)
+
+    @classmethod
+    @final
+    def require_frozen_master(cls) -> bool:
+        return cls.__freeze_master
+
     def __init__(self) -> None:
         super().__init__()
         self.__master: Scene
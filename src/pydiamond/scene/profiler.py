@@ -0,0 +1,155 @@
+# Copyright (c) 2021-2025, Francis Clairicia-Rose-Claire-Josephine
+#
+#
+"""Frame profiler module"""
+
+from __future__ import annotations
+
+__all__ = ["FramePhase", "FrameProfiler", "FrameStats"]
+
+import json
+import math
+from array import array
+from enum import IntEnum, unique
+from os import PathLike
+from time import perf_counter_ns
+from typing import Any, Final, NamedTuple, final
+
+from ..system.object import Object
+
+
+@unique
+class FramePhase(IntEnum):
+    # Declared in the execution order within a frame
+    EVENTS = 0
+    FIXED_UPDATE = 1
+    INTERPOLATION_UPDATE = 2
+    UPDATE = 3
+    RENDER = 4
+    REFRESH = 5
+
+
+class FrameStats(NamedTuple):
+    frames: int
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+_NB_PHASES: Final[int] = len(FramePhase)
+_FRAME_START: Final[int] = 0
+_FRAME_END: Final[int] = 1
+_STRIDE: Final[int] = 2 + _NB_PHASES
+
+
+@final
+class FrameProfiler(Object):
+    """
+    Records the duration of each phase of the last frames in a fixed-size ring buffer.
+
+    All the durations are stored in nanoseconds. The statistics are given in milliseconds.
+    """
+
+    __slots__ = ("__capacity", "__buffer", "__index", "__count", "__last", "__frame")
+
+    DEFAULT_CAPACITY: Final[int] = 600
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        super().__init__()
+        capacity = int(capacity)
+        if capacity <= 0:
+            raise ValueError("capacity must be a strictly positive integer")
+        self.__capacity: int = capacity
+        self.__buffer: array[int] = array("q", bytes(8 * _STRIDE * capacity))
+        self.__index: int = 0
+        self.__count: int = 0
+        self.__last: int = 0
+        self.__frame: int = -1
+
+    def start_frame(self) -> None:
+        buffer = self.__buffer
+        offset = self.__index * _STRIDE
+        buffer[offset : offset + _STRIDE] = _EMPTY_FRAME
+        buffer[offset + _FRAME_START] = self.__last = perf_counter_ns()
+        self.__frame = offset
+
+    def lap(self, phase: int) -> None:
+        if (frame := self.__frame) < 0:  # Not within a frame
+            return
+        now = perf_counter_ns()
+        self.__buffer[frame + 2 + phase] += now - self.__last
+        self.__last = now
+
+    def end_frame(self) -> None:
+        if (frame := self.__frame) < 0:
+            return
+        self.__buffer[frame + _FRAME_END] = perf_counter_ns()
+        self.__frame = -1
+        self.__index = (self.__index + 1) % self.__capacity
+        self.__count = min(self.__count + 1, self.__capacity)
+
+    def clear(self) -> None:
+        self.__frame = -1
+        self.__index = 0
+        self.__count = 0
+
+    def get_frame_stats(self) -> FrameStats:
+        return _compute_stats([end - start for start, end, *_ in self.__get_frames()])
+
+    def get_phase_stats(self, phase: FramePhase) -> FrameStats:
+        phase = FramePhase(phase)
+        return _compute_stats([frame[2 + phase] for frame in self.__get_frames()])
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        events: list[dict[str, Any]] = []
+        for start, end, *phases in self.__get_frames():
+            events.append({"name": "frame", "ph": "X", "ts": start / 1000, "dur": (end - start) / 1000, "pid": 0, "tid": 0})
+            phase_start = start
+            for phase, duration in zip(FramePhase, phases, strict=True):
+                if duration:
+                    events.append(
+                        {
+                            "name": phase.name.lower(),
+                            "ph": "X",
+                            "ts": phase_start / 1000,
+                            "dur": duration / 1000,
+                            "pid": 0,
+                            "tid": 0,
+                        }
+                    )
+                phase_start += duration
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, file: str | PathLike[str]) -> None:
+        with open(file, "w", encoding="utf-8") as fp:
+            json.dump(self.to_chrome_trace(), fp)
+
+    def __get_frames(self) -> list[array[int]]:
+        buffer = self.__buffer
+        capacity = self.__capacity
+        first = (self.__index - self.__count) % capacity
+        return [buffer[i * _STRIDE : (i + 1) * _STRIDE] for i in ((first + n) % capacity for n in range(self.__count))]
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    @property
+    def frame_count(self) -> int:
+        return self.__count
+
+
+_EMPTY_FRAME: Final[array[int]] = array("q", bytes(8 * _STRIDE))
+
+
+def _compute_stats(durations: list[int]) -> FrameStats:
+    if not durations:
+        return FrameStats(0, 0, 0, 0, 0)
+    durations.sort()
+    count = len(durations)
+
+    def percentile(p: float) -> float:
+        return durations[max(math.ceil(p / 100 * count) - 1, 0)] / 1e6
+
+    return FrameStats(count, percentile(50), percentile(95), percentile(99), durations[-1] / 1e6)
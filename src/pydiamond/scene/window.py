@@ -28,6 +28,7 @@ from ..window.display import Window, WindowCallback, WindowError
 from ..window.event import Event, EventManager
 from .abc import ReturningSceneTransitionProtocol, Scene, SceneTransitionCoroutine, SceneTransitionProtocol
 from .dialog import Dialog
+from .profiler import FramePhase, FrameProfiler
 
 
 class SceneWindow(Window):
@@ -50,6 +51,7 @@ class SceneWindow(Window):
         self.__reset_interpolation_data()
         self.__running: bool = False
         self.__event = EventManager()
+        self.__profiler: FrameProfiler | None = None
 
         def handle_mouse_position(self: SceneWindow, mouse_pos: tuple[int, int], /) -> None:
             self.__event._handle_mouse_position(mouse_pos)
@@ -127,9 +129,21 @@ class SceneWindow(Window):
             del on_start_loop
             while loop():
                 try:
-                    process_events()
-                    update_and_render_scene(fixed_update=True, interpolation_update=True)
-                    refresh_screen()
+                    if (profiler := self.__profiler) is None:
+                        process_events()
+                        update_and_render_scene(fixed_update=True, interpolation_update=True)
+                        refresh_screen()
+                    else:
+                        profiler.start_frame()
+                        try:
+                            process_events()
+                            profiler.lap(FramePhase.EVENTS)
+                            update_and_render_scene(fixed_update=True, interpolation_update=True)
+                            refresh_screen()
+                            profiler.lap(FramePhase.REFRESH)
+                        finally:
+                            profiler.end_frame()
+                        del profiler
                 except _SceneManager.NewScene as exc:
                     assert exc.previous_scene is not None, "Previous scene must not be None"
                     try:
@@ -208,15 +222,24 @@ class SceneWindow(Window):
         scene: Scene | None = self.__scenes.top()
         if scene is None:
             return
+        profiler: FrameProfiler | None = self.__profiler
         if fixed_update:
             scene_fixed_update = scene.fixed_update
             for _ in range(self.__nb_fixed_update_call):
                 scene_fixed_update()
             del scene_fixed_update
+            if profiler is not None:
+                profiler.lap(FramePhase.FIXED_UPDATE)
             if interpolation_update:
                 scene.interpolation_update(self.__alpha_interpolation)
+                if profiler is not None:
+                    profiler.lap(FramePhase.INTERPOLATION_UPDATE)
         scene.update()
+        if profiler is not None:
+            profiler.lap(FramePhase.UPDATE)
         self.__scenes._render(scene)
+        if profiler is not None:
+            profiler.lap(FramePhase.RENDER)
 
     @final
     def start_scene(
@@ -254,6 +277,14 @@ class SceneWindow(Window):
                 return framerate
         return super().used_framerate()
 
+    @final
+    def get_profiler(self) -> FrameProfiler | None:
+        return self.__profiler
+
+    @final
+    def set_profiler(self, profiler: FrameProfiler | None) -> None:
+        self.__profiler = profiler
+
     @final
     def get_default_fixed_framerate(self) -> int:
         return self.__default_fixed_framerate
@@ -364,6 +395,7 @@ class _SceneManager:
         self.__returning_transitions: dict[type[Scene], ReturningSceneTransitionProtocol] = {}
         self.__awaken: set[Scene] = set()
         self.__dialogs: deque[Dialog] = deque()
+        self.__master_snapshots: dict[Dialog, tuple[Surface, bool]] = {}
 
     def __new_scene[_S: Scene](self, cls: type[_S]) -> _S:
         if not issubclass(cls, Scene):
@@ -461,12 +493,39 @@ class _SceneManager:
 
     def _render(self, scene: Scene, *, fill_background_color: bool = True) -> None:
         if self._is_dialog(scene):
-            self._render(scene.master, fill_background_color=fill_background_color)
+            if scene.require_frozen_master():
+                self.__render_master_snapshot(scene, fill_background_color=fill_background_color)
+            else:
+                self._render(scene.master, fill_background_color=fill_background_color)
             self.window.clear(scene.background_color, blend_alpha=True)
         elif fill_background_color:
             self.window.clear(scene.background_color)
         scene.render()
 
+    def __render_master_snapshot(self, dialog: Dialog, *, fill_background_color: bool) -> None:
+        # The master scene is paused while the dialog is open: its last frame is rendered once and reused
+        window = self.window
+        renderer = window.renderer
+        try:
+            snapshot, snapshot_filled = self.__master_snapshots[dialog]
+        except KeyError:
+            pass
+        else:
+            if snapshot_filled is fill_background_color and snapshot.get_size() == window.size:
+                renderer.draw_surface(snapshot, (0, 0))
+                return
+        with renderer.capture(draw_on_default_at_end=True) as snapshot:
+            self._render(dialog.master, fill_background_color=fill_background_color)
+        self.__master_snapshots[dialog] = (snapshot, fill_background_color)
+
+    def invalidate_snapshot(self, scene: Scene) -> None:
+        master_snapshots = self.__master_snapshots
+        for dialog in self.__dialogs:
+            if dialog.master is scene:
+                master_snapshots.pop(dialog, None)
+                # Dialogs over this one also rendered it in their own snapshot
+                self.invalidate_snapshot(dialog)
+
     def go_to(
         self,
         scene_cls: type[Scene],
@@ -548,6 +607,7 @@ class _SceneManager:
             exit_stack.callback(self.__delete_scene, dialog)
             dialogs_stack.insert(0, dialog)
             exit_stack.callback(dialogs_stack.remove, dialog)
+            exit_stack.callback(self.__master_snapshots.pop, dialog, None)
             self.__awake_scene(dialog, awake_kwargs)
             exit_stack.callback(self.__exit_scene, dialog)
 
@@ -594,6 +654,7 @@ class _SceneWindowCallback(WindowCallback):
         except AttributeError:  # killed
             return
         if not scene.looping():
+            # The due time is kept, so the callback is called as soon as the scene is resumed
             return
         return super().__call__()
 
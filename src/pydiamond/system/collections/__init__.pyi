@@ -45,6 +45,16 @@ class SortedDict[_KT: SupportsRichComparison, _VT](dict[_KT, _VT]):
     def keys(self) -> SortedDictKeysView[_KT, _VT]: ...
     def values(self) -> SortedDictValuesView[_KT, _VT]: ...
     def items(self) -> SortedDictItemsView[_KT, _VT]: ...
+    def bisect_left(self, key: _KT) -> int: ...
+    def bisect_right(self, key: _KT) -> int: ...
+    def bisect(self, key: _KT) -> int: ...
+    def irange(
+        self,
+        minimum: _KT | None = ...,
+        maximum: _KT | None = ...,
+        inclusive: tuple[bool, bool] = ...,
+        reverse: bool = ...,
+    ) -> Iterator[_KT]: ...
 
 class ChainMapProxy[_KT, _VT](Mapping[_KT, _VT]):
     maps: list[Mapping[_KT, _VT]]
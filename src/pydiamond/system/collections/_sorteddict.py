@@ -8,7 +8,7 @@ from __future__ import annotations
 __all__ = ["SortedDict", "SortedDictItemsView", "SortedDictKeysView", "SortedDictValuesView"]
 
 import reprlib
-from bisect import insort_right as insort
+from bisect import bisect_left, bisect_right, insort_right as insort
 from collections.abc import ItemsView, Iterator, KeysView, Reversible, ValuesView
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Self
@@ -17,6 +17,9 @@ if TYPE_CHECKING:
     from _typeshed import SupportsRichComparison
 
 
+_MISSING: Any = object()
+
+
 class SortedDictKeysView[_KT](KeysView[_KT], Reversible[_KT]):
     __slots__ = ()
     _mapping: dict[Any, Any]
@@ -77,17 +80,18 @@ class SortedDict[_KT: SupportsRichComparison, _VT](dict[_KT, _VT]):
         yield from reversed(self.__list)
 
     def __setitem__(self, __k: Any, __v: Any, /) -> None:
+        if super().__contains__(__k):
+            return super().__setitem__(__k, __v)
         super().__setitem__(__k, __v)
-        if __k not in self.__list:
-            try:
-                insort(self.__list, __k)
-            except BaseException:
-                super().__delitem__(__k)
-                raise
+        try:
+            insort(self.__list, __k)
+        except BaseException:
+            super().__delitem__(__k)
+            raise
 
     def __delitem__(self, __k: Any, /) -> None:
         super().__delitem__(__k)
-        self.__list.remove(__k)
+        self.__remove_key(__k)
 
     def clear(self) -> None:
         super().clear()
@@ -97,11 +101,12 @@ class SortedDict[_KT: SupportsRichComparison, _VT](dict[_KT, _VT]):
         return self.__class__(self)
 
     def pop(self, __key: Any, /, *__default: Any) -> Any:
-        value = super().pop(__key, *__default)
-        try:
-            self.__list.remove(__key)
-        except ValueError:
-            pass
+        if len(__default) > 1:
+            raise TypeError(f"pop expected at most 2 arguments, got {len(__default) + 1}")
+        value = super().pop(__key, _MISSING)
+        if value is _MISSING:
+            return super().pop(__key, *__default)  # keep default behavior (return default or raise KeyError)
+        self.__remove_key(__key)
         return value
 
     def popitem(self) -> tuple[Any, Any]:
@@ -111,13 +116,14 @@ class SortedDict[_KT: SupportsRichComparison, _VT](dict[_KT, _VT]):
         return key, super().pop(key)
 
     def setdefault(self, __key: Any, /, *__default: Any) -> Any:
+        if super().__contains__(__key):
+            return super().__getitem__(__key)
         value = super().setdefault(__key, *__default)
-        if __key not in self.__list:
-            try:
-                insort(self.__list, __key)
-            except BaseException:
-                super().__delitem__(__key)
-                raise
+        try:
+            insort(self.__list, __key)
+        except BaseException:
+            super().__delitem__(__key)
+            raise
         return value
 
     def update(self, *__m: Any, **kwargs: Any) -> None:
@@ -128,6 +134,35 @@ class SortedDict[_KT: SupportsRichComparison, _VT](dict[_KT, _VT]):
         super().update(payload)
         self.__list = keys
 
+    def bisect_left(self, key: Any) -> int:
+        return bisect_left(self.__list, key)
+
+    def bisect_right(self, key: Any) -> int:
+        return bisect_right(self.__list, key)
+
+    bisect = bisect_right
+
+    def irange(
+        self,
+        minimum: Any = None,
+        maximum: Any = None,
+        inclusive: tuple[bool, bool] = (True, True),
+        reverse: bool = False,
+    ) -> Iterator[Any]:
+        keys = self.__list
+        start: int = 0
+        stop: int = len(keys)
+        if minimum is not None:
+            start = bisect_left(keys, minimum) if inclusive[0] else bisect_right(keys, minimum)
+        if maximum is not None:
+            stop = bisect_right(keys, maximum) if inclusive[1] else bisect_left(keys, maximum)
+        keys = keys[start:stop]
+        return reversed(keys) if reverse else iter(keys)
+
+    def __remove_key(self, key: Any) -> None:
+        keys = self.__list
+        del keys[bisect_left(keys, key)]
+
     def __ior__(self, __value: Any) -> Self:  # type: ignore[override,misc]
         self.update(__value)
         return self
@@ -27,7 +27,7 @@ import re
 import reprlib
 from collections import ChainMap
 from collections.abc import Callable, Hashable, Iterator, Mapping, MutableMapping, Sequence
-from contextlib import ExitStack, contextmanager, suppress
+from contextlib import AbstractContextManager, ExitStack, contextmanager, suppress
 from dataclasses import KW_ONLY, dataclass, field
 from enum import Enum
 from functools import cache, update_wrapper, wraps
@@ -333,6 +333,9 @@ class ConfigurationTemplate(Object):
     def known_options(self) -> frozenset[str]:
         return self.__template.options
 
+    def batch(self, obj: Any) -> AbstractContextManager[None]:
+        return self.__get__(obj).batch()
+
     def known_aliases(self) -> frozenset[str]:
         return frozenset(self.__template.aliases)
 
@@ -2196,6 +2199,7 @@ class ConfigurationInfo[_T](Object):
     readonly_options: Set[str] = field(default_factory=frozenset)
 
     _sections_map: MappingProxyType[str, Section[_T, Any]] = field(init=False, repr=False)
+    _hookless_options: frozenset[str] = field(init=False, repr=False)
     _default_comparator: Callable[[_T, Any, Any], bool] = field(init=False, repr=False, default=(lambda _, lhs, rhs: lhs == rhs))
 
     __hash__ = None  # type: ignore[assignment]
@@ -2215,6 +2219,16 @@ class ConfigurationInfo[_T](Object):
         section_name_conflict: set[str] = set(self.options).intersection(self._sections_map)
         if section_name_conflict:
             raise ConfigurationError(f"Section name conflict with options for the following: {', '.join(section_name_conflict)}")
+        hookless_options: frozenset[str] = frozenset()
+        if not self.main_object_update_hooks:
+            hookless_options = frozenset(
+                option
+                for option in self.options
+                if not self.option_value_update_hooks.get(option)
+                and not self.option_update_hooks.get(option)
+                and not self.option_delete_hooks.get(option)
+            )
+        setattr(self, "_hookless_options", hookless_options)
 
     def get_owner_class(self, default_objtype: type) -> type:
         if (owner := self.owner_cls) is not None:
@@ -2398,6 +2412,7 @@ class _UpdateRegister(Object):
 class Configuration[_T](NonCopyable):
     __update_stack: ClassVar[dict[object, set[str]]] = dict()
     __init_context: ClassVar[set[object]] = set()
+    __batch_context: ClassVar[set[object]] = set()
     __update_context: ClassVar[dict[object, _UpdateRegister]] = dict()
     __lock_cache: ClassVar[WeakKeyDictionary[object, RLock]] = WeakKeyDictionary()
     __default_lock: ClassVar[RLock] = RLock()
@@ -2518,9 +2533,21 @@ class Configuration[_T](NonCopyable):
     def set(self, option: str, value: Any) -> None:
         obj: _T = self.__self__
         info: ConfigurationInfo[_T] = self.__info
+        objtype: type = self.__objtype
+
+        if option in info._hookless_options and not self.__sections:
+            # Nothing to notify: skip the comparison and the update context
+            with self.__lazy_lock(obj):
+                descriptor = info.get_value_setter(option, objtype)
+                for value_validator in info.value_validator.get(option, ()):
+                    value_validator(obj, value)
+                for value_converter in info.value_converter_on_set.get(option, ()):
+                    value = value_converter(obj, value)
+                descriptor.__set__(obj, value)
+            return
+
         section, option, updating_option = self._parse_option_with_format(option)
 
-        objtype: type = self.__objtype
         with self.__updating_option(obj, updating_option, info, sections=self.__sections) as update_context:
             if section:
                 section_config = info.get_section(section).config(self)
@@ -2861,6 +2888,29 @@ class Configuration[_T](NonCopyable):
                 for main_updater in info.main_object_update_hooks:
                     main_updater(obj)
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        if self.__sections:
+            raise ConfigurationError("A section configuration cannot be in batch context")
+
+        obj: _T = self.__self__
+
+        if obj in Configuration.__init_context or obj in Configuration.__batch_context:
+            yield
+            return
+
+        with self.__lazy_lock(obj):
+            with ExitStack() as stack:
+                Configuration.__batch_context.add(obj)
+                stack.callback(Configuration.__batch_context.discard, obj)
+                yield
+            if obj in Configuration.__update_stack:  # The outermost update will call the hooks
+                return
+            update_register = Configuration.__update_context.pop(obj, None)
+            if not update_register:
+                return
+            self.__call_update_hooks(obj, self.__info, update_register)
+
     @contextmanager
     def temporary_options(self, __with_updaters: bool = True, /, **kwargs: Any) -> Iterator[MappingProxyType[str, Any]]:
         obj: _T = self.__self__
@@ -2900,6 +2950,10 @@ class Configuration[_T](NonCopyable):
     def has_initialization_context(self) -> bool:
         return self.__self__ in Configuration.__init_context
 
+    @final
+    def has_batch_context(self) -> bool:
+        return self.__self__ in Configuration.__batch_context
+
     @final
     def is_updating_options(self) -> bool:
         return self.__self__ in Configuration.__update_context
@@ -3083,19 +3137,23 @@ class Configuration[_T](NonCopyable):
             with ExitStack() as stack:
                 stack.callback(cleanup, obj)
                 yield UpdateContext(first_call=True, register=update_register, sections=sections_context)
-            if update_stack:
+            if update_stack or obj in cls.__batch_context:
                 return
             update_register = cls.__update_context.pop(obj, update_register)
             if not update_register:
                 return
-            for option_deleted in info.get_options_delete_hooks(*update_register.deleted):
-                option_deleted(obj)
-            for option_updater in info.get_options_update_hooks(*update_register.modified):
-                option_updater(obj)
-            for section_updater in info.get_sections_update_hooks(*update_register.modified, *update_register.deleted):
-                section_updater(obj)
-            for main_updater in info.main_object_update_hooks:
-                main_updater(obj)
+            cls.__call_update_hooks(obj, info, update_register)
+
+    @staticmethod
+    def __call_update_hooks(obj: object, info: ConfigurationInfo[Any], update_register: _UpdateRegister) -> None:
+        for option_deleted in info.get_options_delete_hooks(*update_register.deleted):
+            option_deleted(obj)
+        for option_updater in info.get_options_update_hooks(*update_register.modified):
+            option_updater(obj)
+        for section_updater in info.get_sections_update_hooks(*update_register.modified, *update_register.deleted):
+            section_updater(obj)
+        for main_updater in info.main_object_update_hooks:
+            main_updater(obj)
 
     @classmethod
     @contextmanager
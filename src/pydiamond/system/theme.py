@@ -22,7 +22,7 @@ __all__ = [
 
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict, deque
-from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping, Sequence
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, MutableMapping, Sequence
 from contextlib import suppress
 from functools import cached_property
 from inspect import Parameter, Signature
@@ -31,6 +31,7 @@ from re import Match, Pattern, compile as re_compile
 from threading import RLock
 from types import FunctionType, LambdaType, MappingProxyType
 from typing import Any, ClassVar, Final, NamedTuple, Self, final, overload
+from weakref import WeakKeyDictionary
 
 from .object import Object, ObjectMeta, mro
 from .utils._mangling import getattr_pv
@@ -44,10 +45,12 @@ type _ClassThemeDictProxy = MappingProxyType[type, _ClassThemeProxy]
 type _ClassDefaultTheme = Sequence[str]
 type _ClassDefaultThemeDict = MutableMapping[type, _ClassDefaultTheme]
 type _ClassDefaultThemeDictProxy = MappingProxyType[type, _ClassDefaultTheme]
+type _CompiledThemeOptions = dict[tuple[tuple[str, ...], Hashable], dict[str, Any]]
 
 
 class _ThemeNamespaceBackupItem(NamedTuple):
     name: str | None
+    state: Hashable
     theme_dict: _ClassThemeDict
     default_theme_dict: _ClassDefaultThemeDict
 
@@ -61,6 +64,8 @@ class ThemeNamespace(Object):
     __DEFAULT_THEME_DEFAULT_DICT: Final[_ClassDefaultThemeDict] = __DEFAULT_THEME
     __DEFAULT_THEME_DICT_NAMESPACE: Final[defaultdict[str, _ClassDefaultThemeDict]] = defaultdict(dict)
     __actual_namespace: ClassVar[str | None] = None
+    # Identifies the themes currently visible: the namespace name, and the previous state if it is extended.
+    __actual_state: ClassVar[Hashable] = None
 
     def __init__(self, namespace: str, *, extend: bool = False, include_none_namespace: bool = True) -> None:
         if not namespace:
@@ -74,14 +79,16 @@ class ThemeNamespace(Object):
         with ThemeNamespace.get_lock():
             save_namespace = _ThemeNamespaceBackupItem(
                 name=ThemeNamespace.__actual_namespace,
+                state=ThemeNamespace.__actual_state,
                 theme_dict=ThemeNamespace.__THEMES,
                 default_theme_dict=ThemeNamespace.__DEFAULT_THEME,
             )
             self.__save_namespaces.append(save_namespace)
-            ThemeNamespace.__actual_namespace = namespace = self.__namespace
+            ThemeNamespace.__actual_namespace = ThemeNamespace.__actual_state = namespace = self.__namespace
             ThemeNamespace.__THEMES = ThemeNamespace.__THEMES_DICT_NAMESPACE[namespace]
             ThemeNamespace.__DEFAULT_THEME = ThemeNamespace.__DEFAULT_THEME_DICT_NAMESPACE[namespace]
             if self.__extend and (self.__include_none_namespace or save_namespace.name is not None):
+                ThemeNamespace.__actual_state = (namespace, save_namespace.state)
                 ThemeNamespace.__THEMES = self.__extend_theme_dict(
                     ThemeNamespace.__THEMES,
                     save_namespace.theme_dict,
@@ -101,11 +108,19 @@ class ThemeNamespace(Object):
             ThemeNamespace.__THEMES = save_namespace.theme_dict
             ThemeNamespace.__DEFAULT_THEME = save_namespace.default_theme_dict
             ThemeNamespace.__actual_namespace = save_namespace.name
+            ThemeNamespace.__actual_state = save_namespace.state
 
     @staticmethod
     def get_actual_namespace_name() -> str | None:
         return ThemeNamespace.__actual_namespace
 
+    def is_active(self) -> bool:
+        # i.e. entering this namespace would not change the visible themes
+        namespace = self.__namespace
+        if ThemeNamespace.__actual_namespace != namespace:
+            return False
+        return self.__extend or ThemeNamespace.__actual_state == namespace
+
     @staticmethod
     def get_theme_dict(namespace: str | None) -> _ClassThemeDictProxy:
         theme_dict: _ClassThemeDict
@@ -393,6 +408,10 @@ class ThemedObjectMeta(ObjectMeta):
     __CLASSES_NOT_USING_PARENT_THEMES: Final[set[type]] = set()
     __CLASSES_NOT_USING_PARENT_DEFAULT_THEMES: Final[set[type]] = set()
 
+    # Resolved theme options used by __call__(), per class and per (themes, namespace state)
+    __COMPILED_THEME_OPTIONS: Final[WeakKeyDictionary[type, _CompiledThemeOptions]] = WeakKeyDictionary()
+    __THEME_INIT_PARAMETERS: Final[WeakKeyDictionary[type, frozenset[str]]] = WeakKeyDictionary()
+
     def __new__[Self: ThemedObjectMeta](
         mcs: type[Self],
         name: str,
@@ -476,9 +495,7 @@ class ThemedObjectMeta(ObjectMeta):
             assert all(isinstance(t, str) for t in theme), "Themes must be str objects"
             assert not any(t is NoTheme for t in theme), "The 'NoTheme' special value is in the sequence"
 
-        theme_kwargs: dict[str, Any] = cls.get_theme_options(
-            *theme, parent_themes=True, use_default_themes=True, use_parent_default_themes=True, ignore_unusable=True
-        )
+        theme_kwargs: dict[str, Any] = ThemedObjectMeta.__get_compiled_theme_options(cls, theme)
         if theme_kwargs:
             kwargs = theme_kwargs | kwargs
         return create_object(*args, **kwargs)
@@ -524,6 +541,7 @@ class ThemedObjectMeta(ObjectMeta):
             if options is None or not update:
                 with ThemeNamespace.get_lock():
                     _THEMES.pop(cls, None)
+                    ThemedObjectMeta.__COMPILED_THEME_OPTIONS.clear()
             return
 
         if "theme" in options:
@@ -569,6 +587,7 @@ class ThemedObjectMeta(ObjectMeta):
                 theme_dict[name] = MappingProxyType(options.copy())
             else:
                 theme_dict[name] = MappingProxyType(theme_dict[name] | options)
+            ThemedObjectMeta.__COMPILED_THEME_OPTIONS.clear()
 
     @overload
     def set_default_theme(cls, name: str, /, *names: str, update: bool = False) -> None: ...
@@ -588,6 +607,7 @@ class ThemedObjectMeta(ObjectMeta):
                 raise TypeError("Invalid arguments")
             with ThemeNamespace.get_lock():
                 _DEFAULT_THEME.pop(cls, None)
+                ThemedObjectMeta.__COMPILED_THEME_OPTIONS.clear()
             return
         default_themes: dict[str, None] = dict.fromkeys([name, *names])
         if any(theme is NoTheme for theme in default_themes):
@@ -597,6 +617,7 @@ class ThemedObjectMeta(ObjectMeta):
                 _DEFAULT_THEME[cls] = tuple(default_themes)
             else:
                 _DEFAULT_THEME[cls] = tuple(dict.fromkeys((*_DEFAULT_THEME[cls], *default_themes)))
+            ThemedObjectMeta.__COMPILED_THEME_OPTIONS.clear()
 
     def get_theme_options(
         cls,
@@ -642,22 +663,10 @@ class ThemedObjectMeta(ObjectMeta):
         if not theme_kwargs or not ignore_unusable:
             return theme_kwargs
 
-        default_init_method: Callable[[object], None] = object.__init__
-        init_method: Callable[..., None] = getattr(cls, "__init__", default_init_method)
-
-        if init_method is default_init_method:
-            theme_kwargs.clear()
-        else:
-            sig: Signature = Signature.from_callable(init_method, follow_wrapped=True)
-            parameters: Mapping[str, Parameter] = sig.parameters
-
-            for option in tuple(theme_kwargs):
-                if option not in parameters:
-                    theme_kwargs.pop(option)
-                    continue
-                param: Parameter = parameters[option]
-                if param.kind is not Parameter.KEYWORD_ONLY or param.default is Parameter.empty:
-                    theme_kwargs.pop(option)
+        usable_parameters: frozenset[str] = ThemedObjectMeta.__get_theme_init_parameters(cls)
+        for option in tuple(theme_kwargs):
+            if option not in usable_parameters:
+                theme_kwargs.pop(option)
 
         return theme_kwargs
 
@@ -706,8 +715,49 @@ class ThemedObjectMeta(ObjectMeta):
             cls.__CLASSES_NOT_USING_PARENT_THEMES.discard(subclass)
         if not getattr(subclass, "_no_parent_default_theme_", False):
             cls.__CLASSES_NOT_USING_PARENT_DEFAULT_THEMES.discard(subclass)
+        with ThemeNamespace.get_lock():
+            ThemedObjectMeta.__COMPILED_THEME_OPTIONS.clear()
         return subclass
 
+    @staticmethod
+    def __get_compiled_theme_options(cls: ThemedObjectMeta, themes: tuple[str, ...]) -> dict[str, Any]:
+        # NOTE: The returned dict is shared and must not be modified.
+        key = (themes, getattr_pv(ThemeNamespace, "actual_state"))
+        try:
+            return ThemedObjectMeta.__COMPILED_THEME_OPTIONS[cls][key]
+        except KeyError:
+            pass
+        with ThemeNamespace.get_lock():
+            theme_kwargs: dict[str, Any] = cls.get_theme_options(
+                *themes, parent_themes=True, use_default_themes=True, use_parent_default_themes=True, ignore_unusable=True
+            )
+            ThemedObjectMeta.__COMPILED_THEME_OPTIONS.setdefault(cls, {})[key] = theme_kwargs
+        return theme_kwargs
+
+    @staticmethod
+    def __get_theme_init_parameters(cls: ThemedObjectMeta) -> frozenset[str]:
+        # Keyword-only parameters with a default value, i.e. the ones a theme can give
+        try:
+            return ThemedObjectMeta.__THEME_INIT_PARAMETERS[cls]
+        except KeyError:
+            pass
+
+        default_init_method: Callable[[object], None] = object.__init__
+        init_method: Callable[..., None] = getattr(cls, "__init__", default_init_method)
+
+        usable_parameters: frozenset[str]
+        if init_method is default_init_method:
+            usable_parameters = frozenset()
+        else:
+            sig: Signature = Signature.from_callable(init_method, follow_wrapped=True)
+            usable_parameters = frozenset(
+                name
+                for name, param in sig.parameters.items()
+                if param.kind is Parameter.KEYWORD_ONLY and param.default is not Parameter.empty
+            )
+        ThemedObjectMeta.__THEME_INIT_PARAMETERS[cls] = usable_parameters
+        return usable_parameters
+
     @staticmethod
     def __get_all_parent_classes(cls: ThemedObjectMeta, *, do_not_search_for: set[type]) -> Sequence[ThemedObjectMeta]:
         if cls in do_not_search_for:
@@ -740,6 +790,9 @@ class ClassWithThemeNamespaceMeta(ObjectMeta):
 
     __unique_theme_namespace_cache: Final[dict[str, ThemeNamespace]] = dict()
 
+    # Namespace used by the decorated methods, resolved once per class
+    __resolved_namespaces: Final[dict[type, ThemeNamespace]] = dict()
+
     _theme_decorator_exempt_: frozenset[str]
 
     def __new__[Self: ClassWithThemeNamespaceMeta](
@@ -817,6 +870,7 @@ class ClassWithThemeNamespaceMeta(ObjectMeta):
             extend=bool(allow_extension),
             include_none_namespace=bool(include_none_namespace),
         )
+        ClassWithThemeNamespaceMeta.__resolved_namespaces.pop(cls, None)
 
     @final
     @concreteclassmethod
@@ -827,6 +881,7 @@ class ClassWithThemeNamespaceMeta(ObjectMeta):
     @concreteclassmethod
     def remove_theme_namespace(cls) -> None:
         ClassWithThemeNamespaceMeta.__namespaces.pop(cls, None)
+        ClassWithThemeNamespaceMeta.__resolved_namespaces.pop(cls, None)
 
     @final
     @concreteclassmethod
@@ -871,6 +926,7 @@ class ClassWithThemeNamespaceMeta(ObjectMeta):
 
         all_theme_namespaces: dict[type, ThemeNamespace] = ClassWithThemeNamespaceMeta.__namespaces
         unique_theme_namespace_cache: dict[str, ThemeNamespace]
+        resolved_theme_namespaces: dict[type, ThemeNamespace] = ClassWithThemeNamespaceMeta.__resolved_namespaces
 
         unique_theme_namespace_cache = ClassWithThemeNamespaceMeta.__unique_theme_namespace_cache
 
@@ -887,10 +943,18 @@ class ClassWithThemeNamespaceMeta(ObjectMeta):
                 unique_theme_namespace_cache[namespace] = theme_namespace
                 return theme_namespace
 
+        def resolve_theme_namespace(cls: type) -> ThemeNamespace:
+            theme_namespace = all_theme_namespaces.get(cls) or get_unique_theme_namespace(cls)
+            resolved_theme_namespaces[cls] = theme_namespace
+            return theme_namespace
+
         @wraps(func)
         def wrapper(__cls_or_self: Any, /, *args: Any, **kwargs: Any) -> Any:
             cls: type = get_cls(__cls_or_self)
-            with all_theme_namespaces.get(cls) or get_unique_theme_namespace(cls):
+            theme_namespace = resolved_theme_namespaces.get(cls) or resolve_theme_namespace(cls)
+            if theme_namespace.is_active():  # e.g. a decorated method calling another one
+                return func(__cls_or_self, *args, **kwargs)
+            with theme_namespace:
                 return func(__cls_or_self, *args, **kwargs)
 
         return wrapper
@@ -16,6 +16,7 @@ from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
 from contextlib import AbstractContextManager as ContextManager, ExitStack, contextmanager, suppress
 from dataclasses import dataclass
 from datetime import datetime
+from heapq import heapify, heappop, heappush
 from inspect import isgeneratorfunction
 from itertools import count as itertools_count, filterfalse
 from typing import (
@@ -38,9 +39,13 @@ import pygame.key as _pg_key
 import pygame.mouse as _pg_mouse
 from pygame import error as _pg_error
 from pygame.constants import (
+    CONTROLLERAXISMOTION as _PG_CONTROLLERAXISMOTION,
     CONTROLLERDEVICEADDED as _PG_CONTROLLERDEVICEADDED,
     CONTROLLERDEVICEREMOVED as _PG_CONTROLLERDEVICEREMOVED,
+    FINGERMOTION as _PG_FINGERMOTION,
     FULLSCREEN as _PG_FULLSCREEN,
+    JOYAXISMOTION as _PG_JOYAXISMOTION,
+    MOUSEMOTION as _PG_MOUSEMOTION,
     QUIT as _PG_QUIT,
     RESIZABLE as _PG_RESIZABLE,
     WINDOWCLOSE as _PG_WINDOWCLOSE,
@@ -51,7 +56,7 @@ from ..environ.executable import get_executable_path
 from ..graphics.color import BLACK, Color
 from ..graphics.renderer import AbstractRenderer
 from ..graphics.surface import AbstractSurfaceRenderer, Surface, create_surface, save_image
-from ..math.rect import ImmutableRect
+from ..math.rect import ImmutableRect, Rect
 from ..system.clock import Clock
 from ..system.object import Object
 from ..system.path import ConstantFileNotFoundError, set_constant_file
@@ -60,6 +65,7 @@ from ..system.time import Time
 from ..system.utils._mangling import setattr_pv
 from ..system.utils.contextlib import ExitStackView
 from ..system.utils.functools import wraps
+from ..system.utils.typing import reflect_method_signature
 from .controller import Controller
 from .cursor import Cursor
 from .event import Event, EventFactory, EventFactoryError, UnknownEventTypeError
@@ -67,7 +73,7 @@ from .keyboard import Keyboard
 from .mouse import Mouse
 
 if TYPE_CHECKING:
-    from pygame._common import ColorValue
+    from pygame._common import ColorValue, Coordinate, _CanBeRect
 
     from ..graphics.drawable import SupportsDrawing
 
@@ -137,10 +143,12 @@ class Window(Object, no_slots=True):
             size = self.DEFAULT_SIZE
         self.__size: tuple[int, int] = size
         self.__vsync: bool = bool(vsync)
+        self.__damage_tracking: bool = False
 
         self.__close_on_next_frame: bool = True
         self.__close_event: Literal["close", "iconify", "nothing"] = "close"
         self.__display_renderer: _WindowRendererImpl | None = None
+        self.__clear_overlay: tuple[Surface, tuple[int, int, int, int]] | None = None
         self.__rect: ImmutableRect = ImmutableRect(0, 0, 0, 0)
         self.__main_clock: _FramerateManager = _FramerateManager()
         self.__event_queue: deque[_pg_event.Event] = deque()
@@ -149,8 +157,9 @@ class Window(Object, no_slots=True):
 
         self.__default_framerate: int = self.DEFAULT_FRAMERATE
         self.__busy_loop: bool = False
+        self.__event_coalescing: bool = False
 
-        self.__callback_after: _WindowCallbackList = _WindowCallbackList()
+        self.__callback_after: _WindowCallbackScheduler = _WindowCallbackScheduler()
         self.__process_callbacks: bool = True
         self.__handle_mouse_position: bool = True
         self.__handle_mouse_button: bool | None = False
@@ -190,13 +199,14 @@ class Window(Object, no_slots=True):
             flags: int = self.__flags
             vsync: bool = self.__vsync
             _pg_display.set_mode(size, flags=flags, vsync=vsync)
-            self.__display_renderer = _WindowRendererImpl()
+            self.__display_renderer = _WindowRendererImpl(damage_tracking=self.__damage_tracking)
             self.__rect = ImmutableRect.convert(self.__display_renderer.get_rect())
 
             @stack.callback
             def _() -> None:
                 self.__close_on_next_frame = False
                 self.__display_renderer = None
+                self.__clear_overlay = None
                 self.__rect = ImmutableRect(0, 0, 0, 0)
                 self.last_tick_time = -1
                 self.__event_queue.clear()
@@ -373,18 +383,32 @@ class Window(Object, no_slots=True):
         if window_callback.master is not self:
             raise ValueError("window callback's master is not self")
         if window_callback not in self.__callback_after:
-            self.__callback_after.append(window_callback)
+            self.__callback_after.add(window_callback)
 
     def clear(self, color: ColorValue = BLACK, *, blend_alpha: bool = False) -> None:
         screen = self.__display_renderer
         if screen is None:
             raise WindowError("No active renderer")
         if blend_alpha and (color := Color(color)).a < 255:
-            fake_screen: Surface = create_surface(screen.get_size(), default_color=color)
-            screen.draw_surface(fake_screen, (0, 0))
+            if color.a > 0:
+                screen.draw_surface(self.__get_clear_overlay(screen.get_size(), color), (0, 0))
         else:
             screen.fill(color)
 
+    def __get_clear_overlay(self, size: tuple[int, int], color: Color) -> Surface:
+        # The overlay is kept between frames (e.g. for dialogs background), and is only rebuilt on resize or color change
+        rgba: tuple[int, int, int, int] = (color.r, color.g, color.b, color.a)
+        if (cached := self.__clear_overlay) is not None:
+            overlay, overlay_rgba = cached
+            if overlay.get_size() == size:
+                if overlay_rgba != rgba:
+                    overlay.fill(color)
+                    self.__clear_overlay = (overlay, rgba)
+                return overlay
+        overlay = create_surface(size, default_color=color)
+        self.__clear_overlay = (overlay, rgba)
+        return overlay
+
     @final
     def get_default_framerate(self) -> int:
         return self.__default_framerate
@@ -402,6 +426,24 @@ class Window(Object, no_slots=True):
     def set_busy_loop(self, status: bool) -> None:
         self.__busy_loop = bool(status)
 
+    @final
+    def get_event_coalescing(self) -> bool:
+        return self.__event_coalescing
+
+    @final
+    def set_event_coalescing(self, status: bool) -> None:
+        self.__event_coalescing = bool(status)
+
+    @final
+    def get_damage_tracking(self) -> bool:
+        return self.__damage_tracking
+
+    @final
+    def set_damage_tracking(self, status: bool) -> None:
+        self.__damage_tracking = status = bool(status)
+        if (renderer := self.__display_renderer) is not None:
+            renderer.set_damage_tracking(status)
+
     def refresh(self) -> None:
         screen = self.__display_renderer
         if screen is None:
@@ -554,6 +596,8 @@ class Window(Object, no_slots=True):
             yield
 
     def process_events(self) -> Generator[Event]:
+        if self.__event_coalescing:
+            _coalesce_motion_events(self.__event_queue)
         poll_event = self.__event_queue.popleft
         make_event = EventFactory.from_pygame_event
         while True:
@@ -765,7 +809,7 @@ class Window(Object, no_slots=True):
     ) -> WindowCallback | Callable[[Callable[..., None]], WindowCallback]:
         def decorator(__callback: Callable[..., None], /) -> WindowCallback:
             window_callback: WindowCallback = WindowCallback(self, __milliseconds, __callback, args, kwargs)
-            self.__callback_after.append(window_callback)
+            self.__callback_after.add(window_callback)
             return window_callback
 
         if __callback is not None:
@@ -806,7 +850,7 @@ class Window(Object, no_slots=True):
                 window_callback = WindowCallback(self, __milliseconds, wrapper, loop=True)
             else:
                 window_callback = WindowCallback(self, __milliseconds, __callback, args, kwargs, loop=True)
-            self.__callback_after.append(window_callback)
+            self.__callback_after.add(window_callback)
             return window_callback
 
         if __callback is not None:
@@ -814,7 +858,7 @@ class Window(Object, no_slots=True):
         return decorator
 
     def _remove_window_callback(self, window_callback: WindowCallback) -> None:
-        with suppress(ValueError):
+        with suppress(KeyError):
             self.__callback_after.remove(window_callback)
             window_callback.kill()
 
@@ -1030,24 +1074,28 @@ class WindowCallback:
         self.__callback: Callable[..., None] = callback
         self.__args: tuple[Any, ...] = args
         self.__kwargs: dict[str, Any] = kwargs or {}
-        self.__clock = Clock(start=True)
+        self.__due_time: float = _WindowCallbackScheduler.get_time() + wait_time
         self.__loop: bool = bool(loop)
         if self.__loop:
             callback(*args, **(kwargs or {}))  # At least a 1st call
 
     def __call__(self) -> None:
         try:
-            clock = self.__clock
+            due_time = self.__due_time
         except AttributeError:  # killed
             return
+        if _WindowCallbackScheduler.get_time() < due_time:
+            return
         loop: bool = self.__loop
-        if clock.elapsed_time(self.__wait_time, restart=loop):
-            args = self.__args
-            kwargs = self.__kwargs
-            callback = self.__callback
-            callback(*args, **kwargs)
-            if not loop:
-                self.kill()
+        if loop:
+            # A late callback catches up its missed periods, one call per frame
+            self.__due_time = due_time + self.__wait_time
+        args = self.__args
+        kwargs = self.__kwargs
+        callback = self.__callback
+        callback(*args, **kwargs)
+        if not loop:
+            self.kill()
 
     def kill(self) -> None:
         try:
@@ -1055,20 +1103,114 @@ class WindowCallback:
         except AttributeError:
             return
         with suppress(AttributeError):
-            del self.__master, self.__args, self.__kwargs, self.__callback, self.__clock
+            del self.__master, self.__args, self.__kwargs, self.__callback, self.__due_time
         master._remove_window_callback(self)
 
     @property
     def master(self) -> Window:
         return self.__master
 
+    @property
+    def _due_time(self) -> float:
+        return self.__due_time
+
+
+@final
+class _WindowCallbackScheduler:
+    """
+    Min-heap of window callbacks keyed by their due time
+
+    Only the callbacks which are due are called by process(). Removed callbacks
+    are only marked as cancelled and dropped when they reach the top of the heap.
+    """
+
+    __slots__ = ("__heap", "__entries", "__counter")
+
+    def __init__(self) -> None:
+        # Entries are [due_time, insertion_order, callback]; callback is None once cancelled
+        self.__heap: list[list[Any]] = []
+        self.__entries: dict[WindowCallback, list[Any]] = {}
+        self.__counter: Iterator[int] = itertools_count()
+
+    @staticmethod
+    def get_time() -> float:
+        return Clock.get_time_ns() / 1000000.0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, callback: object) -> bool:
+        return callback in self.__entries
+
+    def __iter__(self) -> Iterator[WindowCallback]:
+        return iter(self.__entries)
+
+    def add(self, callback: WindowCallback) -> None:
+        if callback in self.__entries:
+            return
+        self.__push(callback, callback._due_time)
+
+    def remove(self, callback: WindowCallback) -> None:
+        entry = self.__entries.pop(callback)
+        entry[2] = None
+        heap = self.__heap
+        if len(heap) > 2 * len(self.__entries) + 64:
+            # Too many cancelled entries
+            heap[:] = [entry for entry in heap if entry[2] is not None]
+            heapify(heap)
+
+    def clear(self) -> None:
+        for entry in self.__heap:
+            entry[2] = None
+        self.__heap.clear()
+        self.__entries.clear()
 
-class _WindowCallbackList(list[WindowCallback]):
     def process(self) -> None:
-        if not self:
+        heap = self.__heap
+        if not heap:
+            return
+        now: float = self.get_time()
+        due: list[list[Any]] = []
+        while heap and heap[0][0] <= now:
+            entry = heappop(heap)
+            if entry[2] is not None:
+                due.append(entry)
+        # Callbacks added or rescheduled while processing will be called at the next frame at the earliest
+        due.reverse()
+        try:
+            while due:
+                entry = due.pop()
+                callback: WindowCallback | None = entry[2]
+                if callback is None:  # Removed by a previous callback
+                    continue
+                try:
+                    callback()
+                finally:
+                    self.__reschedule(entry)
+        finally:
+            for entry in due:
+                heappush(heap, entry)
+
+    def __push(self, callback: WindowCallback, due_time: float) -> None:
+        entry: list[Any] = [due_time, next(self.__counter), callback]
+        self.__entries[callback] = entry
+        heappush(self.__heap, entry)
+
+    def __reschedule(self, entry: list[Any]) -> None:
+        callback: WindowCallback | None = entry[2]
+        if callback is None:
+            return
+        try:
+            due_time: float = callback._due_time
+        except AttributeError:  # killed
+            self.__entries.pop(callback, None)
             return
-        for callback in tuple(self):
-            callback()
+        self.__push(callback, due_time)
+
+
+# Above these limits, present() does a full-screen flip instead of a partial update
+_DAMAGE_MAX_RECTS: Final[int] = 32
+_DAMAGE_COVERAGE_THRESHOLD: Final[float] = 0.6
 
 
 @final
@@ -1081,9 +1223,14 @@ class _WindowRendererImpl(AbstractSurfaceRenderer, WindowRenderer):
         "__system_surface_cache",
         "__get_screen",
         "__update_window",
+        "__update_window_rects",
+        "__damaged_rects",
+        "__previous_damaged_rects",
+        "__full_damage",
+        "__background_color",
     )
 
-    def __init__(self) -> None:
+    def __init__(self, *, damage_tracking: bool = False) -> None:
         screen: Surface | None = _pg_display.get_surface()
         if screen is None:
             raise _pg_error("No display mode configured")
@@ -1093,8 +1240,14 @@ class _WindowRendererImpl(AbstractSurfaceRenderer, WindowRenderer):
         self.__system_surface: Surface | None = None
         self.__system_surface_cache: Surface = create_surface(screen.get_size())
         self.__update_window = _pg_display.flip
+        self.__update_window_rects = _pg_display.update
         self.__target: Surface = screen
+        self.__damaged_rects: list[Rect] | None = None
+        self.__previous_damaged_rects: list[Rect] = []
+        self.__full_damage: bool = True
+        self.__background_color: int | None = None
         super().__init__()
+        self.set_damage_tracking(damage_tracking)
 
     def get_target(self) -> Surface:
         return self.__target
@@ -1106,6 +1259,7 @@ class _WindowRendererImpl(AbstractSurfaceRenderer, WindowRenderer):
             new_system_surface.blit(system_surface, (0, 0))
             if self.__target is system_surface:
                 new_surface = new_system_surface
+        self.__invalidate_damage()
         if self.__capture_queue:
             return
         self.__target = new_surface
@@ -1126,9 +1280,173 @@ class _WindowRendererImpl(AbstractSurfaceRenderer, WindowRenderer):
                 screen.fill((0, 0, 0))
                 screen.blit(used_target, (0, 0))
                 self.__last_frame = None
+            self.__invalidate_damage()
         else:
             self.__last_frame = None
-        self.__update_window()
+        if self.__damaged_rects is None:
+            self.__update_window()
+            return
+        update_rects = self.__flush_damaged_rects()
+        if update_rects is None:
+            self.__update_window()
+        elif update_rects:
+            self.__update_window_rects(update_rects)
+
+    def is_tracking_damage(self) -> bool:
+        return self.__damaged_rects is not None
+
+    def set_damage_tracking(self, status: bool) -> None:
+        if not status:
+            self.__damaged_rects = None
+            self.__previous_damaged_rects = []
+            return
+        if self.__damaged_rects is None:
+            self.__damaged_rects = []
+            self.__invalidate_damage()
+
+    def __invalidate_damage(self) -> None:
+        # The whole screen must be sent at next present() and the content under the drawn areas is unknown.
+        self.__full_damage = True
+        self.__background_color = None
+
+    def __add_damage(self, rect: Rect) -> Rect:
+        if (damaged_rects := self.__damaged_rects) is not None:
+            damaged_rects.append(rect)
+        return rect
+
+    def __flush_damaged_rects(self) -> list[Rect] | None:
+        damaged_rects = self.__damaged_rects
+        assert damaged_rects is not None
+        previous_damaged_rects = self.__previous_damaged_rects
+        self.__previous_damaged_rects = damaged_rects
+        self.__damaged_rects = []
+        if self.__full_damage:
+            self.__full_damage = False
+            return None
+
+        # The areas drawn at the previous frame must also be sent, since they may have been erased since.
+        screen_rect: Rect = self._get_screen_surface().get_rect()
+        update_rects: list[Rect] = []
+        for rect in (*previous_damaged_rects, *damaged_rects):
+            rect = screen_rect.clip(rect)
+            if rect.w <= 0 or rect.h <= 0:
+                continue
+            while (index := rect.collidelist(update_rects)) >= 0:
+                rect = rect.union(update_rects.pop(index))
+            update_rects.append(rect)
+        if len(update_rects) > _DAMAGE_MAX_RECTS:
+            update_rects = [update_rects[0].unionall(update_rects[1:])]
+        if sum(r.w * r.h for r in update_rects) > screen_rect.w * screen_rect.h * _DAMAGE_COVERAGE_THRESHOLD:
+            return None
+        return update_rects
+
+    def fill(self, color: ColorValue, rect: _CanBeRect | None = None) -> Rect:
+        target = self.__target
+        filled_rect = target.fill(color, rect=rect)
+        if self.__damaged_rects is None:
+            return filled_rect
+        if rect is None and target is self._get_screen_surface():
+            # Full-screen fill is considered as a background reset:
+            # Only the areas drawn since the last reset must be updated, unless the color changed.
+            background_color: int = target.map_rgb(Color(color))
+            if background_color != self.__background_color:
+                self.__background_color = background_color
+                self.__full_damage = True
+            return filled_rect
+        return self.__add_damage(filled_rect)
+
+    @reflect_method_signature(AbstractSurfaceRenderer.draw_surface)
+    def draw_surface(self, *args: Any, **kwargs: Any) -> Rect:
+        return self.__add_damage(super().draw_surface(*args, **kwargs))
+
+    @overload
+    def draw_many_surfaces(
+        self,
+        sequence: Iterable[
+            tuple[Surface, Coordinate | _CanBeRect]
+            | tuple[Surface, Coordinate | _CanBeRect, _CanBeRect | None]
+            | tuple[Surface, Coordinate | _CanBeRect, _CanBeRect | None, int]
+        ],
+        doreturn: Literal[True] = ...,
+    ) -> list[Rect]: ...
+
+    @overload
+    def draw_many_surfaces(
+        self,
+        sequence: Iterable[
+            tuple[Surface, Coordinate | _CanBeRect]
+            | tuple[Surface, Coordinate | _CanBeRect, _CanBeRect | None]
+            | tuple[Surface, Coordinate | _CanBeRect, _CanBeRect | None, int]
+        ],
+        doreturn: Literal[False],
+    ) -> None: ...
+
+    @overload
+    def draw_many_surfaces(
+        self,
+        sequence: Iterable[
+            tuple[Surface, Coordinate | _CanBeRect]
+            | tuple[Surface, Coordinate | _CanBeRect, _CanBeRect | None]
+            | tuple[Surface, Coordinate | _CanBeRect, _CanBeRect | None, int]
+        ],
+        doreturn: bool,
+    ) -> list[Rect] | None: ...
+
+    def draw_many_surfaces(
+        self,
+        sequence: Iterable[
+            tuple[Surface, Coordinate | _CanBeRect]
+            | tuple[Surface, Coordinate | _CanBeRect, _CanBeRect | None]
+            | tuple[Surface, Coordinate | _CanBeRect, _CanBeRect | None, int]
+        ],
+        doreturn: bool = True,
+    ) -> list[Rect] | None:
+        damaged_rects = self.__damaged_rects
+        if damaged_rects is None:
+            return super().draw_many_surfaces(sequence, doreturn)
+        rects: list[Rect] = super().draw_many_surfaces(sequence, True)
+        damaged_rects.extend(rects)
+        return rects if doreturn else None
+
+    @reflect_method_signature(AbstractSurfaceRenderer.draw_text)
+    def draw_text(self, *args: Any, **kwargs: Any) -> Rect:
+        return self.__add_damage(super().draw_text(*args, **kwargs))
+
+    @reflect_method_signature(AbstractSurfaceRenderer.draw_rect)
+    def draw_rect(self, *args: Any, **kwargs: Any) -> Rect:
+        return self.__add_damage(super().draw_rect(*args, **kwargs))
+
+    @reflect_method_signature(AbstractSurfaceRenderer.draw_polygon)
+    def draw_polygon(self, *args: Any, **kwargs: Any) -> Rect:
+        return self.__add_damage(super().draw_polygon(*args, **kwargs))
+
+    @reflect_method_signature(AbstractSurfaceRenderer.draw_circle)
+    def draw_circle(self, *args: Any, **kwargs: Any) -> Rect:
+        return self.__add_damage(super().draw_circle(*args, **kwargs))
+
+    @reflect_method_signature(AbstractSurfaceRenderer.draw_ellipse)
+    def draw_ellipse(self, *args: Any, **kwargs: Any) -> Rect:
+        return self.__add_damage(super().draw_ellipse(*args, **kwargs))
+
+    @reflect_method_signature(AbstractSurfaceRenderer.draw_arc)
+    def draw_arc(self, *args: Any, **kwargs: Any) -> Rect:
+        return self.__add_damage(super().draw_arc(*args, **kwargs))
+
+    @reflect_method_signature(AbstractSurfaceRenderer.draw_line)
+    def draw_line(self, *args: Any, **kwargs: Any) -> Rect:
+        return self.__add_damage(super().draw_line(*args, **kwargs))
+
+    @reflect_method_signature(AbstractSurfaceRenderer.draw_lines)
+    def draw_lines(self, *args: Any, **kwargs: Any) -> Rect:
+        return self.__add_damage(super().draw_lines(*args, **kwargs))
+
+    @reflect_method_signature(AbstractSurfaceRenderer.draw_aaline)
+    def draw_aaline(self, *args: Any, **kwargs: Any) -> Rect:
+        return self.__add_damage(super().draw_aaline(*args, **kwargs))
+
+    @reflect_method_signature(AbstractSurfaceRenderer.draw_aalines)
+    def draw_aalines(self, *args: Any, **kwargs: Any) -> Rect:
+        return self.__add_damage(super().draw_aalines(*args, **kwargs))
 
     def get_screen_copy(self) -> Surface:
         return (self.__last_frame or self._get_screen_surface()).copy()
@@ -1153,7 +1471,7 @@ class _WindowRendererImpl(AbstractSurfaceRenderer, WindowRenderer):
                 default_surface = self._get_screen_surface()
             self.__target = default_surface
             if draw_on_default_at_end:
-                default_surface.blit(captured_surface, (0, 0))
+                self.__add_damage(default_surface.blit(captured_surface, (0, 0)))
 
     def is_capturing(self) -> bool:
         return bool(self.__capture_queue)
@@ -1181,6 +1499,50 @@ class _WindowRendererImpl(AbstractSurfaceRenderer, WindowRenderer):
         return screen
 
 
+def _coalesce_motion_events(event_queue: deque[_pg_event.Event]) -> None:
+    """
+    Merge in place the consecutive motion events emitted by the same device.
+
+    Relative motions are summed, and the absolute position (or axis value) of the last event is kept.
+    """
+    if len(event_queue) < 2:
+        return
+    events: list[_pg_event.Event] = []
+    last_key: tuple[Any, ...] | None = None
+    for event in event_queue:
+        key = _motion_event_key(event)
+        if key is not None and key == last_key:
+            events[-1] = _merge_motion_events(events[-1], event)
+            continue
+        events.append(event)
+        last_key = key
+    if len(events) < len(event_queue):
+        event_queue.clear()
+        event_queue.extend(events)
+
+
+def _motion_event_key(event: _pg_event.Event) -> tuple[Any, ...] | None:
+    event_type: int = event.type
+    if event_type == _PG_MOUSEMOTION:
+        return (event_type, getattr(event, "touch", False), getattr(event, "window", None))
+    if event_type == _PG_JOYAXISMOTION or event_type == _PG_CONTROLLERAXISMOTION:
+        return (event_type, event.instance_id, event.axis)
+    if event_type == _PG_FINGERMOTION:
+        return (event_type, event.touch_id, event.finger_id, getattr(event, "window", None))
+    return None
+
+
+def _merge_motion_events(previous: _pg_event.Event, event: _pg_event.Event) -> _pg_event.Event:
+    event_type: int = event.type
+    if event_type == _PG_MOUSEMOTION:
+        (prev_dx, prev_dy), (dx, dy) = previous.rel, event.rel
+        return _pg_event.Event(event_type, event.dict, rel=(prev_dx + dx, prev_dy + dy))
+    if event_type == _PG_FINGERMOTION:
+        return _pg_event.Event(event_type, event.dict, dx=previous.dx + event.dx, dy=previous.dy + event.dy)
+    # Axis motion: only the last value matters
+    return event
+
+
 @dataclass
 class _TemporaryCursor:
     cursor: Cursor
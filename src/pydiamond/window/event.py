@@ -189,6 +189,11 @@ class _BuiltinEventMeta(EventMeta):
             raise TypeError("Trying to create custom event from BuiltinEvent class") from None
 
         assert len(bases) == 1 and issubclass(bases[0], BuiltinEvent)
+        if "__slots__" not in namespace:
+            annotations: dict[str, Any] = namespace.get("__annotations__", {})
+            namespace["__slots__"] = tuple(
+                field for field, annotation in annotations.items() if not str(annotation).startswith(("ClassVar", "Final"))
+            )
         cls: _BuiltinEventMeta = super().__new__(mcs, name, bases, namespace, model=event_type is None, **kwargs)
 
         if cls.is_model():
@@ -795,6 +800,31 @@ __check_event_types_association()
 del __check_event_types_association
 
 
+_BUILTIN_EVENT_CONSTRUCTORS: Final[dict[int, Callable[[_pg_event.Event], Event]]] = {}
+
+
+def __build_builtin_event_constructors() -> None:
+    # Generate for each builtin event a constructor which reads the pygame event attributes directly
+    # instead of going through BuiltinEvent.from_dict()
+    for event_type, event_cls in _BUILTIN_PYGAME_EVENT_TYPE.items():
+        field_names: list[str] = [f.name for f in fields(cast(Any, event_cls))]
+        body: list[str] = ["self = __new__(__cls__)"]
+        body.extend(f"self.{name} = event.{name}" for name in field_names)
+        if hasattr(event_cls, "__post_init__"):
+            body.append("self.__post_init__()")
+        body.append("return self")
+        constructor_name = f"__{event_cls.__name__}_from_pygame_event__"
+        source = f"def {constructor_name}(event, /):\n" + "\n".join(f"    {line}" for line in body)
+        constructor_namespace: dict[str, Any] = {"__cls__": event_cls, "__new__": event_cls.__new__}
+        exec(compile(source, f"<{constructor_name}>", "exec"), constructor_namespace)
+        _BUILTIN_EVENT_CONSTRUCTORS[event_type] = constructor_namespace[constructor_name]
+
+
+__build_builtin_event_constructors()
+
+del __build_builtin_event_constructors
+
+
 class EventFactoryError(Exception):
     pass
 
@@ -844,6 +874,12 @@ class EventFactory(metaclass=ClassNamespaceMeta, frozen=True):
     @staticmethod
     def from_pygame_event(pygame_event: _pg_event.Event, raise_if_blocked: bool = False) -> Event:
         actual_event_type: int = pygame_event.type
+        if (constructor := _BUILTIN_EVENT_CONSTRUCTORS.get(actual_event_type)) is not None:
+            try:
+                return constructor(pygame_event)
+            except AttributeError:
+                # Missing attribute: Let from_dict() raise the appropriate error
+                pass
         pygame_event = EventFactory.convert_pygame_event(pygame_event)
         if raise_if_blocked and actual_event_type != pygame_event.type and _pg_event.get_blocked(pygame_event.type):
             raise PygameConvertedEventBlocked(pygame_event.type)
@@ -887,6 +923,7 @@ class EventManager:
     __slots__ = (
         "__event_handler_dict",
         "__other_event_handlers_list",
+        "__dispatch_table",
         "__key_pressed_handler_dict",
         "__key_released_handler_dict",
         "__mouse_button_pressed_handler_dict",
@@ -912,6 +949,7 @@ class EventManager:
     def __init__(self, *, priority_callbacks: bool = True) -> None:
         self.__event_handler_dict: dict[type[Event], OrderedSet[_EventCallback]] = dict()
         self.__other_event_handlers_list: OrderedSet[_EventCallback] = OrderedSet()
+        self.__dispatch_table: dict[type[Event], tuple[_EventCallback, ...]] = dict()
         self.__key_pressed_handler_dict: dict[int, Callable[[KeyDownEvent], Any]] = dict()
         self.__key_released_handler_dict: dict[int, Callable[[KeyUpEvent], Any]] = dict()
         self.__mouse_button_pressed_handler_dict: dict[int, Callable[[MouseButtonDownEvent], Any]] = dict()
@@ -932,6 +970,7 @@ class EventManager:
     def clear(self) -> None:
         self.__event_handler_dict.clear()
         self.__other_event_handlers_list.clear()
+        self.__dispatch_table.clear()
         self.__key_pressed_handler_dict.clear()
         self.__key_released_handler_dict.clear()
         self.__mouse_button_pressed_handler_dict.clear()
@@ -1068,6 +1107,7 @@ class EventManager:
             self.__other_event_handlers_list.add(cast(_EventCallback, callback))
         else:
             EventManager.__bind(self.__event_handler_dict, event_cls, cast(_EventCallback, callback))
+        self.__dispatch_table.clear()
 
     @overload
     def unbind[_TE: Event](
@@ -1100,6 +1140,7 @@ class EventManager:
             if event_cls.is_model():
                 raise TypeError("Cannot assign events to event models")
             EventManager.__unbind(self.__event_handler_dict, event_cls, cast(_EventCallback, callback_to_remove))
+        self.__dispatch_table.clear()
         priority_callback_dict = self.__priority_callback_dict
         if priority_callback_dict is not None:
             for event_type in tuple(
@@ -1527,20 +1568,31 @@ class EventManager:
                     return True
                 del priority_callback_dict[event_type]
 
-        if isinstance(event, KeyEvent):
-            if self.__handle_key_event(event, priority_callback):
+        if event_type is KeyDownEvent or event_type is KeyUpEvent:
+            if self.__handle_key_event(cast(KeyEvent, event), priority_callback):
                 return True
-        elif isinstance(event, MouseButtonEvent):
-            if self.__handle_mouse_event(event, priority_callback):
+        elif event_type is MouseButtonDownEvent or event_type is MouseButtonUpEvent:
+            if self.__handle_mouse_event(cast(MouseButtonEvent, event), priority_callback):
                 return True
 
-        for callback in chain(self.__event_handler_dict.get(event_type, ()), self.__other_event_handlers_list):
+        try:
+            callbacks = self.__dispatch_table[event_type]
+        except KeyError:
+            callbacks = self.__build_dispatch_table_entry(event_type)
+        for callback in callbacks:
             if callback is not priority_callback and callback(event):
                 if priority_callback_dict is not None:
                     priority_callback_dict[event_type] = callback
                 return True
         return False
 
+    def __build_dispatch_table_entry(self, event_type: type[Event]) -> tuple[_EventCallback, ...]:
+        # Concrete event classes cannot be subclassed, and event models cannot be bound,
+        # so the callbacks bound to the exact event type are the only ones to resolve.
+        callbacks = tuple(chain(self.__event_handler_dict.get(event_type, ()), self.__other_event_handlers_list))
+        self.__dispatch_table[event_type] = callbacks
+        return callbacks
+
     def _handle_mouse_position(self, mouse_pos: tuple[float, float]) -> None:
         for callback in self.__mouse_pos_handler_list:
             callback(mouse_pos)
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 import pytest
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from pytest_mock import MockerFixture
 
 
@@ -38,6 +40,17 @@ pytest_plugins = [
 ]
 
 
+@pytest.fixture(scope="module")
+def pygame_display() -> Iterator[None]:
+    """Needed for Surface.convert_alpha()"""
+    import pygame
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.display.quit()
+
+
 @pytest.fixture(scope="session")
 def pydiamond_rootdirs_list() -> list[pathlib.Path]:
     import importlib
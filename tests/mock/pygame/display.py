@@ -23,6 +23,7 @@ class MockDisplayModule(NamedTuple):
     set_mode: MagicMock
     get_surface: MagicMock
     flip: MagicMock
+    update: MagicMock
     set_icon: MagicMock
     iconify: MagicMock
     set_caption: MagicMock
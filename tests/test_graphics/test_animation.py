@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pydiamond.graphics import animation
+from pydiamond.graphics.animation import AnimationInterpolator, AnimationInterpolatorPool, BatchMoveAnimation
+from pydiamond.graphics.image import Image
+from pydiamond.graphics.movable import Movable
+from pydiamond.system.time import Time
+
+import pygame
+import pytest
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+pytestmark = pytest.mark.usefixtures("pygame_display")
+
+
+class TestAnimationInterpolatorPool:
+    @pytest.fixture
+    @staticmethod
+    def image() -> Image:
+        surface = pygame.Surface((20, 10), pygame.SRCALPHA)
+        surface.fill((255, 0, 0, 255))
+        return Image(surface)
+
+    def test____set_transform_epsilon____applied_to_objects_added_afterwards(self, image: Image) -> None:
+        # Arrange
+        pool = AnimationInterpolatorPool()
+
+        # Act
+        pool.set_transform_epsilon(angle=5, scale=0.1)
+        pool.add(image)
+
+        # Assert
+        assert pool.get_transform_epsilon() == (5, 0.1)
+        assert AnimationInterpolator(image).get_transform_epsilon() == (5, 0.1)
+
+    def test____set_transform_epsilon____applied_to_objects_already_added(self, image: Image) -> None:
+        # Arrange
+        pool = AnimationInterpolatorPool(image)
+
+        # Act
+        pool.set_transform_epsilon(angle=5, scale=0.1)
+
+        # Assert
+        assert AnimationInterpolator(image).get_transform_epsilon() == (5, 0.1)
+
+    def test____set_transform_epsilon____shared_interpolator(self, image: Image) -> None:
+        # Arrange
+        first_pool = AnimationInterpolatorPool(image)
+        second_pool = AnimationInterpolatorPool(image)
+
+        # Act
+        second_pool.set_transform_epsilon(angle=5)
+
+        # Assert
+        assert first_pool.get_transform_epsilon() is None
+        assert AnimationInterpolator(image).get_transform_epsilon() == (5, 0)
+
+    def test____set_transform_epsilon____negative_value(self) -> None:
+        # Arrange
+        pool = AnimationInterpolatorPool()
+
+        # Act & Assert
+        with pytest.raises(ValueError, match=r"^Negative epsilon$"):
+            pool.set_transform_epsilon(angle=-1)
+        assert pool.get_transform_epsilon() is None
+
+    @pytest.mark.parametrize(
+        ["angle", "scale", "transformed"],
+        [
+            pytest.param(4, (1, 1), False, id="angle-below-threshold"),
+            pytest.param(40, (1, 1), True, id="angle-above-threshold"),
+            pytest.param(0, (1.1, 1.1), False, id="scale-below-threshold"),
+            pytest.param(0, (2, 2), True, id="scale-above-threshold"),
+        ],
+    )
+    def test____update____transform_only_past_thresholds(
+        self,
+        image: Image,
+        angle: float,
+        scale: tuple[float, float],
+        transformed: bool,
+        mocker: MockerFixture,
+    ) -> None:
+        # Arrange
+        pool = AnimationInterpolatorPool(image)
+        pool.set_transform_epsilon(angle=5, scale=0.1)
+        with pool.fixed_update():
+            pass
+        with pool.fixed_update():
+            image.set_rotation_and_scale(angle, scale)
+        set_rotation_and_scale = mocker.spy(image, "set_rotation_and_scale")
+
+        # Act
+        pool.update(0.5)
+
+        # Assert
+        if transformed:
+            set_rotation_and_scale.assert_called_once_with(angle / 2, ((1 + scale[0]) / 2, (1 + scale[1]) / 2))
+        else:
+            set_rotation_and_scale.assert_not_called()
+            assert image.angle == angle
+            assert image.scale == scale
+
+
+class _MovableFixture(Movable):
+    def get_size(self) -> tuple[float, float]:
+        return (0, 0)
+
+
+class TestBatchMoveAnimation:
+    @pytest.fixture(params=["numpy", "fallback"])
+    @staticmethod
+    def batch(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> BatchMoveAnimation:
+        if request.param == "numpy":
+            if animation.numpy is None:
+                pytest.skip("numpy is not installed")
+        else:
+            monkeypatch.setattr(animation, "numpy", None)
+        return BatchMoveAnimation()
+
+    @staticmethod
+    def speed(distance_per_fixed_update: float) -> float:
+        return distance_per_fixed_update / Time.fixed_delta()
+
+    @staticmethod
+    def run(batch: BatchMoveAnimation, nb_fixed_updates: int) -> None:
+        for _ in range(nb_fixed_updates):
+            batch.fixed_update()
+
+    def test____fixed_update____exact_arrival_on_target(self, batch: BatchMoveAnimation) -> None:
+        # Arrange
+        first = _MovableFixture()
+        second = _MovableFixture()
+        batch.smooth_set_position(first, speed=self.speed(3), center=(10, 0))
+        batch.smooth_set_position(second, speed=self.speed(7), center=(0, 10))
+        batch.start()
+
+        # Act
+        self.run(batch, 3)
+        intermediate = first.center
+        self.run(batch, 2)
+
+        # Assert
+        assert intermediate == (9, 0)
+        assert first.center == (10, 0)
+        assert second.center == (0, 10)
+        assert not batch.has_animation_started()
+
+    def test____smooth_set_position____retarget_running_tween(self, batch: BatchMoveAnimation) -> None:
+        # Arrange
+        movable = _MovableFixture()
+        speed = self.speed(5)
+        batch.smooth_set_position(movable, speed=speed, center=(100, 0))
+        batch.start()
+        self.run(batch, 2)
+        assert movable.center == (10, 0)
+
+        # Act
+        batch.smooth_set_position(movable, speed=speed, center=(10, 10))
+        self.run(batch, 1)
+        intermediate = movable.center
+        self.run(batch, 1)
+
+        # Assert
+        assert intermediate == (10, 5)
+        assert movable.center == (10, 10)
+        assert not batch.has_animation_started()
+
+    def test____smooth_translation____relative_to_running_target(self, batch: BatchMoveAnimation) -> None:
+        # Arrange
+        movable = _MovableFixture()
+        speed = self.speed(100)
+        batch.smooth_translation(movable, (10, 0), speed=speed)
+
+        # Act
+        batch.smooth_translation(movable, (0, 10), speed=speed)
+        batch.start()
+        self.run(batch, 1)
+
+        # Assert
+        assert movable.center == (10, 10)
+
+    def test____remove____object_no_longer_moved(self, batch: BatchMoveAnimation) -> None:
+        # Arrange
+        removed = _MovableFixture()
+        kept = _MovableFixture()
+        speed = self.speed(5)
+        batch.smooth_set_position(removed, speed=speed, center=(100, 0))
+        batch.smooth_set_position(kept, speed=speed, center=(0, 100))
+        batch.start()
+        self.run(batch, 1)
+
+        # Act
+        batch.remove(removed)
+        self.run(batch, 1)
+
+        # Assert
+        assert removed.center == (5, 0)
+        assert kept.center == (0, 10)
+
+    def test____remove____pending_object(self, batch: BatchMoveAnimation) -> None:
+        # Arrange
+        movable = _MovableFixture()
+        batch.smooth_set_position(movable, center=(100, 0))
+
+        # Act
+        batch.remove(movable)
+
+        # Assert
+        assert not batch.has_animation_started()
+
+    def test____on_stop____called_once(self, batch: BatchMoveAnimation) -> None:
+        # Arrange
+        calls: list[None] = []
+        movable = _MovableFixture()
+        batch.smooth_set_position(movable, speed=self.speed(5), center=(10, 0))
+        batch.on_stop(lambda: calls.append(None))
+        batch.start()
+
+        # Act
+        self.run(batch, 1)
+        assert calls == []
+        self.run(batch, 5)
+
+        # Assert
+        assert calls == [None]
+        assert not batch.started()
+
+    def test____update____interpolation_between_fixed_steps(self, batch: BatchMoveAnimation) -> None:
+        # Arrange
+        movable = _MovableFixture()
+        batch.smooth_set_position(movable, speed=self.speed(10), center=(100, 0))
+        batch.start()
+        self.run(batch, 1)
+
+        # Act
+        batch.update(0.5)
+        interpolated = movable.center
+        self.run(batch, 1)
+
+        # Assert
+        assert interpolated == (5, 0)
+        assert movable.center == (20, 0)
+
+    def test____update____not_started(self, batch: BatchMoveAnimation) -> None:
+        # Arrange
+        movable = _MovableFixture()
+        batch.smooth_set_position(movable, center=(100, 0))
+
+        # Act
+        batch.fixed_update()
+        batch.update(0.5)
+
+        # Assert
+        assert movable.center == (0, 0)
+        assert not batch.started()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from pydiamond.graphics import _gradients
+
+import pygame
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+
+pytestmark = pytest.mark.usefixtures("pygame_display")
+
+
+def _to_array(surface: pygame.Surface) -> Any:
+    return numpy.dstack([pygame.surfarray.array3d(surface), pygame.surfarray.array_alpha(surface)]).astype(numpy.int32)
+
+
+def _python_implementation(name: str) -> Any:
+    return _gradients._python_implementations[name]  # type: ignore[attr-defined]
+
+
+def _numpy_implementation(name: str) -> Any:
+    return getattr(_gradients, f"_numpy_{name}")
+
+
+class TestNumPyGradients:
+    @pytest.mark.parametrize(
+        ["name", "args", "kwargs"],
+        [
+            pytest.param("vertical", ((40, 30), (255, 0, 0), (0, 100, 255, 128)), {}, id="vertical"),
+            pytest.param("horizontal", ((40, 30), (255, 0, 0), (0, 100, 255, 128)), {}, id="horizontal"),
+            pytest.param("squared", (37, (255, 0, 0), (0, 100, 255, 128)), {}, id="squared-odd"),
+            pytest.param("squared", (40, (255, 0, 0), (0, 100, 255, 128)), {}, id="squared-even"),
+            pytest.param("vertical_func", ((40, 30), (255, 0, 0), (0, 100, 255)), {}, id="vertical_func"),
+            pytest.param("horizontal_func", ((40, 30), (255, 0, 0), (0, 100, 255)), {"Rfunc": math.sin}, id="horizontal_func"),
+            pytest.param("squared_func", (37, (255, 0, 0), (0, 100, 255)), {}, id="squared_func"),
+            pytest.param("squared_func", (40, (255, 0, 0, 50), (0, 100, 255)), {"offset": (3.5, -2.25)}, id="squared_func-offset"),
+            pytest.param("squared_func", (41, (255, 0, 0), (0, 100, 255)), {"offset": (-7, 2)}, id="squared_func-negative-offset"),
+        ],
+    )
+    def test____implementation____pixel_identical(self, name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        # Arrange
+        expected = _to_array(_python_implementation(name)(*args, **kwargs))
+
+        # Act
+        result = _to_array(_numpy_implementation(name)(*args, **kwargs))
+
+        # Assert
+        assert numpy.array_equal(result, expected)
+
+    @pytest.mark.parametrize("radius", [1, 5, 37, 100])
+    @pytest.mark.parametrize("name", ["radial", "radial_func"])
+    def test____implementation____radial_within_one_step(self, name: str, radius: int) -> None:
+        # Arrange
+        args = (radius, (255, 0, 0), (0, 100, 255))
+        expected = _to_array(_python_implementation(name)(*args))
+        step = math.ceil(255 / radius)
+
+        # Act
+        result = _to_array(_numpy_implementation(name)(*args))
+
+        # Assert
+        assert numpy.array_equal(result[..., 3], expected[..., 3])
+        assert numpy.abs(result - expected).max() <= step
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+
+from pydiamond.graphics.color import BLUE, Color
+from pydiamond.graphics.image import Image
+
+import pygame
+import pytest
+
+
+pytestmark = pytest.mark.usefixtures("pygame_display")
+
+
+class TestImage:
+    @pytest.fixture
+    @staticmethod
+    def source() -> pygame.Surface:
+        surface = pygame.Surface((20, 10), pygame.SRCALPHA)
+        surface.fill((255, 0, 0, 255))
+        return surface
+
+    def test____dunder_init____instances_from_same_source_share_transforms(self, source: pygame.Surface) -> None:
+        # Arrange
+        first = Image(source)
+        second = Image(source)
+
+        # Act
+        first.angle = 45
+        second.angle = 45
+
+        # Assert
+        assert first._Image__image is second._Image__image  # type: ignore[attr-defined]
+
+    def test____fill____does_not_modify_other_instances(self, source: pygame.Surface) -> None:
+        # Arrange
+        first = Image(source)
+        second = Image(source)
+
+        # Act
+        first.fill(BLUE)
+
+        # Assert
+        assert first.get().get_at((0, 0)) == BLUE
+        assert second.get().get_at((0, 0)) == Color(255, 0, 0, 255)
+        assert source.get_at((0, 0)) == Color(255, 0, 0, 255)
+
+    def test____set____no_copy_source_modified_in_place(self, source: pygame.Surface) -> None:
+        # Arrange
+        image = Image(source, copy=False)
+        image.angle = 90
+        source.fill(BLUE)
+
+        # Act
+        image.set(source, copy=False)
+
+        # Assert
+        rotated = image.get(apply_rotation_scale=True)
+        assert rotated.get_at(rotated.get_rect().center) == BLUE
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import gc
+from collections.abc import Callable
+from typing import Any
+
+from pydiamond.graphics import shape as shape_module
+from pydiamond.graphics._shape_cache import ShapeCache
+from pydiamond.graphics.color import BLUE, RED
+from pydiamond.graphics.shape import AbstractShape, CircleShape, RectangleShape
+
+import pygame
+import pytest
+
+
+pytestmark = pytest.mark.usefixtures("pygame_display")
+
+
+class TestShapeCache:
+    @pytest.fixture
+    @staticmethod
+    def cache() -> ShapeCache:
+        return ShapeCache()
+
+    @staticmethod
+    def render() -> pygame.Surface:
+        return pygame.Surface((20, 10), pygame.SRCALPHA)
+
+    def test____acquire____equal_keys_share_surface(self, cache: ShapeCache) -> None:
+        # Arrange
+
+        # Act
+        first = cache.acquire("key", self.render)
+        second = cache.acquire("key", self.render)
+
+        # Assert
+        assert first is second
+        assert cache.get_refcount("key") == 2
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test____release____surface_kept_while_referenced(self, cache: ShapeCache) -> None:
+        # Arrange
+        first = cache.acquire("key", self.render)
+        cache.acquire("key", self.render)
+
+        # Act
+        cache.release("key")
+
+        # Assert
+        assert cache.get_refcount("key") == 1
+        assert cache.nbytes == 0
+        assert cache.acquire("key", self.render) is first
+
+    def test____release____unreferenced_surface_reused_from_pool(self, cache: ShapeCache) -> None:
+        # Arrange
+        first = cache.acquire("key", self.render)
+
+        # Act
+        cache.release("key")
+
+        # Assert
+        assert cache.get_refcount("key") == 0
+        assert cache.nbytes == first.get_width() * first.get_height() * first.get_bytesize()
+        assert cache.acquire("key", self.render) is first
+        assert cache.nbytes == 0
+
+    def test____release____unreferenced_surface_dropped_without_budget(self) -> None:
+        # Arrange
+        cache = ShapeCache(max_bytes=0)
+        first = cache.acquire("key", self.render)
+
+        # Act
+        cache.release("key")
+
+        # Assert
+        assert len(cache) == 0
+        assert cache.acquire("key", self.render) is not first
+
+    def test____release____unknown_key(self, cache: ShapeCache) -> None:
+        # Arrange
+
+        # Act
+        cache.release("unknown")
+
+        # Assert
+        assert len(cache) == 0
+
+
+def _get_image(shape: AbstractShape) -> pygame.Surface:
+    return shape._AbstractShape__image  # type: ignore[attr-defined]
+
+
+def _get_image_key(shape: AbstractShape) -> Any:
+    return shape._AbstractShape__image_key[0]  # type: ignore[attr-defined]
+
+
+class TestSharedShapeImage:
+    @pytest.fixture(autouse=True)
+    @staticmethod
+    def cache(monkeypatch: pytest.MonkeyPatch) -> ShapeCache:
+        cache = ShapeCache()
+        monkeypatch.setattr(shape_module, "shape_cache", cache)
+        return cache
+
+    @pytest.fixture(
+        params=[
+            pytest.param(lambda: RectangleShape(40, 20, RED, border_radius=5), id="rectangle"),
+            pytest.param(lambda: CircleShape(10, RED), id="circle"),
+        ]
+    )
+    @staticmethod
+    def shape_factory(request: pytest.FixtureRequest) -> Callable[[], AbstractShape]:
+        return request.param
+
+    def test____equal_shapes____share_surface(self, shape_factory: Callable[[], AbstractShape], cache: ShapeCache) -> None:
+        # Arrange
+
+        # Act
+        first = shape_factory()
+        second = shape_factory()
+
+        # Assert
+        assert _get_image(first) is _get_image(second)
+        assert cache.get_refcount(_get_image_key(first)) == 2
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            pytest.param(lambda shape: shape.config.set("color", BLUE), id="color"),
+            pytest.param(lambda shape: shape.config.set("outline", 2), id="outline"),
+            pytest.param(lambda shape: shape.rotate(45), id="rotation"),
+            pytest.param(lambda shape: shape.set_scale((2, 2)), id="scale"),
+        ],
+    )
+    def test____changed_shape____new_surface(
+        self,
+        shape_factory: Callable[[], AbstractShape],
+        change: Callable[[AbstractShape], None],
+        cache: ShapeCache,
+    ) -> None:
+        # Arrange
+        first = shape_factory()
+        second = shape_factory()
+        former_key = _get_image_key(first)
+
+        # Act
+        change(second)
+
+        # Assert
+        assert _get_image(second) is not _get_image(first)
+        assert _get_image_key(second) != former_key
+        assert cache.get_refcount(former_key) == 1
+        assert cache.get_refcount(_get_image_key(second)) == 1
+
+    def test____changed_shape____border_radius(self, cache: ShapeCache) -> None:
+        # Arrange
+        first = RectangleShape(40, 20, RED, border_radius=5)
+        second = RectangleShape(40, 20, RED, border_radius=5)
+
+        # Act
+        second.config.set("border_radius", 8)
+
+        # Assert
+        assert _get_image(second) is not _get_image(first)
+        assert cache.get_refcount(_get_image_key(first)) == 1
+
+    def test____changed_shape____back_to_shared_surface(self, shape_factory: Callable[[], AbstractShape]) -> None:
+        # Arrange
+        first = shape_factory()
+        second = shape_factory()
+        second.rotate(45)
+
+        # Act
+        second.rotate(-45)
+
+        # Assert
+        assert _get_image(second) is _get_image(first)
+
+    def test____finalize____refcount_dropped_on_garbage_collection(
+        self,
+        shape_factory: Callable[[], AbstractShape],
+        cache: ShapeCache,
+    ) -> None:
+        # Arrange
+        first = shape_factory()
+        second = shape_factory()
+        key = _get_image_key(first)
+
+        # Act
+        del second
+        gc.collect()
+
+        # Assert
+        assert cache.get_refcount(key) == 1
+        del first
+        gc.collect()
+        assert cache.get_refcount(key) == 0
+        assert len(cache) == 1
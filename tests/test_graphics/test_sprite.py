@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from pydiamond.graphics.sprite import LayeredSpriteGroup, Sprite, SpriteGroup, mask_cache
+
+import pygame
+import pytest
+
+
+pytestmark = pytest.mark.usefixtures("pygame_display")
+
+
+@pytest.fixture
+def sprite_factory() -> Callable[[], Sprite]:
+    rng = random.Random(42)
+
+    def factory() -> Sprite:
+        surface = pygame.Surface((rng.randint(1, 30), rng.randint(1, 30)), pygame.SRCALPHA)
+        surface.fill("red")
+        sprite = Sprite(surface)
+        sprite.topleft = (rng.randint(0, 300), rng.randint(0, 300))
+        return sprite
+
+    return factory
+
+
+@pytest.fixture(params=[SpriteGroup, LayeredSpriteGroup])
+def sprite_group_cls(request: Any) -> type[SpriteGroup[Sprite]]:
+    group_cls: type[SpriteGroup[Sprite]] = request.param
+    return group_cls
+
+
+class TestSpriteGroupSpatialIndex:
+    def test____dunder_init____cell_size(self, sprite_group_cls: type[SpriteGroup[Sprite]]) -> None:
+        # Arrange
+
+        # Act
+        group = sprite_group_cls(cell_size=32)
+
+        # Assert
+        assert group.get_cell_size() == 32
+        assert sprite_group_cls().get_cell_size() is None
+
+    def test____dunder_init____invalid_cell_size(self, sprite_group_cls: type[SpriteGroup[Sprite]]) -> None:
+        # Arrange
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            _ = sprite_group_cls(cell_size=0)
+
+    def test____sprite_collide____same_result_as_brute_force(
+        self,
+        sprite_group_cls: type[SpriteGroup[Sprite]],
+        sprite_factory: Callable[[], Sprite],
+    ) -> None:
+        # Arrange
+        sprites = [sprite_factory() for _ in range(100)]
+        group = sprite_group_cls(*sprites)
+        indexed_group = sprite_group_cls(*sprites, cell_size=16)
+
+        # Act & Assert
+        for sprite in sprites:
+            assert indexed_group.sprite_collide(sprite, dokill=False) == group.sprite_collide(sprite, dokill=False)
+            assert indexed_group.sprite_collide_any(sprite) is group.sprite_collide_any(sprite)
+
+    def test____group_collide____same_result_as_brute_force(
+        self,
+        sprite_group_cls: type[SpriteGroup[Sprite]],
+        sprite_factory: Callable[[], Sprite],
+    ) -> None:
+        # Arrange
+        sprites = [sprite_factory() for _ in range(50)]
+        others = [sprite_factory() for _ in range(50)]
+        group, other_group = sprite_group_cls(*sprites), sprite_group_cls(*others)
+        indexed_group, indexed_other_group = sprite_group_cls(*sprites, cell_size=16), sprite_group_cls(*others, cell_size=16)
+
+        # Act
+        expected = group.group_collide(other_group, False, False)
+        result = indexed_group.group_collide(indexed_other_group, False, False)
+
+        # Assert
+        assert expected
+        assert result == expected
+
+    def test____flush_colliding____same_result_as_brute_force(
+        self,
+        sprite_group_cls: type[SpriteGroup[Sprite]],
+        sprite_factory: Callable[[], Sprite],
+    ) -> None:
+        # Arrange
+        sprites = [sprite_factory() for _ in range(100)]
+        group = sprite_group_cls(*sprites)
+        expected = group.flush_colliding()
+        expected_survivors = list(group)
+        for s in sprites:
+            s.kill()
+
+        # Act
+        indexed_group = sprite_group_cls(*sprites, cell_size=16)
+        result = indexed_group.flush_colliding()
+
+        # Assert
+        assert expected
+        assert result == expected
+        assert list(indexed_group) == expected_survivors
+
+    def test____sprite_collide____index_updated_on_move_and_transform(
+        self,
+        sprite_group_cls: type[SpriteGroup[Sprite]],
+    ) -> None:
+        # Arrange
+        surface = pygame.Surface((10, 10), pygame.SRCALPHA)
+        surface.fill("red")
+        s1, s2 = Sprite(surface), Sprite(surface)
+        s2.topleft = (100, 100)
+        group = sprite_group_cls(s2, cell_size=16)
+        assert group.sprite_collide(s1, dokill=False) == []
+
+        # Act & Assert
+        s2.topleft = (5, 5)
+        assert group.sprite_collide(s1, dokill=False) == [s2]
+        s2.topleft = (20, 20)
+        assert group.sprite_collide(s1, dokill=False) == []
+        s2.set_scale(4)  # Grow around its center
+        assert group.sprite_collide(s1, dokill=False) == [s2]
+
+    def test____remove____sprite_unregistered_from_index(
+        self,
+        sprite_group_cls: type[SpriteGroup[Sprite]],
+    ) -> None:
+        # Arrange
+        surface = pygame.Surface((10, 10), pygame.SRCALPHA)
+        surface.fill("red")
+        s1, s2 = Sprite(surface), Sprite(surface)
+        group = sprite_group_cls(s1, s2, cell_size=16)
+
+        # Act
+        s2.kill()
+
+        # Assert
+        assert group.sprite_collide(s1, dokill=False) == [s1]
+        assert group.flush_colliding() == []
+
+
+class TestSpriteMask:
+    @pytest.fixture(autouse=True)
+    @staticmethod
+    def clear_mask_cache() -> Iterator[None]:
+        mask_cache.clear()
+        mask_cache.reset_stats()
+        yield
+        mask_cache.clear()
+
+    @staticmethod
+    def _create_image() -> pygame.Surface:
+        surface = pygame.Surface((20, 10), pygame.SRCALPHA)
+        surface.fill("red", (0, 0, 10, 10))
+        return surface
+
+    def test____update_transform____mask_not_computed(self) -> None:
+        # Arrange
+        sprite = Sprite(self._create_image())
+
+        # Act
+        for angle in range(0, 360, 10):
+            sprite.angle = angle
+
+        # Assert
+        assert mask_cache.misses == 0
+
+    def test____mask____follow_transform(self) -> None:
+        # Arrange
+        sprite = Sprite(self._create_image())
+        assert sprite.mask.count() == 100
+
+        # Act
+        sprite.scale = (2, 2)
+
+        # Assert
+        assert sprite.mask.get_size() == sprite.image.get_size()
+        assert sprite.mask.count() == 400
+
+    def test____mask____reused_for_same_frame_and_transform(self) -> None:
+        # Arrange
+        sprite = Sprite(self._create_image())
+        sprite.angle = 45
+        mask = sprite._Sprite__get_mask()  # type: ignore[attr-defined]
+
+        # Act
+        sprite.angle = 90
+        _ = sprite.mask
+        sprite.angle = 45
+
+        # Assert
+        assert sprite._Sprite__get_mask() is mask  # type: ignore[attr-defined]
+        assert mask_cache.misses == 2
+
+    def test____mask____shared_between_sprites_of_same_source(self) -> None:
+        # Arrange
+        image = self._create_image()
+        first = Sprite(image)
+        second = Sprite(image)
+
+        # Act
+        first.angle = second.angle = 45
+
+        # Assert
+        assert first.image is second.image
+        assert first._Sprite__get_mask() is second._Sprite__get_mask()  # type: ignore[attr-defined]
+        assert mask_cache.misses == 1
+
+    def test____mask____modifying_returned_mask_does_not_affect_other_sprites(self) -> None:
+        # Arrange
+        image = self._create_image()
+        first = Sprite(image)
+        second = Sprite(image)
+        second.topleft = (5, 5)
+        assert first.is_mask_colliding(second)
+
+        # Act
+        first.mask.clear()
+
+        # Assert
+        assert first.mask.count() == 100
+        assert second.mask.count() == 100
+        assert first.is_mask_colliding(second)
+
+    def test____is_mask_colliding____lazy_mask(self) -> None:
+        # Arrange
+        first = Sprite(self._create_image())
+        second = Sprite(self._create_image())
+        second.topleft = (15, 5)
+
+        # Act
+        intersection = first.is_mask_colliding(second)
+        second.x = 5
+
+        # Assert
+        assert intersection is None
+        assert first.is_mask_colliding(second) == (5, 5)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from pydiamond.graphics.color import Color
+from pydiamond.graphics.font import Font
+from pydiamond.graphics.surface import SurfaceRenderer
+from pydiamond.graphics.text import Text, TextCache, text_cache
+
+import pygame
+import pytest
+
+
+pytestmark = pytest.mark.usefixtures("pygame_display")
+
+
+@pytest.fixture(autouse=True)
+def clear_text_cache() -> Iterator[None]:
+    text_cache.clear()
+    text_cache.reset_stats()
+    yield
+    text_cache.clear()
+
+
+class TestTextCache:
+    def test____render____shared_between_equal_fonts(self) -> None:
+        # Arrange
+        cache = TextCache()
+
+        # Act
+        first = cache.render(Font(None, 20), "Score: 42", "white")
+        second = cache.render(Font(None, 20), "Score: 42", (255, 255, 255))
+
+        # Assert
+        assert second is first
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    @pytest.mark.parametrize(
+        ["size", "text", "fgcolor", "underline"],
+        [
+            pytest.param(30, "Score: 42", "white", False, id="size"),
+            pytest.param(20, "Score: 43", "white", False, id="text"),
+            pytest.param(20, "Score: 42", "red", False, id="color"),
+            pytest.param(20, "Score: 42", "white", True, id="style"),
+        ],
+    )
+    def test____render____miss_on_different_parameters(self, size: int, text: str, fgcolor: str, underline: bool) -> None:
+        # Arrange
+        cache = TextCache()
+        first = cache.render(Font(None, 20), "Score: 42", "white")
+        font = Font(None, size)
+        font.config.set("underline", underline)
+
+        # Act
+        second = cache.render(font, text, fgcolor)
+
+        # Assert
+        assert second is not first
+        assert cache.misses == 2
+
+    def test____max_bytes____evict_least_recently_used(self) -> None:
+        # Arrange
+        cache = TextCache()
+        font = Font(None, 20)
+        first = cache.render(font, "first", "white")
+        second = cache.render(font, "second", "white")
+
+        # Act
+        cache.max_bytes = cache.nbytes - 1
+
+        # Assert
+        assert cache.render(font, "second", "white") is second
+        assert cache.render(font, "first", "white") is not first
+
+    def test____max_bytes____zero_disables_cache(self) -> None:
+        # Arrange
+        cache = TextCache(max_bytes=0)
+        font = Font(None, 20)
+
+        # Act
+        first = cache.render(font, "text", "white")
+        second = cache.render(font, "text", "white")
+
+        # Assert
+        assert second is not first
+        assert cache.nbytes == 0
+
+
+class TestTextRendering:
+    def test____render____texts_with_same_configuration_share_surface(self) -> None:
+        # Arrange
+        first = Text("Line 1\nLine 2", font=(None, 20), color=Color(255, 0, 0), shadow_x=2, shadow_y=-2)
+        hits = text_cache.hits
+
+        # Act
+        second = Text("Line 1\nLine 2", font=(None, 20), color=Color(255, 0, 0), shadow_x=2, shadow_y=-2)
+
+        # Assert
+        assert text_cache.hits > hits
+        assert second.get_local_size() == first.get_local_size()
+
+    def test____render____config_update_invalidate(self) -> None:
+        # Arrange
+        text = Text("Score: 0", font=(None, 20))
+        size = text.get_local_size()
+
+        # Act
+        text.message = "Score: 1000000"
+
+        # Assert
+        assert text.get_local_size() != size
+
+    @pytest.mark.parametrize("dest", [(10.5, 12), pygame.Rect(-5, 30, 1, 1)], ids=repr)
+    def test____draw_text____same_output_as_render_to(self, dest: tuple[float, float] | pygame.Rect) -> None:
+        # Arrange
+        font = Font(None, 20)
+        expected = pygame.Surface((100, 50))
+        expected.fill((20, 40, 60))
+        targets = [expected.copy(), expected.copy()]
+        expected_rect = font.render_to(expected, dest, "Hello", "yellow")
+
+        # Act
+        rects = [SurfaceRenderer(target).draw_text("Hello", font, dest, "yellow") for target in targets]
+
+        # Assert
+        assert text_cache.hits == 1
+        for target, rect in zip(targets, rects, strict=True):
+            assert rect == expected_rect
+            assert pygame.image.tobytes(target, "RGB") == pygame.image.tobytes(expected, "RGB")
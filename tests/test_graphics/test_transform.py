@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import gc
+
+from pydiamond.graphics._transform import TransformCache
+
+import pygame
+import pytest
+
+
+class TestTransformCache:
+    @pytest.fixture
+    @staticmethod
+    def source() -> pygame.Surface:
+        surface = pygame.Surface((20, 10), pygame.SRCALPHA)
+        surface.fill((255, 0, 0, 255))
+        return surface
+
+    def test____rotozoom____cache_hit_returns_same_surface(self, source: pygame.Surface) -> None:
+        # Arrange
+        cache = TransformCache()
+
+        # Act
+        first = cache.rotozoom(source, 45, (2, 2))
+        second = cache.rotozoom(source, 45, (2, 2))
+
+        # Assert
+        assert first is second
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.nbytes == first.get_width() * first.get_height() * first.get_bytesize()
+
+    def test____rotozoom____same_quantized_angle_and_scale(self, source: pygame.Surface) -> None:
+        # Arrange
+        cache = TransformCache(angle_step=1, scale_step=0.1)
+
+        # Act
+        first = cache.rotozoom(source, 45.2, (1.01, 0.98))
+        second = cache.rotozoom(source, 44.9, (1, 1))
+
+        # Assert
+        assert first is second
+        assert first.get_size() == pygame.transform.rotozoom(source, 45, 1).get_size()
+
+    def test____rotozoom____distinct_sources(self, source: pygame.Surface) -> None:
+        # Arrange
+        cache = TransformCache()
+        other_source = source.copy()
+
+        # Act
+        first = cache.rotozoom(source, 45, (1, 1))
+        second = cache.rotozoom(other_source, 45, (1, 1))
+
+        # Assert
+        assert first is not second
+        assert cache.misses == 2
+
+    def test____rotozoom____evict_least_recently_used_above_byte_budget(self, source: pygame.Surface) -> None:
+        # Arrange
+        entry_nbytes = 20 * 10 * source.get_bytesize()
+        cache = TransformCache(max_bytes=2 * entry_nbytes)
+        first = cache.rotozoom(source, 0, (1, 1))
+        second = cache.rotozoom(source, 0, (1, 1), smooth=True)
+        assert cache.nbytes == 2 * entry_nbytes
+        assert cache.rotozoom(source, 0, (1, 1)) is first  # 'first' is now the most recently used
+
+        # Act
+        third = cache.rotozoom(source, 0, (0.5, 0.5))
+
+        # Assert
+        assert cache.nbytes == entry_nbytes + third.get_width() * third.get_height() * third.get_bytesize()
+        assert cache.rotozoom(source, 0, (1, 1)) is first
+        assert cache.rotozoom(source, 0, (0.5, 0.5)) is third
+        assert cache.rotozoom(source, 0, (1, 1), smooth=True) is not second
+
+    def test____rotozoom____disabled_with_zero_budget(self, source: pygame.Surface) -> None:
+        # Arrange
+        cache = TransformCache(max_bytes=0)
+
+        # Act
+        first = cache.rotozoom(source, 45, (1, 1))
+        second = cache.rotozoom(source, 45, (1, 1))
+
+        # Assert
+        assert first is not second
+        assert cache.nbytes == 0
+
+    def test____invalidate____remove_all_entries_of_source(self, source: pygame.Surface) -> None:
+        # Arrange
+        cache = TransformCache()
+        first = cache.rotozoom(source, 45, (1, 1))
+        cache.rotozoom(source, 90, (1, 1))
+
+        # Act
+        cache.invalidate(source)
+
+        # Assert
+        assert cache.nbytes == 0
+        assert cache.rotozoom(source, 45, (1, 1)) is not first
+
+    def test____source_garbage_collected____entries_removed(self) -> None:
+        # Arrange
+        cache = TransformCache()
+        source = pygame.Surface((20, 10), pygame.SRCALPHA)
+        cache.rotozoom(source, 45, (1, 1))
+
+        # Act
+        del source
+        gc.collect()
+
+        # Assert
+        assert cache.nbytes == 0
+
+    def test____shared_copy____same_source_gives_same_copy(self, source: pygame.Surface) -> None:
+        # Arrange
+        cache = TransformCache()
+
+        # Act
+        first = cache.shared_copy(source)
+        second = cache.shared_copy(source)
+
+        # Assert
+        assert first is second
+        assert first is not source
+
+    def test____shared_copy____same_subsurface_area_gives_same_copy(self, source: pygame.Surface) -> None:
+        # Arrange
+        cache = TransformCache()
+
+        # Act
+        first = cache.shared_copy(source.subsurface((0, 0, 10, 10)))
+        second = cache.shared_copy(source.subsurface((0, 0, 10, 10)))
+        other_area = cache.shared_copy(source.subsurface((10, 0, 10, 10)))
+
+        # Assert
+        assert first is second
+        assert other_area is not first
+
+    def test____shared_copy____copies_of_same_source_share_transforms(self, source: pygame.Surface) -> None:
+        # Arrange
+        cache = TransformCache()
+
+        # Act
+        first_copy = cache.shared_copy(source)
+        first = cache.rotozoom(first_copy, 45, (2, 2))
+        second = cache.rotozoom(cache.shared_copy(source), 45, (2, 2))
+
+        # Assert
+        assert first is second
+        assert cache.misses == 1
+
+    def test____invalidate____drop_shared_copies_of_source(self, source: pygame.Surface) -> None:
+        # Arrange
+        cache = TransformCache()
+        first = cache.shared_copy(source)
+
+        # Act
+        source.fill((0, 255, 0, 255))
+        cache.invalidate(source)
+
+        # Assert
+        second = cache.shared_copy(source)
+        assert second is not first
+        assert second.get_at((0, 0)) == (0, 255, 0, 255)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pydiamond.gui.widgets.abc import WidgetsManager
+from pydiamond.gui.widgets.button import Button
+from pydiamond.math.rect import ImmutableRect
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+pytestmark = pytest.mark.usefixtures("pygame_display")
+
+
+class TestButtonHitbox:
+    @pytest.fixture
+    @staticmethod
+    def manager(mocker: MockerFixture) -> WidgetsManager:
+        from pydiamond.scene.window import SceneWindow
+
+        window = mocker.NonCallableMagicMock(spec=SceneWindow)
+        window.rect = ImmutableRect(0, 0, 500, 500)
+        return WidgetsManager(window)
+
+    @pytest.fixture
+    @staticmethod
+    def button(manager: WidgetsManager) -> Button:
+        return Button(manager, width=40, height=20, outline=0)
+
+    def test____point_in_hitbox____hitbox_is_cached(self, button: Button) -> None:
+        # Arrange
+        assert button._point_in_hitbox((1, 1))
+        hitbox = button._Button__hitbox  # type: ignore[attr-defined]
+
+        # Act
+        button.topleft = (100, 100)
+        button._point_in_hitbox((1, 1))
+
+        # Assert
+        assert button._Button__hitbox is hitbox  # type: ignore[attr-defined]
+
+    @pytest.mark.parametrize("angle", [0, 90, 180, 270])
+    def test____point_in_hitbox____axis_aligned_fast_path(self, button: Button, angle: float) -> None:
+        # Arrange
+        button.angle = angle
+        width, height = button.get_size()
+
+        # Act
+        inside = button._point_in_hitbox((width / 2, height / 2))
+        outside = button._point_in_hitbox((width + 1, height / 2))
+
+        # Assert
+        assert button._Button__hitbox.bounds is not None  # type: ignore[attr-defined]
+        assert inside
+        assert not outside
+
+    def test____point_in_hitbox____rotated_uses_polygon(self, button: Button) -> None:
+        # Arrange
+        button.angle = 45
+        width, height = button.get_size()
+
+        # Act
+        center = button._point_in_hitbox((width / 2, height / 2))
+        corner = button._point_in_hitbox((1, 1))
+
+        # Assert
+        assert button._Button__hitbox.bounds is None  # type: ignore[attr-defined]
+        assert center
+        assert not corner
+
+    @pytest.mark.parametrize("attribute", ["angle", "scale", "fixed_width"])
+    def test____point_in_hitbox____recomputed_on_transformation_or_resize(self, button: Button, attribute: str) -> None:
+        # Arrange
+        button._point_in_hitbox((1, 1))
+        hitbox = button._Button__hitbox  # type: ignore[attr-defined]
+
+        # Act
+        match attribute:
+            case "angle":
+                button.angle = 45
+            case "scale":
+                button.scale = (2, 2)
+            case "fixed_width":
+                button.fixed_width = 80
+        button._point_in_hitbox((1, 1))
+
+        # Assert
+        assert button._Button__hitbox is not hitbox  # type: ignore[attr-defined]
+        assert button._Button__hitbox.key != hitbox.key  # type: ignore[attr-defined]
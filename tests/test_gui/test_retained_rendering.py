@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from pydiamond.graphics.color import BLUE, RED, TRANSPARENT
+from pydiamond.graphics.surface import SurfaceRenderer
+from pydiamond.gui.widgets._renderer import WidgetCacheRenderer
+from pydiamond.gui.widgets.abc import AbstractWidget, WidgetsManager
+from pydiamond.gui.widgets.button import Button
+from pydiamond.math.rect import ImmutableRect, Rect
+
+import pygame
+import pytest
+
+if TYPE_CHECKING:
+    from pydiamond.graphics.renderer import AbstractRenderer
+
+    from pytest_mock import MockerFixture
+
+
+pytestmark = pytest.mark.usefixtures("pygame_display")
+
+
+@pytest.fixture
+def manager(mocker: MockerFixture) -> WidgetsManager:
+    from pydiamond.scene.window import SceneWindow
+
+    window = mocker.NonCallableMagicMock(spec=SceneWindow)
+    window.rect = ImmutableRect(0, 0, 200, 200)
+    return WidgetsManager(window)
+
+
+class _WidgetFixture(AbstractWidget):
+    def __init__(self, master: AbstractWidget | WidgetsManager, size: tuple[int, int], **kwargs: Any) -> None:
+        self.draw_count: int = 0
+        super().__init__(master, **kwargs)
+        self.__size = size
+
+    def get_size(self) -> tuple[int, int]:
+        return self.__size
+
+    def draw_onto(self, target: AbstractRenderer) -> None:
+        self.draw_count += 1
+        target.fill(RED, self.get_rect())
+
+
+def _get_render_cache(widget: AbstractWidget) -> Any:
+    return widget._AbstractWidget__render_cache  # type: ignore[attr-defined]
+
+
+class TestRetainedRendering:
+    @staticmethod
+    def draw(manager: WidgetsManager) -> pygame.Surface:
+        screen = pygame.Surface((200, 200), pygame.SRCALPHA)
+        manager.draw_onto(SurfaceRenderer(screen))
+        return screen
+
+    def test____draw_onto____cache_is_reused(self, manager: WidgetsManager) -> None:
+        # Arrange
+        widget = _WidgetFixture(manager, (20, 10))
+        widget.set_retained_rendering(True)
+
+        # Act
+        self.draw(manager)
+        screen = self.draw(manager)
+
+        # Assert
+        assert widget.draw_count == 1
+        assert screen.get_at((5, 5)) == RED
+
+    def test____draw_onto____rendered_at_widget_position(self, manager: WidgetsManager) -> None:
+        # Arrange
+        widget = _WidgetFixture(manager, (20, 10))
+        widget.topleft = (100, 50)
+        widget.set_retained_rendering(True)
+
+        # Act
+        screen = self.draw(manager)
+
+        # Assert
+        assert screen.get_at((100, 50)) == RED
+        assert screen.get_at((119, 59)) == RED
+        assert screen.get_at((99, 50)) == TRANSPARENT
+        assert screen.get_at((120, 60)) == TRANSPARENT
+
+    def test____draw_onto____disabled(self, manager: WidgetsManager) -> None:
+        # Arrange
+        widget = _WidgetFixture(manager, (20, 10))
+
+        # Act
+        self.draw(manager)
+        self.draw(manager)
+
+        # Assert
+        assert widget.draw_count == 2
+        assert _get_render_cache(widget) is None
+
+    def test____invalidate_rendering____redrawn(self, manager: WidgetsManager) -> None:
+        # Arrange
+        widget = _WidgetFixture(manager, (20, 10))
+        widget.set_retained_rendering(True)
+        self.draw(manager)
+
+        # Act
+        widget.invalidate_rendering()
+        self.draw(manager)
+
+        # Assert
+        assert widget.draw_count == 2
+
+    def test____invalidate_rendering____on_configuration_update(self, manager: WidgetsManager) -> None:
+        # Arrange
+        button = Button(manager, width=40, height=20)
+        button.set_retained_rendering(True)
+        self.draw(manager)
+        assert _get_render_cache(button) is not None
+
+        # Act
+        button.config.set("bg", BLUE)
+
+        # Assert
+        assert _get_render_cache(button) is None
+
+    def test____invalidate_rendering____on_hover(self, manager: WidgetsManager) -> None:
+        # Arrange
+        button = Button(manager, width=40, height=20)
+        button.set_retained_rendering(True)
+        self.draw(manager)
+        assert _get_render_cache(button) is not None
+
+        # Act
+        button.hover = True
+
+        # Assert
+        assert _get_render_cache(button) is None
+
+    @pytest.mark.parametrize("change", ["added", "removed", "moved", "invalidated"])
+    def test____invalidate_rendering____on_child_change(self, manager: WidgetsManager, change: str) -> None:
+        # Arrange
+        parent = _WidgetFixture(manager, (100, 100))
+        child = _WidgetFixture(parent, (10, 10))
+        parent.set_retained_rendering(True)
+        self.draw(manager)
+        assert _get_render_cache(parent) is not None
+
+        # Act
+        match change:
+            case "added":
+                _WidgetFixture(parent, (10, 10))
+            case "removed":
+                child.unlink()
+            case "moved":
+                child.topleft = (20, 20)
+            case "invalidated":
+                child.invalidate_rendering()
+        self.draw(manager)
+
+        # Assert
+        assert parent.draw_count == 2
+
+
+class TestWidgetCacheRenderer:
+    @pytest.fixture
+    @staticmethod
+    def renderer() -> WidgetCacheRenderer:
+        return WidgetCacheRenderer(pygame.Surface((20, 10), pygame.SRCALPHA), (100, 50))
+
+    def test____get_rect____window_coordinates(self, renderer: WidgetCacheRenderer) -> None:
+        # Arrange
+
+        # Act & Assert
+        assert renderer.get_rect() == Rect(100, 50, 20, 10)
+        assert renderer.get_rect(center=(0, 0)) == Rect(-10, -5, 20, 10)
+        assert renderer.get_size() == (20, 10)
+
+    def test____get_clip____window_coordinates(self, renderer: WidgetCacheRenderer) -> None:
+        # Arrange
+
+        # Act & Assert
+        assert renderer.get_clip() == Rect(100, 50, 20, 10)
+        with renderer.using_clip((105, 55, 5, 5)):
+            assert renderer.get_clip() == Rect(105, 55, 5, 5)
+
+    def test____fill____translated(self, renderer: WidgetCacheRenderer) -> None:
+        # Arrange
+
+        # Act
+        rect = renderer.fill(RED, (105, 55, 5, 5))
+
+        # Assert
+        assert rect == Rect(105, 55, 5, 5)
+        assert renderer.get_target().get_at((5, 5)) == RED
+        assert renderer.get_target().get_at((4, 4)) == TRANSPARENT
+
+    def test____to_surface____area_translated(self, renderer: WidgetCacheRenderer) -> None:
+        # Arrange
+        renderer.fill(RED, (105, 55, 5, 5))
+
+        # Act
+        surface = renderer.to_surface(area=(105, 55, 5, 5))
+
+        # Assert
+        assert surface.get_size() == (5, 5)
+        assert surface.get_at((0, 0)) == RED
+        assert surface.get_at((4, 4)) == RED
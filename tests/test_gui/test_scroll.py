@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from pydiamond.graphics.color import RED
+from pydiamond.graphics.shape import RectangleShape
+from pydiamond.graphics.surface import SurfaceRenderer
+from pydiamond.gui.widgets.abc import AbstractWidget, WidgetsManager
+from pydiamond.gui.widgets.button import Button
+from pydiamond.gui.widgets.grid import Grid
+from pydiamond.gui.widgets.scroll import ScrollBar, ScrollingContainer
+from pydiamond.math.rect import ImmutableRect, Rect
+
+import pygame
+import pytest
+
+if TYPE_CHECKING:
+    from pydiamond.graphics.renderer import AbstractRenderer
+
+    from pytest_mock import MockerFixture
+
+
+pytestmark = pytest.mark.usefixtures("pygame_display")
+
+
+class _WidgetFixture(AbstractWidget):
+    def __init__(self, master: AbstractWidget | WidgetsManager, size: tuple[int, int], **kwargs: Any) -> None:
+        self.draw_count: int = 0
+        super().__init__(master, **kwargs)
+        # Like most widgets, the size is only known once the base class is initialized
+        self.__size = size
+
+    def get_size(self) -> tuple[int, int]:
+        return self.__size
+
+    def set_size(self, size: tuple[int, int]) -> None:
+        self.__size = size
+        self.invalidate_rendering()
+
+    def draw_onto(self, target: AbstractRenderer) -> None:
+        self.draw_count += 1
+
+
+class TestScrollingContainer:
+    @pytest.fixture
+    @staticmethod
+    def manager(mocker: MockerFixture) -> WidgetsManager:
+        from pydiamond.scene.window import SceneWindow
+
+        window = mocker.NonCallableMagicMock(spec=SceneWindow)
+        window.rect = ImmutableRect(0, 0, 500, 500)
+        return WidgetsManager(window)
+
+    @pytest.fixture
+    @staticmethod
+    def container(manager: WidgetsManager) -> ScrollingContainer:
+        return ScrollingContainer(manager, 100, 100)
+
+    @staticmethod
+    def draw(manager: WidgetsManager) -> None:
+        manager.draw_onto(SurfaceRenderer(pygame.Surface((500, 500))))
+
+    def test____child_added____after_draw(self, manager: WidgetsManager, container: ScrollingContainer) -> None:
+        # Arrange
+        first = _WidgetFixture(container, (50, 50))
+        self.draw(manager)
+
+        # Act
+        second = _WidgetFixture(container, (20, 20))
+        button = Button(container, width=40, height=20)
+        button.topleft = (0, 150)
+        self.draw(manager)
+
+        # Assert
+        assert first.draw_count == 2
+        assert second.draw_count == 1
+        assert container.get_whole_rect() == first.get_rect().union(button.get_rect())
+
+    def test____child_added____measured_once_initialized(self, container: ScrollingContainer) -> None:
+        # Arrange
+        assert container.get_whole_rect().size == (0, 0)
+
+        # Act
+        button = Button(container, width=40, height=20)
+
+        # Assert
+        assert container.get_whole_rect() == button.get_rect()
+
+    def test____child_removed____bounds_updated(self, container: ScrollingContainer) -> None:
+        # Arrange
+        _WidgetFixture(container, (50, 50))
+        second = _WidgetFixture(container, (50, 50))
+        second.topleft = (0, 150)
+        assert container.get_whole_rect() == Rect(0, 0, 50, 200)
+
+        # Act
+        second.unlink()
+
+        # Assert
+        assert container.get_whole_rect() == Rect(0, 0, 50, 50)
+
+    def test____child_rendering_invalidated____resized_child_updates_bounds(self, container: ScrollingContainer) -> None:
+        # Arrange
+        child = _WidgetFixture(container, (50, 50))
+        assert container.get_whole_rect() == Rect(0, 0, 50, 50)
+
+        # Act
+        child.set_size((80, 200))
+
+        # Assert
+        assert container.get_whole_rect() == Rect(0, 0, 80, 200)
+
+    def test____child_rendering_invalidated____button_resized_by_configuration(self, container: ScrollingContainer) -> None:
+        # Arrange
+        button = Button(container, width=40, height=20)
+        assert container.get_whole_rect() == button.get_rect()
+
+        # Act
+        button.fixed_height = 300
+
+        # Assert
+        assert button.get_rect().height > 300
+        assert container.get_whole_rect() == button.get_rect()
+
+    def test____draw_onto____hidden_children_are_culled(self, manager: WidgetsManager, container: ScrollingContainer) -> None:
+        # Arrange
+        visible = _WidgetFixture(container, (50, 50))
+        hidden = _WidgetFixture(container, (50, 50))
+        hidden.topleft = (0, 300)
+
+        # Act
+        self.draw(manager)
+
+        # Assert
+        assert visible.draw_count == 1
+        assert hidden.draw_count == 0
+
+    def test____yview_scroll____children_offset(self, manager: WidgetsManager, container: ScrollingContainer) -> None:
+        # Arrange
+        first = _WidgetFixture(container, (50, 50))
+        second = _WidgetFixture(container, (50, 50))
+        second.topleft = (0, 300)
+        self.draw(manager)
+
+        # Act
+        container.yview_scroll(250)
+        self.draw(manager)
+
+        # Assert
+        assert container._get_children_offset() == (0, -250)
+        assert first.topleft == (0, -250)
+        assert second.topleft == (0, 50)
+        assert container.get_whole_rect() == Rect(0, -250, 50, 350)
+        assert first.draw_count == 1
+        assert second.draw_count == 1
+
+    def test____yview_scroll____clamped_to_content(self, container: ScrollingContainer) -> None:
+        # Arrange
+        _WidgetFixture(container, (50, 50))
+        second = _WidgetFixture(container, (50, 50))
+        second.topleft = (0, 300)
+
+        # Act
+        container.yview_scroll(1000)
+
+        # Assert
+        assert container._get_children_offset() == (0, -250)
+        assert second.topleft == (0, 50)
+
+    def test____yview_scroll____grid_elements_follow(self, container: ScrollingContainer) -> None:
+        # Arrange
+        grid = Grid(container)
+        shape = grid.place(RectangleShape(50, 50, RED), 0, 0)
+        grid.place(RectangleShape(50, 250, RED), 1, 0)
+        assert shape.topleft == (0, 0)
+
+        # Act
+        container.yview_scroll(50)
+
+        # Assert
+        assert grid.topleft == (0, -50)
+        assert shape.topleft == (0, -50)
+
+    def test____yview_scroll____scrollbar_shapes_follow(self, container: ScrollingContainer) -> None:
+        # Arrange
+        _WidgetFixture(container, (50, 50))
+        scrollbar = ScrollBar(container, 20, 100)
+        scrollbar.topleft = (0, 200)
+        bg_shape = scrollbar._ScrollBar__bg_shape  # type: ignore[attr-defined]
+        assert bg_shape.center == scrollbar.center
+
+        # Act
+        container.yview_scroll(50)
+
+        # Assert
+        assert scrollbar.topleft == (0, 150)
+        assert bg_shape.center == scrollbar.center
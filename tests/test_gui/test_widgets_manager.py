@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from pydiamond.gui.widgets.abc import AbstractWidget, WidgetsManager
+from pydiamond.math.rect import ImmutableRect
+
+import pytest
+
+if TYPE_CHECKING:
+    from pydiamond.graphics.renderer import AbstractRenderer
+
+    from pytest_mock import MockerFixture
+
+
+class _WidgetFixture(AbstractWidget):
+    def __init__(self, master: AbstractWidget | WidgetsManager, size: tuple[float, float], **kwargs: Any) -> None:
+        self.__size = size
+        super().__init__(master, **kwargs)
+
+    def get_size(self) -> tuple[float, float]:
+        return self.__size
+
+    def draw_onto(self, target: AbstractRenderer) -> None:
+        raise NotImplementedError("Not meant to be called here")
+
+
+class TestWidgetsManagerHitTest:
+    @pytest.fixture
+    @staticmethod
+    def manager(mocker: MockerFixture) -> WidgetsManager:
+        from pydiamond.scene.window import SceneWindow
+
+        window = mocker.NonCallableMagicMock(spec=SceneWindow)
+        window.rect = ImmutableRect(0, 0, 100, 100)
+        return WidgetsManager(window)
+
+    def test____get_widget_at____topmost_widget(self, manager: WidgetsManager) -> None:
+        # Arrange
+        bottom = _WidgetFixture(manager, (20, 20))
+        top = _WidgetFixture(manager, (20, 20))
+
+        # Act & Assert
+        assert manager._get_widget_at((5, 5)) is top
+        assert manager._is_mouse_hovering_widget(top, (5, 5))
+        assert not manager._is_mouse_hovering_widget(bottom, (5, 5))
+
+    def test____get_widget_at____invalidated_when_root_widget_moves(self, manager: WidgetsManager) -> None:
+        # Arrange
+        bottom = _WidgetFixture(manager, (20, 20))
+        top = _WidgetFixture(manager, (20, 20))
+        assert manager._get_widget_at((5, 5)) is top
+
+        # Act
+        top.topleft = (50, 50)
+
+        # Assert
+        assert manager._get_widget_at((5, 5)) is bottom
+        assert manager._is_mouse_hovering_widget(bottom, (5, 5))
+
+    def test____get_widget_at____invalidated_when_root_widget_is_registered(self, manager: WidgetsManager) -> None:
+        # Arrange
+        bottom = _WidgetFixture(manager, (20, 20))
+        assert manager._get_widget_at((5, 5)) is bottom
+
+        # Act
+        top = _WidgetFixture(manager, (20, 20))
+
+        # Assert
+        assert manager._get_widget_at((5, 5)) is top
+
+    def test____get_widget_at____invalidated_when_root_widget_is_unregistered(self, manager: WidgetsManager) -> None:
+        # Arrange
+        bottom = _WidgetFixture(manager, (20, 20))
+        top = _WidgetFixture(manager, (20, 20))
+        assert manager._get_widget_at((5, 5)) is top
+
+        # Act
+        top.unlink()
+
+        # Assert
+        assert manager._get_widget_at((5, 5)) is bottom
+
+    def test____get_widget_at____child_move_does_not_change_root_widget(self, manager: WidgetsManager) -> None:
+        # Arrange
+        root = _WidgetFixture(manager, (20, 20))
+        child = _WidgetFixture(root, (5, 5))
+
+        # Act
+        child.topleft = (10, 10)
+
+        # Assert
+        assert manager._get_widget_at((5, 5)) is root
+        assert manager._get_widget_at((50, 50)) is None
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pydiamond.math import intersection
+from pydiamond.math.intersection import is_inside_polygon, is_inside_polygon_batch
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+HEXAGON: tuple[tuple[float, float], ...] = ((0, 0), (10, 0), (12, 5), (10, 10), (0, 10), (-2, 5))
+SQUARE: tuple[tuple[float, float], ...] = ((0, 0), (10, 0), (10, 10), (0, 10))
+CONCAVE: tuple[tuple[float, float], ...] = ((0, 0), (10, 0), (10, 10), (5, 5), (0, 10))
+
+
+@pytest.fixture(params=["numpy", "fallback"])
+def batch_implementation(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "numpy":
+        if intersection.numpy is None:
+            pytest.skip("numpy is not installed")
+    else:
+        monkeypatch.setattr(intersection, "numpy", None)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    ["polygon", "point", "expected"],
+    [
+        pytest.param(HEXAGON, (5, 5), True, id="hexagon-center-at-vertex-height"),
+        pytest.param(HEXAGON, (11, 5), True, id="hexagon-near-vertex"),
+        pytest.param(HEXAGON, (-2, 5), True, id="hexagon-on-vertex"),
+        pytest.param(HEXAGON, (13, 5), False, id="hexagon-right-of-vertex"),
+        pytest.param(HEXAGON, (-3, 5), False, id="hexagon-left-of-vertex"),
+        pytest.param(HEXAGON, (5, 0), True, id="hexagon-on-edge"),
+        pytest.param(HEXAGON, (5, 11), False, id="hexagon-outside"),
+        pytest.param(SQUARE, (5, 5), True, id="square-inside"),
+        pytest.param(SQUARE, (10, 10), True, id="square-on-corner"),
+        pytest.param(SQUARE, (-5, 0), False, id="square-aligned-with-top-edge"),
+        pytest.param(CONCAVE, (5, 2), True, id="concave-inside"),
+        pytest.param(CONCAVE, (5, 8), False, id="concave-in-notch"),
+        pytest.param(CONCAVE, (5, 5), True, id="concave-on-notch-vertex"),
+        pytest.param(SQUARE[:2], (5, 0), False, id="not-a-polygon"),
+    ],
+)
+def test____is_inside_polygon____expected_result(
+    polygon: Sequence[tuple[float, float]],
+    point: tuple[float, float],
+    expected: bool,
+) -> None:
+    # Arrange
+
+    # Act
+    result = is_inside_polygon(polygon, point)
+
+    # Assert
+    assert result is expected
+
+
+@pytest.mark.parametrize("polygon", [HEXAGON, SQUARE, CONCAVE], ids=["hexagon", "square", "concave"])
+def test____is_inside_polygon_batch____same_results_as_is_inside_polygon(
+    polygon: Sequence[tuple[float, float]],
+    batch_implementation: str,
+) -> None:
+    # Arrange
+    points = [(x / 2, y / 2) for x in range(-6, 27) for y in range(-4, 25)]
+
+    # Act
+    results = is_inside_polygon_batch(polygon, points)
+
+    # Assert
+    assert results == [is_inside_polygon(polygon, p) for p in points]
+
+
+def test____is_inside_polygon_batch____empty_inputs(batch_implementation: str) -> None:
+    # Arrange
+
+    # Act & Assert
+    assert is_inside_polygon_batch(HEXAGON, []) == []
+    assert is_inside_polygon_batch(SQUARE[:2], [(5, 0), (5, 5)]) == [False, False]
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from pydiamond.resources.loader import AbstractResourceLoader
+from pydiamond.resources.manager import ResourceManager
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _TextLoader(AbstractResourceLoader[str]):
+    __slots__ = ()
+
+    def load(self) -> str:
+        with self.resource.open() as fp:
+            return fp.read().decode()
+
+    def preload(self) -> Callable[[], str]:
+        text = self.load()
+        worker = threading.current_thread()
+        return lambda: f"{text}:{worker is not threading.current_thread()}"
+
+
+def _create_resource_manager(tmp_path: Path) -> Any:
+    for name in ["a", "b", "c", "d"]:
+        (tmp_path / f"{name}.txt").write_text(name)
+
+    class Resources(ResourceManager):
+        single: str
+        nested: tuple[str, dict[str, str]]
+        __resources_location__ = tmp_path
+        __resource_loader__ = _TextLoader
+        __resources_files__ = {
+            "single": "a.txt",
+            "nested": ["b.txt", {"c": "c.txt", "d": "d.txt"}],
+        }
+
+    return Resources
+
+
+class TestResourceManagerAsync:
+    def test____load_all_resources_async____complete_in_main_thread(self, tmp_path: Path) -> None:
+        # Arrange
+        Resources = _create_resource_manager(tmp_path)
+        progress: list[tuple[int, int]] = []
+
+        # Act
+        task = Resources.load_all_resources_async(max_workers=2, on_progress=lambda *args: progress.append(args))
+        task.wait()
+
+        # Assert
+        assert task.done() and not task.cancelled()
+        assert task.progress == 1.0
+        assert Resources.single == "a:True"
+        assert Resources.nested == ("b:True", {"c": "c:True", "d": "d:True"})
+        assert Resources.get_nb_loaded_resources() == 4
+        assert progress[-1] == (4, 4)
+        assert [loaded for loaded, _ in progress] == sorted({loaded for loaded, _ in progress})
+
+    def test____load_async____skip_loaded_resources(self, tmp_path: Path) -> None:
+        # Arrange
+        Resources = _create_resource_manager(tmp_path)
+        Resources.load("single")
+
+        # Act
+        task = Resources.load_async("single", "nested")
+        task.wait()
+
+        # Assert
+        assert task.total == 3
+        assert Resources.single == "a"
+
+    def test____poll____raise_loading_error(self, tmp_path: Path) -> None:
+        # Arrange
+        Resources = _create_resource_manager(tmp_path)
+        (tmp_path / "c.txt").unlink()
+        task = Resources.load_async("nested")
+
+        # Act & Assert
+        with pytest.raises(FileNotFoundError):
+            task.wait()
+        assert task.cancelled()
+        with pytest.raises(AttributeError):
+            Resources.nested
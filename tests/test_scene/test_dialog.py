@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from pydiamond.scene.abc import Scene
+from pydiamond.scene.dialog import Dialog
+from pydiamond.scene.window import SceneWindow, _SceneManager
+
+import pygame
+import pytest
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from pytest_mock import MockerFixture
+
+
+class _MasterScene(Scene):
+    def awake(self, **kwargs: Any) -> None:
+        self.render_count: int = 0
+
+    def render(self) -> None:
+        self.render_count += 1
+
+
+class _FrozenDialog(Dialog, freeze_master=True):
+    def awake(self, **kwargs: Any) -> None:
+        pass
+
+    def render(self) -> None:
+        pass
+
+
+class _StackedFrozenDialog(_FrozenDialog):
+    pass
+
+
+class _LiveDialog(Dialog):
+    def awake(self, **kwargs: Any) -> None:
+        pass
+
+    def render(self) -> None:
+        pass
+
+
+class TestMasterSnapshot:
+    @pytest.fixture
+    @staticmethod
+    def captures() -> list[pygame.Surface]:
+        return []
+
+    @pytest.fixture
+    @staticmethod
+    def mock_window(mocker: MockerFixture, captures: list[pygame.Surface]) -> MagicMock:
+        window = mocker.NonCallableMagicMock(spec=SceneWindow)
+        window.size = (100, 100)
+
+        @contextmanager
+        def capture(draw_on_default_at_end: bool = False) -> Iterator[pygame.Surface]:
+            surface = pygame.Surface(window.size)
+            captures.append(surface)
+            yield surface
+
+        window.renderer.capture.side_effect = capture
+        return window
+
+    @pytest.fixture
+    @staticmethod
+    def manager(mock_window: MagicMock) -> _SceneManager:
+        manager = _SceneManager(mock_window)
+        with pytest.raises(_SceneManager.NewScene):
+            manager.go_to(_MasterScene)
+        return manager
+
+    @pytest.fixture
+    @staticmethod
+    def master(manager: _SceneManager) -> _MasterScene:
+        master = manager.top()
+        assert isinstance(master, _MasterScene)
+        return master
+
+    @staticmethod
+    def run_dialog(
+        manager: _SceneManager,
+        mock_window: MagicMock,
+        dialog_cls: type[Dialog],
+        frame: Callable[[Dialog], None],
+    ) -> None:
+        # The dialog loop runs a single frame
+        def loop() -> bool:
+            dialog = manager.top()
+            assert isinstance(dialog, dialog_cls)
+            frame(dialog)
+            return False
+
+        mock_window.loop.side_effect = loop
+        manager.open_dialog(dialog_cls)
+
+    def test____render____snapshot_reused(
+        self,
+        manager: _SceneManager,
+        master: _MasterScene,
+        mock_window: MagicMock,
+        captures: list[pygame.Surface],
+    ) -> None:
+        # Arrange
+        def frame(dialog: Dialog) -> None:
+            for _ in range(3):
+                manager._render(dialog)
+
+        # Act
+        self.run_dialog(manager, mock_window, _FrozenDialog, frame)
+
+        # Assert
+        assert master.render_count == 1
+        assert len(captures) == 1
+        assert mock_window.renderer.draw_surface.call_count == 2
+        for call in mock_window.renderer.draw_surface.call_args_list:
+            assert call.args[0] is captures[0]
+
+    def test____render____master_rendered_each_time_without_freeze(
+        self,
+        manager: _SceneManager,
+        master: _MasterScene,
+        mock_window: MagicMock,
+        captures: list[pygame.Surface],
+    ) -> None:
+        # Arrange
+        def frame(dialog: Dialog) -> None:
+            for _ in range(3):
+                manager._render(dialog)
+
+        # Act
+        self.run_dialog(manager, mock_window, _LiveDialog, frame)
+
+        # Assert
+        assert master.render_count == 3
+        assert captures == []
+
+    def test____render____snapshot_retaken_on_resize(
+        self,
+        manager: _SceneManager,
+        master: _MasterScene,
+        mock_window: MagicMock,
+        captures: list[pygame.Surface],
+    ) -> None:
+        # Arrange
+        def frame(dialog: Dialog) -> None:
+            manager._render(dialog)
+            mock_window.size = (200, 150)
+            manager._render(dialog)
+            manager._render(dialog)
+
+        # Act
+        self.run_dialog(manager, mock_window, _FrozenDialog, frame)
+
+        # Assert
+        assert master.render_count == 2
+        assert [surface.get_size() for surface in captures] == [(100, 100), (200, 150)]
+
+    def test____render____snapshot_retaken_when_background_fill_differs(
+        self,
+        manager: _SceneManager,
+        master: _MasterScene,
+        mock_window: MagicMock,
+    ) -> None:
+        # Arrange
+        def frame(dialog: Dialog) -> None:
+            manager._render(dialog, fill_background_color=True)
+            manager._render(dialog, fill_background_color=False)
+
+        # Act
+        self.run_dialog(manager, mock_window, _FrozenDialog, frame)
+
+        # Assert
+        assert master.render_count == 2
+
+    def test____invalidate_snapshot____master_scene(
+        self,
+        manager: _SceneManager,
+        master: _MasterScene,
+        mock_window: MagicMock,
+    ) -> None:
+        # Arrange
+        def frame(dialog: Dialog) -> None:
+            manager._render(dialog)
+            master.invalidate_snapshot()
+            manager._render(dialog)
+            manager._render(dialog)
+
+        # Act
+        self.run_dialog(manager, mock_window, _FrozenDialog, frame)
+
+        # Assert
+        assert master.render_count == 2
+
+    def test____invalidate_snapshot____stacked_dialogs(
+        self,
+        manager: _SceneManager,
+        master: _MasterScene,
+        mock_window: MagicMock,
+        captures: list[pygame.Surface],
+    ) -> None:
+        # Arrange
+        counts: list[tuple[int, int]] = []
+
+        def stacked_frame(dialog: Dialog) -> None:
+            manager._render(dialog)
+            counts.append((master.render_count, len(captures)))
+            # The first dialog changed: only the snapshot of the second one is dropped
+            dialog.master.invalidate_snapshot()
+            manager._render(dialog)
+            counts.append((master.render_count, len(captures)))
+            # The master scene changed: both snapshots are dropped
+            master.invalidate_snapshot()
+            manager._render(dialog)
+            counts.append((master.render_count, len(captures)))
+
+        def frame(dialog: Dialog) -> None:
+            self.run_dialog(manager, mock_window, _StackedFrozenDialog, stacked_frame)
+
+        # Act
+        self.run_dialog(manager, mock_window, _FrozenDialog, frame)
+
+        # Assert
+        assert counts == [(1, 2), (1, 3), (2, 5)]
+
+    def test____open_dialog____snapshot_released_on_close(
+        self,
+        manager: _SceneManager,
+        mock_window: MagicMock,
+    ) -> None:
+        # Arrange
+        master_snapshots: dict[Dialog, Any] = manager._SceneManager__master_snapshots  # type: ignore[attr-defined]
+        snapshot_taken: list[bool] = []
+
+        def frame(dialog: Dialog) -> None:
+            manager._render(dialog)
+            snapshot_taken.append(dialog in master_snapshots)
+
+        # Act
+        self.run_dialog(manager, mock_window, _FrozenDialog, frame)
+
+        # Assert
+        assert snapshot_taken == [True]
+        assert master_snapshots == {}
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from pydiamond.scene.profiler import FramePhase, FrameProfiler, FrameStats
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def perf_counter(mocker: MockerFixture) -> list[int]:
+    now: list[int] = [0]
+    mocker.patch("pydiamond.scene.profiler.perf_counter_ns", side_effect=lambda: now[0])
+    return now
+
+
+def _record_frame(profiler: FrameProfiler, now: list[int], **phases_ms: int) -> None:
+    profiler.start_frame()
+    for phase, duration in phases_ms.items():
+        now[0] += duration * 1_000_000
+        profiler.lap(FramePhase[phase.upper()])
+    profiler.end_frame()
+
+
+class TestFrameProfiler:
+    def test____get_frame_stats____percentiles(self, perf_counter: list[int]) -> None:
+        # Arrange
+        profiler = FrameProfiler()
+
+        # Act
+        for duration in range(1, 101):
+            _record_frame(profiler, perf_counter, update=duration)
+
+        # Assert
+        assert profiler.get_frame_stats() == FrameStats(100, 50, 95, 99, 100)
+        assert profiler.get_phase_stats(FramePhase.UPDATE) == FrameStats(100, 50, 95, 99, 100)
+        assert profiler.get_phase_stats(FramePhase.RENDER) == FrameStats(100, 0, 0, 0, 0)
+
+    def test____end_frame____ring_buffer_keep_last_frames(self, perf_counter: list[int]) -> None:
+        # Arrange
+        profiler = FrameProfiler(capacity=3)
+
+        # Act
+        for duration in range(1, 6):
+            _record_frame(profiler, perf_counter, render=duration)
+
+        # Assert
+        assert profiler.frame_count == 3
+        assert profiler.get_frame_stats() == FrameStats(3, 4, 5, 5, 5)
+
+    def test____lap____ignored_outside_frame(self, perf_counter: list[int]) -> None:
+        # Arrange
+        profiler = FrameProfiler()
+        _record_frame(profiler, perf_counter, update=2)
+
+        # Act
+        perf_counter[0] += 10_000_000
+        profiler.lap(FramePhase.UPDATE)
+
+        # Assert
+        assert profiler.get_phase_stats(FramePhase.UPDATE).max == 2
+
+    def test____export_chrome_trace____sequential_phase_events(self, perf_counter: list[int], tmp_path: Path) -> None:
+        # Arrange
+        profiler = FrameProfiler()
+        _record_frame(profiler, perf_counter, events=1, fixed_update=2, render=3)
+        trace_file = tmp_path / "trace.json"
+
+        # Act
+        profiler.export_chrome_trace(trace_file)
+
+        # Assert
+        events = json.loads(trace_file.read_text())["traceEvents"]
+        assert [(e["name"], e["ts"], e["dur"]) for e in events] == [
+            ("frame", 0, 6000),
+            ("events", 0, 1000),
+            ("fixed_update", 1000, 2000),
+            ("render", 3000, 3000),
+        ]
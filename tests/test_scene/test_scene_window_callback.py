@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pydiamond.scene.abc import Scene
+from pydiamond.scene.window import _SceneWindowCallback
+from pydiamond.window.display import _WindowCallbackScheduler
+
+import pytest
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from pytest_mock import MockerFixture
+
+
+class TestSceneWindowCallback:
+    @pytest.fixture
+    @staticmethod
+    def now(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        now: list[float] = [0]
+        monkeypatch.setattr(_WindowCallbackScheduler, "get_time", staticmethod(lambda: now[0]))
+        return now
+
+    @pytest.fixture
+    @staticmethod
+    def mock_scene(mocker: MockerFixture) -> MagicMock:
+        scene = mocker.NonCallableMagicMock(spec=Scene)
+        scene.looping.return_value = True
+        return scene
+
+    @pytest.mark.parametrize("loop", [False, True], ids=lambda loop: f"loop=={loop}")
+    def test____dunder_call____not_called_while_scene_is_paused(
+        self,
+        loop: bool,
+        now: list[float],
+        mock_scene: MagicMock,
+    ) -> None:
+        # Arrange
+        calls: list[float] = []
+        callback = _SceneWindowCallback(mock_scene, 10, lambda: calls.append(now[0]), loop=loop)
+        calls.clear()
+        mock_scene.looping.return_value = False
+        now[0] = 50
+
+        # Act
+        callback()
+
+        # Assert
+        assert calls == []
+        assert callback._due_time == 10
+
+    def test____dunder_call____called_as_soon_as_scene_is_resumed(self, now: list[float], mock_scene: MagicMock) -> None:
+        # Arrange
+        calls: list[float] = []
+        callback = _SceneWindowCallback(mock_scene, 10, lambda: calls.append(now[0]))
+        mock_scene.looping.return_value = False
+        now[0] = 50
+        callback()
+
+        # Act
+        mock_scene.looping.return_value = True
+        now[0] = 51
+        callback()
+
+        # Assert
+        assert calls == [51]
+
+    def test____dunder_call____loop_catches_up_after_resume(self, now: list[float], mock_scene: MagicMock) -> None:
+        # Arrange
+        calls: list[float] = []
+        callback = _SceneWindowCallback(mock_scene, 10, lambda: calls.append(now[0]), loop=True)
+        calls.clear()
+        mock_scene.looping.return_value = False
+        now[0] = 25
+        callback()
+
+        # Act
+        mock_scene.looping.return_value = True
+        for _ in range(3):
+            callback()
+
+        # Assert
+        assert calls == [25, 25]
+        assert callback._due_time == 30
@@ -527,6 +527,58 @@ def test_ior_act_as_update() -> None:
     assert len(sd) == 8
 
 
+########################
+# Range queries
+########################
+
+
+def test_bisect() -> None:
+    sd: SortedDict[int, None] = SortedDict.fromkeys([40, 10, 30, 20])
+
+    assert sd.bisect_left(20) == 1
+    assert sd.bisect_right(20) == 2
+    assert sd.bisect(25) == 2
+    assert sd.bisect_left(0) == 0
+    assert sd.bisect_right(50) == 4
+
+
+@pytest.mark.parametrize(
+    ["minimum", "maximum", "inclusive", "reverse", "expected"],
+    [
+        pytest.param(None, None, (True, True), False, [10, 20, 30, 40], id="all"),
+        pytest.param(20, 30, (True, True), False, [20, 30], id="inclusive"),
+        pytest.param(20, 30, (False, False), False, [], id="exclusive"),
+        pytest.param(15, None, (True, True), False, [20, 30, 40], id="minimum-only"),
+        pytest.param(None, 30, (True, False), True, [20, 10], id="maximum-only-reverse"),
+        pytest.param(10, 40, (False, True), True, [40, 30, 20], id="reverse"),
+        pytest.param(35, 15, (True, True), False, [], id="empty-range"),
+    ],
+)
+def test_irange(
+    minimum: int | None,
+    maximum: int | None,
+    inclusive: tuple[bool, bool],
+    reverse: bool,
+    expected: list[int],
+) -> None:
+    sd: SortedDict[int, None] = SortedDict.fromkeys([40, 10, 30, 20])
+
+    assert list(sd.irange(minimum, maximum, inclusive=inclusive, reverse=reverse)) == expected
+
+
+def test_keys_order_after_mixed_operations() -> None:
+    sd: SortedDict[int, int] = SortedDict()
+
+    for i in (5, 3, 9, 1, 7, 3, 5):
+        sd[i] = i
+    del sd[3]
+    sd.pop(9)
+    sd.setdefault(4, 4)
+    sd.setdefault(5, 0)
+
+    assert list(sd.items()) == [(1, 1), (4, 4), (5, 5), (7, 7)]
+
+
 ########################
 # Copy/Pickle
 ########################
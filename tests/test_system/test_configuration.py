@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+from pydiamond.system.configuration import ConfigurationError, ConfigurationTemplate, OptionAttribute
+
+import pytest
+
+
+class _Counter:
+    config: ClassVar[ConfigurationTemplate] = ConfigurationTemplate("a", "b", "c")
+
+    a: OptionAttribute[int] = OptionAttribute()
+    b: OptionAttribute[int] = OptionAttribute()
+    c: OptionAttribute[int] = OptionAttribute()
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.config.only_update(a=0, b=0, c=0)
+
+    config.add_value_converter_on_set_static("a", int)
+
+    @config.on_update("a")
+    @config.on_update("b")
+    def __on_update_ab(self) -> None:
+        self.calls.append("ab")
+
+    @config.add_main_update
+    def __main_update(self) -> None:
+        self.calls.append("main")
+
+
+class _Hookless:
+    config: ClassVar[ConfigurationTemplate] = ConfigurationTemplate("a")
+
+    a: OptionAttribute[int] = OptionAttribute()
+
+    config.add_value_validator_static("a", int)
+    config.add_value_converter_on_set_static("a", lambda value: value * 2)
+
+
+class TestConfiguration:
+    def test____set____hookless_option_apply_validators_and_converters(self) -> None:
+        # Arrange
+        obj = _Hookless()
+
+        # Act
+        obj.a = 21
+
+        # Assert
+        assert obj.a == 42
+        with pytest.raises(TypeError):
+            obj.a = "21"  # type: ignore[assignment]
+
+    def test____set____call_hooks_for_each_modification(self) -> None:
+        # Arrange
+        obj = _Counter()
+
+        # Act
+        obj.a = 1
+        obj.b = 2
+        obj.c = 3
+
+        # Assert
+        assert obj.calls == ["ab", "main", "ab", "main", "main"]
+
+    def test____batch____coalesce_update_hooks(self) -> None:
+        # Arrange
+        obj = _Counter()
+
+        # Act
+        with obj.config.batch():
+            obj.a = 1
+            obj.b = 2
+            obj.config.update(a=5, c=3)
+            with _Counter.config.batch(obj):
+                obj.c = 4
+            assert obj.calls == []
+            assert obj.config.has_batch_context()
+
+        # Assert
+        assert obj.calls == ["ab", "main"]
+        assert (obj.a, obj.b, obj.c) == (5, 2, 4)
+        assert not obj.config.has_batch_context()
+
+    def test____batch____no_modification(self) -> None:
+        # Arrange
+        obj = _Counter()
+
+        # Act
+        with obj.config.batch():
+            obj.a = "0"  # type: ignore[assignment]
+
+        # Assert
+        assert obj.calls == []
+
+    def test____batch____inside_update_hook(self) -> None:
+        # Arrange
+        class Object(_Counter):
+            config: ClassVar[ConfigurationTemplate] = ConfigurationTemplate(parent=_Counter.config)
+
+            @config.on_update("c")
+            def __on_update_c(self) -> None:
+                with self.config.batch():
+                    self.a = self.c
+                    self.b = self.c
+
+        obj = Object()
+
+        # Act
+        obj.c = 3
+
+        # Assert
+        assert obj.calls == ["ab", "main", "main"]
+        assert (obj.a, obj.b) == (3, 3)
+
+    def test____batch____forbidden_for_section_configuration(self) -> None:
+        # Arrange
+        class Parent:
+            config: ClassVar[ConfigurationTemplate] = ConfigurationTemplate()
+
+            def __init__(self) -> None:
+                self.child = _Counter()
+
+            config.add_section("child", lambda self: self.child.config)
+
+        obj: Any = Parent()
+
+        # Act & Assert
+        with pytest.raises(ConfigurationError):
+            with obj.config.section("child").batch():
+                pass
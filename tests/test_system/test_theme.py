@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from typing import Any
+
+from pydiamond.system.object import Object
+from pydiamond.system.theme import ClassWithThemeNamespace, ThemedObjectMeta, ThemeNamespace, ThemeType
+
+import pytest
+
+
+def _create_themed_classes() -> tuple[ThemedObjectMeta, ThemedObjectMeta]:
+    class Base(Object, metaclass=ThemedObjectMeta):
+        def __init__(self, *, a: int = 0, b: int = 0, theme: ThemeType | None = None) -> None:
+            super().__init__()
+            self.a = a
+            self.b = b
+
+    class Child(Base):
+        def __init__(self, *, a: int = 0, b: int = 0, c: int = 0, theme: ThemeType | None = None) -> None:
+            super().__init__(a=a, b=b)
+            self.c = c
+
+    return Base, Child
+
+
+class TestThemedObjectMeta:
+    @pytest.fixture
+    @staticmethod
+    def classes() -> tuple[ThemedObjectMeta, ThemedObjectMeta]:
+        return _create_themed_classes()
+
+    def test____dunder_call____apply_parent_and_default_themes(self, classes: tuple[ThemedObjectMeta, ThemedObjectMeta]) -> None:
+        # Arrange
+        Base, Child = classes
+        Base.set_theme("theme", {"a": 1})
+        Child.set_theme("theme", {"c": 3})
+        Child.set_default_theme("theme")
+
+        # Act
+        objects: list[Any] = [Child() for _ in range(3)]
+
+        # Assert
+        assert all((obj.a, obj.b, obj.c) == (1, 0, 3) for obj in objects)
+
+    def test____dunder_call____explicit_kwargs_override_theme(self, classes: tuple[ThemedObjectMeta, ThemedObjectMeta]) -> None:
+        # Arrange
+        Base, Child = classes
+        Base.set_theme("theme", {"a": 1, "b": 2})
+        Child(theme="theme")
+
+        # Act
+        obj: Any = Child(theme="theme", b=42)
+
+        # Assert
+        assert (obj.a, obj.b) == (1, 42)
+
+    @pytest.mark.parametrize("update_method", ["set_theme", "set_default_theme"])
+    def test____dunder_call____theme_update_after_instantiation(
+        self,
+        classes: tuple[ThemedObjectMeta, ThemedObjectMeta],
+        update_method: str,
+    ) -> None:
+        # Arrange
+        Base, Child = classes
+        Base.set_theme("theme", {"a": 1})
+        Base.set_theme("other", {"a": 2})
+        Child.set_default_theme("theme")
+        assert Child().a == 1
+
+        # Act
+        match update_method:
+            case "set_theme":
+                Base.set_theme("theme", {"a": 3})
+                expected_a = 3
+            case "set_default_theme":
+                Child.set_default_theme("other")
+                expected_a = 2
+            case _:
+                pytest.fail("Invalid parameter")
+
+        # Assert
+        assert Child().a == expected_a
+
+    def test____dunder_call____theme_namespace(self, classes: tuple[ThemedObjectMeta, ThemedObjectMeta]) -> None:
+        # Arrange
+        Base, Child = classes
+        Base.set_theme("theme", {"a": 1})
+        with ThemeNamespace("test_namespace"):
+            Base.set_theme("theme", {"b": 2})
+
+        # Act
+        outside: Any = Child(theme="theme")
+        with ThemeNamespace("test_namespace"):
+            inside: Any = Child(theme="theme")
+        with ThemeNamespace("test_namespace", extend=True):
+            extended: Any = Child(theme="theme")
+
+        # Assert
+        assert (outside.a, outside.b) == (1, 0)
+        assert (inside.a, inside.b) == (0, 2)
+        assert (extended.a, extended.b) == (1, 2)
+
+
+class TestClassWithThemeNamespaceMeta:
+    def test____theme_namespace_decorator____nested_calls_use_class_namespace(self) -> None:
+        # Arrange
+        class Namespaced(ClassWithThemeNamespace):
+            def outer(self) -> tuple[str | None, str | None]:
+                return ThemeNamespace.get_actual_namespace_name(), self.inner()
+
+            def inner(self) -> str | None:
+                return ThemeNamespace.get_actual_namespace_name()
+
+        Namespaced.set_theme_namespace("decorated")
+        obj = Namespaced()
+
+        # Act & Assert
+        assert obj.outer() == ("decorated", "decorated")
+        assert ThemeNamespace.get_actual_namespace_name() is None
+
+        Namespaced.set_theme_namespace("other")
+        assert obj.outer() == ("other", "other")
+
+    @pytest.mark.parametrize("extend", [False, True], ids=lambda extend: f"extend=={extend}")
+    def test____is_active____only_when_entering_would_not_change_themes(self, extend: bool) -> None:
+        # Arrange
+        namespace = ThemeNamespace("test_namespace", extend=extend)
+
+        # Act & Assert
+        assert not namespace.is_active()
+        with namespace:
+            assert namespace.is_active()
+        with ThemeNamespace("test_namespace", extend=True), ThemeNamespace("test_namespace", extend=True):
+            assert namespace.is_active() is extend
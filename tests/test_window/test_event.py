@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from timeit import repeat
+from types import MappingProxyType
+from typing import Any
+
+from pydiamond.window.controller import ControllerAxis
+from pydiamond.window.event import (
+    ControllerAxisMotionEvent,
+    Event,
+    EventFactory,
+    EventManager,
+    KeyDownEvent,
+    MouseMotionEvent,
+    TextInputEvent,
+)
+
+import pygame
+import pytest
+
+
+def _recorder(calls: list[str], name: str, result: bool) -> Callable[[Any], bool]:
+    def callback(event: Any) -> bool:
+        calls.append(name)
+        return result
+
+    return callback
+
+
+@pytest.fixture
+def motion_event() -> MouseMotionEvent:
+    return MouseMotionEvent(pos=(1, 1), rel=(0, 0), buttons=(False, False, False), touch=False)
+
+
+class TestEventManager:
+    def test____process_event____callbacks_order(self, motion_event: MouseMotionEvent) -> None:
+        # Arrange
+        manager = EventManager(priority_callbacks=False)
+        calls: list[str] = []
+        manager.bind(None, _recorder(calls, "any", True))
+        manager.bind(MouseMotionEvent, _recorder(calls, "first", False))
+        manager.bind(MouseMotionEvent, _recorder(calls, "second", True))
+        manager.bind(TextInputEvent, _recorder(calls, "text", True))
+
+        # Act
+        handled = manager._process_event(motion_event)
+
+        # Assert
+        assert handled
+        assert calls == ["first", "second"]
+
+    def test____process_event____dispatch_table_updated_on_bind_and_unbind(self, motion_event: MouseMotionEvent) -> None:
+        # Arrange
+        manager = EventManager()
+        calls: list[Any] = []
+
+        def callback(event: Event) -> bool:
+            calls.append(event)
+            return True
+
+        assert not manager._process_event(motion_event)
+
+        # Act & Assert
+        manager.bind(MouseMotionEvent, callback)
+        assert manager._process_event(motion_event)
+        manager.unbind(MouseMotionEvent, callback)
+        assert not manager._process_event(motion_event)
+        manager.bind(None, callback)
+        assert manager._process_event(motion_event)
+        manager.clear()
+        assert not manager._process_event(motion_event)
+        assert calls == [motion_event, motion_event]
+
+    def test____process_event____key_callback_before_event_callbacks(self) -> None:
+        # Arrange
+        manager = EventManager()
+        calls: list[str] = []
+        manager.bind(None, _recorder(calls, "any", True))
+        manager.bind_key_press(42, _recorder(calls, "key", False))
+        event = KeyDownEvent(key=42, mod=0, unicode="", scancode=0)
+
+        # Act
+        handled = manager._process_event(event)
+
+        # Assert
+        assert handled
+        assert calls == ["key"]
+
+
+_PYGAME_EVENTS: list[pygame.event.Event] = [
+    pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 2), rel=(3, 4), buttons=(1, 0, 0), touch=False, window=None),
+    pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0, unicode="a", scancode=4, window=None),
+    pygame.event.Event(pygame.CONTROLLERAXISMOTION, instance_id=0, axis=1, value=300),
+]
+
+
+class TestEventFactory:
+    @pytest.mark.parametrize("pygame_event", _PYGAME_EVENTS, ids=lambda event: pygame.event.event_name(event.type))
+    def test____from_pygame_event____same_as_from_dict(self, pygame_event: pygame.event.Event) -> None:
+        # Arrange
+        event_cls = EventFactory.pygame_type[pygame_event.type]
+
+        # Act
+        event = EventFactory.from_pygame_event(pygame_event)
+
+        # Assert
+        assert type(event) is event_cls
+        assert event == event_cls.from_dict(MappingProxyType(pygame_event.__dict__))
+        assert not hasattr(event, "__dict__")
+
+    def test____from_pygame_event____post_init_is_called(self) -> None:
+        # Arrange
+        pygame_event = _PYGAME_EVENTS[-1]
+
+        # Act
+        event = EventFactory.from_pygame_event(pygame_event)
+
+        # Assert
+        assert isinstance(event, ControllerAxisMotionEvent)
+        assert event.axis is ControllerAxis.LEFT_Y
+
+    def test____from_pygame_event____missing_attribute(self) -> None:
+        # Arrange
+        pygame_event = pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 2))
+
+        # Act & Assert
+        with pytest.raises(TypeError):
+            EventFactory.from_pygame_event(pygame_event)
+
+    @pytest.mark.slow
+    def test____from_pygame_event____faster_than_from_dict(self) -> None:
+        # Arrange
+        pygame_event = _PYGAME_EVENTS[0]
+        from_dict = MouseMotionEvent.from_dict
+
+        # Act
+        specialized = min(repeat(lambda: EventFactory.from_pygame_event(pygame_event), number=2000, repeat=5))
+        generic = min(repeat(lambda: from_dict(MappingProxyType(pygame_event.__dict__)), number=2000, repeat=5))
+
+        # Assert
+        assert specialized < generic
@@ -9,6 +9,7 @@ import pygame
 import pytest
 
 from ..mock.pygame.display import MockDisplayModule
+from ..mock.pygame.event import MockEventModule
 
 if TYPE_CHECKING:
     from pygame.surface import Surface
@@ -232,3 +233,224 @@ class TestWindow:
         # Assert
         mock_window_init.assert_not_called()
         mock_window_quit.assert_not_called()
+
+    def test____refresh____flip_whole_screen_by_default(self, mock_pygame_display_module: MockDisplayModule) -> None:
+        # Arrange
+        window = Window()
+
+        # Act
+        with window.open():
+            window.clear()
+            window.renderer.draw_rect("red", (10, 10, 20, 20))
+            window.refresh()
+
+        # Assert
+        assert not window.get_damage_tracking()
+        mock_pygame_display_module.flip.assert_called_once_with()
+        mock_pygame_display_module.update.assert_not_called()
+
+    def test____refresh____damage_tracking____update_only_drawn_areas(self, mock_pygame_display_module: MockDisplayModule) -> None:
+        # Arrange
+        window = Window()
+        window.set_damage_tracking(True)
+
+        # Act & Assert
+        with window.open():
+            window.clear()
+            window.refresh()
+            mock_pygame_display_module.flip.assert_called_once_with()  # First frame is always fully sent
+            mock_pygame_display_module.flip.reset_mock()
+
+            window.clear()
+            window.renderer.draw_rect("red", (10, 10, 20, 20))
+            window.renderer.draw_rect("blue", (20, 20, 20, 20))
+            window.renderer.draw_rect("green", (100, 100, 5, 5))
+            window.refresh()
+            mock_pygame_display_module.flip.assert_not_called()
+            mock_pygame_display_module.update.assert_called_once_with([pygame.Rect(10, 10, 30, 30), pygame.Rect(100, 100, 5, 5)])
+            mock_pygame_display_module.update.reset_mock()
+
+            # The areas drawn at the previous frame must be erased
+            window.clear()
+            window.refresh()
+            mock_pygame_display_module.update.assert_called_once_with([pygame.Rect(10, 10, 30, 30), pygame.Rect(100, 100, 5, 5)])
+            mock_pygame_display_module.update.reset_mock()
+
+            # Nothing changed
+            window.clear()
+            window.refresh()
+            mock_pygame_display_module.update.assert_not_called()
+            mock_pygame_display_module.flip.assert_not_called()
+
+    def test____refresh____damage_tracking____flip_on_background_color_change(
+        self,
+        mock_pygame_display_module: MockDisplayModule,
+    ) -> None:
+        # Arrange
+        window = Window()
+        window.set_damage_tracking(True)
+
+        # Act & Assert
+        with window.open():
+            window.clear("black")
+            window.refresh()
+            mock_pygame_display_module.flip.reset_mock()
+
+            window.clear("white")
+            window.renderer.draw_rect("red", (10, 10, 20, 20))
+            window.refresh()
+            mock_pygame_display_module.flip.assert_called_once_with()
+            mock_pygame_display_module.update.assert_not_called()
+
+    def test____refresh____damage_tracking____flip_above_coverage_threshold(
+        self,
+        mock_pygame_display_module: MockDisplayModule,
+    ) -> None:
+        # Arrange
+        window = Window()
+        window.set_damage_tracking(True)
+
+        # Act & Assert
+        with window.open():
+            window.clear()
+            window.refresh()
+            mock_pygame_display_module.flip.reset_mock()
+
+            window.clear()
+            window.renderer.draw_rect("red", window.rect.inflate(-2, -2))
+            window.refresh()
+            mock_pygame_display_module.flip.assert_called_once_with()
+            mock_pygame_display_module.update.assert_not_called()
+
+    @pytest.mark.parametrize("coalescing", [False, True], ids=lambda status: f"coalescing=={status}")
+    def test____process_events____merge_consecutive_motion_events(
+        self,
+        coalescing: bool,
+        mock_pygame_event_module: MockEventModule,
+        mocker: MockerFixture,
+    ) -> None:
+        # Arrange
+        from pydiamond.window.event import JoyAxisMotionEvent, KeyDownEvent, MouseMotionEvent
+
+        def mouse_motion(pos: tuple[int, int], rel: tuple[int, int]) -> pygame.event.Event:
+            return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=rel, buttons=(0, 0, 0), touch=False)
+
+        def joy_axis(axis: int, value: float) -> pygame.event.Event:
+            return pygame.event.Event(pygame.JOYAXISMOTION, instance_id=0, axis=axis, value=value)
+
+        mock_pygame_event_module.get.return_value = [
+            mouse_motion((1, 1), (1, 1)),
+            mouse_motion((3, 2), (2, 1)),
+            mouse_motion((6, 2), (3, 0)),
+            joy_axis(0, 0.25),
+            joy_axis(0, 0.5),
+            joy_axis(1, 0.75),
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0, unicode="a", scancode=4),
+            mouse_motion((7, 3), (1, 1)),
+        ]
+        mock_pygame_event_module.get_blocked.return_value = False
+        mocker.patch("pygame.mixer.music.get_endevent", return_value=pygame.USEREVENT)
+        window = Window()
+        window.set_event_coalescing(coalescing)
+
+        # Act
+        with window.open():
+            window.loop()
+            events = list(window.process_events())
+
+        # Assert
+        if not coalescing:
+            assert len(events) == 8
+            return
+        assert [type(event) for event in events] == [
+            MouseMotionEvent,
+            JoyAxisMotionEvent,
+            JoyAxisMotionEvent,
+            KeyDownEvent,
+            MouseMotionEvent,
+        ]
+        assert isinstance(events[0], MouseMotionEvent)
+        assert (events[0].pos, events[0].rel) == ((6, 2), (6, 2))
+        assert isinstance(events[1], JoyAxisMotionEvent) and isinstance(events[2], JoyAxisMotionEvent)
+        assert (events[1].axis, events[1].value) == (0, 0.5)
+        assert (events[2].axis, events[2].value) == (1, 0.75)
+        assert isinstance(events[4], MouseMotionEvent)
+        assert events[4].rel == (1, 1)
+
+    def test____after____only_due_callbacks_are_called(self, monkeypatch: MonkeyPatch) -> None:
+        # Arrange
+        from pydiamond.window.display import _WindowCallbackScheduler
+
+        now: list[float] = [0]
+        monkeypatch.setattr(_WindowCallbackScheduler, "get_time", staticmethod(lambda: now[0]))
+        calls: list[str] = []
+        window = Window()
+
+        # Act & Assert
+        with window.open():
+            window.after(20, lambda: calls.append("second"))
+            first_callback = window.after(10, lambda: calls.append("first"))
+            window.every(15, lambda: calls.append("loop"))
+            assert calls == ["loop"]
+            calls.clear()
+
+            now[0] = 9
+            window.loop()
+            assert calls == []
+
+            now[0] = 10
+            window.loop()
+            assert calls == ["first"]
+            assert not hasattr(first_callback, "master")
+            calls.clear()
+
+            now[0] = 21
+            window.loop()
+            assert calls == ["loop", "second"]
+
+    def test____every____late_callback_catches_up_once_per_frame(self, monkeypatch: MonkeyPatch) -> None:
+        # Arrange
+        from pydiamond.window.display import _WindowCallbackScheduler
+
+        now: list[float] = [0]
+        monkeypatch.setattr(_WindowCallbackScheduler, "get_time", staticmethod(lambda: now[0]))
+        calls: list[float] = []
+        window = Window()
+
+        # Act & Assert
+        with window.open():
+            window.every(10, lambda: calls.append(now[0]))
+            calls.clear()
+
+            # Three periods were missed: they are caught up in the next frames
+            now[0] = 35
+            window.loop()
+            assert calls == [35]
+            window.loop()
+            window.loop()
+            assert calls == [35, 35, 35]
+            window.loop()
+            assert calls == [35, 35, 35]
+
+            # Then it is called at its usual rate
+            now[0] = 40
+            window.loop()
+            assert calls == [35, 35, 35, 40]
+
+    def test____after____killed_callback_is_never_called(self, monkeypatch: MonkeyPatch, mocker: MockerFixture) -> None:
+        # Arrange
+        from pydiamond.window.display import _WindowCallbackScheduler
+
+        now: list[float] = [0]
+        monkeypatch.setattr(_WindowCallbackScheduler, "get_time", staticmethod(lambda: now[0]))
+        stub = mocker.stub()
+        window = Window()
+
+        # Act
+        with window.open():
+            window.after(10, stub).kill()
+            now[0] = 100
+            window.loop()
+
+        # Assert
+        stub.assert_not_called()